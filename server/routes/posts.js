@@ -115,6 +115,58 @@ router.post('/', authenticateToken, [
   }
 });
 
+// Create posts in bulk (e.g. scheduled drafts from the content-calendar planner)
+router.post('/bulk', authenticateToken, [
+  body('posts').isArray({ min: 1, max: 100 }),
+  body('posts.*.content').trim().isLength({ min: 1, max: 3000 }),
+  body('posts.*.platform').optional().isIn(['linkedin', 'twitter', 'facebook']),
+  body('posts.*.scheduled_at').optional().isISO8601(),
+  body('posts.*.status').optional().isIn(['draft', 'scheduled']),
+  body('posts.*.media_urls').optional().isArray()
+], async (req, res) => {
+  try {
+    const errors = validationResult(req);
+    if (!errors.isEmpty()) {
+      return res.status(400).json({
+        error: 'Validation failed',
+        details: errors.array()
+      });
+    }
+
+    const { v4: uuidv4 } = require('uuid');
+    // An explicit status wins: the planner sends 'draft' for fills that failed or kept placeholders
+    const rows = req.body.posts.map(({ content, platform, scheduled_at, status, media_urls, metadata }) => ({
+      id: uuidv4(),
+      user_id: req.user.id,
+      content,
+      platform: platform || 'linkedin',
+      scheduled_at: scheduled_at || null,
+      media_urls: media_urls || [],
+      metadata: metadata || {},
+      status: status || (scheduled_at ? 'scheduled' : 'draft')
+    }));
+
+    const { data: posts, error } = await supabase
+      .from('posts')
+      .insert(rows)
+      .select();
+
+    if (error) {
+      throw error;
+    }
+
+    console.log(`User created ${rows.length} posts in bulk: ${req.user.email}`);
+
+    res.status(201).json({
+      message: 'Posts created successfully',
+      posts
+    });
+  } catch (error) {
+    console.error('Bulk create posts error:', error);
+    res.status(500).json({ error: 'Failed to create posts' });
+  }
+});
+
 // Update post
 router.put('/:id', authenticateToken, [
   body('content').optional().trim().isLength({ min: 1, max: 3000 }),
@@ -0,0 +1,69 @@
+const express = require('express');
+const fs = require('fs');
+const path = require('path');
+
+const router = express.Router();
+
+// Directory written by `python -m linkedin_cli export --shards DIR` (src/plugins)
+const EXPORT_DIR = path.resolve(process.env.TEMPLATE_EXPORT_DIR || path.join(__dirname, '..', 'template-export'));
+const SHARD_FILE = /^[a-z0-9-]+\.([0-9a-f]{16})\.json$/;
+
+const etagMatches = (req, etag) => {
+  const header = req.headers['if-none-match'];
+  if (!header) return false;
+  return header === '*' || header.split(',').some(value => value.trim().replace(/^W\//, '') === etag);
+};
+
+// Manifest is re-read only when the export rewrites it
+let manifestCache = { mtimeMs: 0, manifest: null };
+
+const loadManifest = () => {
+  const manifestPath = path.join(EXPORT_DIR, 'manifest.json');
+  const { mtimeMs } = fs.statSync(manifestPath);
+  if (mtimeMs !== manifestCache.mtimeMs) {
+    manifestCache = { mtimeMs, manifest: JSON.parse(fs.readFileSync(manifestPath, 'utf8')) };
+  }
+  return manifestCache.manifest;
+};
+
+// Get the shard manifest (category -> content hash); revalidate with If-None-Match
+router.get('/manifest', (req, res) => {
+  try {
+    const manifest = loadManifest();
+    const etag = `"${manifest.etag}"`;
+
+    res.set({ 'ETag': etag, 'Cache-Control': 'no-cache' });
+    if (etagMatches(req, etag)) {
+      return res.status(304).end();
+    }
+    res.json(manifest);
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return res.status(404).json({ error: 'Template export not found' });
+    }
+    console.error('Manifest error:', error);
+    res.status(500).json({ error: 'Failed to load template manifest' });
+  }
+});
+
+// Get one category shard; names are content-hashed, so shards never change
+router.get('/shards/:file', (req, res) => {
+  const match = SHARD_FILE.exec(req.params.file);
+  if (!match) {
+    return res.status(400).json({ error: 'Invalid shard name' });
+  }
+
+  const etag = `"${match[1]}"`;
+  res.set({ 'ETag': etag, 'Cache-Control': 'public, max-age=31536000, immutable' });
+  if (etagMatches(req, etag)) {
+    return res.status(304).end();
+  }
+
+  res.sendFile(req.params.file, { root: EXPORT_DIR, etag: false, lastModified: false }, (error) => {
+    if (error && !res.headersSent) {
+      res.status(error.status === 404 ? 404 : 500).json({ error: 'Template shard not found' });
+    }
+  });
+});
+
+module.exports = router;
@@ -13,6 +13,7 @@ const userRoutes = require('./routes/users');
 const postsRoutes = require('./routes/posts');
 const linkedinRoutes = require('./routes/linkedin');
 const analyticsRoutes = require('./routes/analytics');
+const templatesRoutes = require('./routes/templates');
 
 const app = express();
 const PORT = process.env.PORT || 3001;
@@ -82,6 +83,7 @@ app.use('/api/users', userRoutes);
 app.use('/api/posts', postsRoutes);
 app.use('/api/linkedin', linkedinRoutes);
 app.use('/api/analytics', analyticsRoutes);
+app.use('/api/templates', templatesRoutes);
 
 // Error handling middleware
 app.use((err, req, res, next) => {
@@ -7,306 +7,60 @@ import streamlit as st
 import json
 import sys
 import os
+import uuid
 from typing import Dict, List, Optional
 
 # Import the template store
 sys.path.append(os.path.dirname(__file__))
+from template_store import TemplateStore, load_plugin_module
+from template_session import SESSIONS
 
-# Template data and logic (Python version of templateStore.js)
-class TemplateStore:
-    """Python version of the Template Store"""
-    
-    TEMPLATE_CATEGORIES = {
-        "Personal Story": {
-            "name": "Personal Story",
-            "description": "Share personal experiences and transformations",
-            "tags": ["inspirational", "authentic", "engagement"],
-            "icon": "👤",
-            "color": "#3B82F6"
-        },
-        "Lessons Learned": {
-            "name": "Lessons Learned", 
-            "description": "Share professional insights and key learnings",
-            "tags": ["educational", "wisdom", "professional"],
-            "icon": "💡",
-            "color": "#10B981"
-        },
-        "Industry Insights": {
-            "name": "Industry Insights",
-            "description": "Share industry trends and expert analysis", 
-            "tags": ["technical", "analytical", "thought-leadership"],
-            "icon": "📊",
-            "color": "#8B5CF6"
-        },
-        "Career Advice": {
-            "name": "Career Advice",
-            "description": "Provide guidance for professional development",
-            "tags": ["educational", "mentoring", "growth"],
-            "icon": "🚀",
-            "color": "#F59E0B"
-        },
-        "Leadership": {
-            "name": "Leadership",
-            "description": "Leadership principles and management insights",
-            "tags": ["professional", "management", "inspiration"],
-            "icon": "👑",
-            "color": "#EF4444"
-        },
-        "Success Stories": {
-            "name": "Success Stories",
-            "description": "Share achievements and case studies",
-            "tags": ["inspirational", "proof", "achievement"],
-            "icon": "🏆",
-            "color": "#06B6D4"
-        },
-        "Motivation": {
-            "name": "Motivation",
-            "description": "Inspire and motivate your audience",
-            "tags": ["inspirational", "engagement", "energy"],
-            "icon": "⚡",
-            "color": "#EC4899"
-        },
-        "Business Strategy": {
-            "name": "Business Strategy",
-            "description": "Strategic insights and business analysis",
-            "tags": ["technical", "analytical", "strategic"],
-            "icon": "🎯",
-            "color": "#6366F1"
-        },
-        "Technology Trends": {
-            "name": "Technology Trends",
-            "description": "Tech insights and digital transformation",
-            "tags": ["technical", "innovation", "future"],
-            "icon": "🔬",
-            "color": "#059669"
-        },
-        "Team Building": {
-            "name": "Team Building",
-            "description": "Team dynamics and collaboration insights",
-            "tags": ["professional", "collaboration", "culture"],
-            "icon": "🤝",
-            "color": "#DC2626"
-        }
-    }
-    
-    TEMPLATE_STRUCTURES = {
-        "Personal Story": [
-            {
-                "id": "ps_001",
-                "title": "Challenge to Success Journey",
-                "structure": "Three years ago, I [insert challenge]. Today, I [insert current state]. Here's what I learned: [insert lesson]. The key insight: [insert insight]. What challenges have shaped your career?",
-                "placeholders": ["challenge", "current state", "lesson", "insight"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#PersonalGrowth #CareerJourney #Lessons",
-                "preview": "Share your transformation story from struggle to success..."
-            },
-            {
-                "id": "ps_002", 
-                "title": "Belief Transformation",
-                "structure": "I used to believe [insert old belief]. Then [insert pivotal moment] happened. Now I understand that [insert new perspective]. This shift changed everything: [insert impact]. Sometimes our biggest assumptions need questioning.",
-                "placeholders": ["old belief", "pivotal moment", "new perspective", "impact"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#Mindset #Growth #Transformation",
-                "preview": "Tell the story of how your perspective fundamentally changed..."
-            },
-            {
-                "id": "ps_003",
-                "title": "Moment of Realization",
-                "structure": "The moment I realized [insert realization] was when [insert situation]. It felt [insert emotion], but it taught me [insert lesson]. Now I approach [insert area] completely differently: [insert new approach].",
-                "placeholders": ["realization", "situation", "emotion", "lesson", "area", "new approach"],
-                "engagement": "Medium",
-                "length": "Long",
-                "hashtags": "#PersonalDevelopment #Lessons #Growth",
-                "preview": "Share a pivotal moment that changed your approach..."
-            },
-            {
-                "id": "ps_004",
-                "title": "Failure to Learning",
-                "structure": "My biggest failure was [insert failure]. I felt [insert emotion] and wanted to [insert initial reaction]. Instead, I [insert what you did]. The result? [insert outcome]. Failure isn't the opposite of success—it's part of it.",
-                "placeholders": ["failure", "emotion", "initial reaction", "what you did", "outcome"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#Resilience #FailureToSuccess #Growth",
-                "preview": "Turn your biggest setback into a learning story..."
-            },
-            {
-                "id": "ps_005",
-                "title": "Overcoming Limitations",
-                "structure": "Growing up, I was told [insert limiting belief]. For years, I [insert how it affected you]. Then I met [insert person/situation] who showed me [insert new perspective]. Today, I [insert current state]. Your background doesn't define your future.",
-                "placeholders": ["limiting belief", "how it affected you", "person/situation", "new perspective", "current state"],
-                "engagement": "High",
-                "length": "Long",
-                "hashtags": "#Inspiration #OvercomingLimits #Success",
-                "preview": "Share how you overcame limiting beliefs about yourself..."
-            },
-            # Add more Personal Story templates...
-            {
-                "id": "ps_006",
-                "title": "Risk Taking Story",
-                "structure": "Last [insert timeframe], I took a risk: [insert risk]. People said [insert criticism]. My family worried about [insert concern]. But I knew [insert conviction]. The outcome? [insert result]. Sometimes you have to bet on yourself.",
-                "placeholders": ["timeframe", "risk", "criticism", "concern", "conviction", "result"],
-                "engagement": "Medium",
-                "length": "Long",
-                "hashtags": "#TakingRisks #Entrepreneurship #Courage",
-                "preview": "Tell about a time you took a leap of faith..."
-            },
-            {
-                "id": "ps_007",
-                "title": "Difficult Conversation Impact",
-                "structure": "The hardest conversation I ever had was [insert situation]. I had to [insert what you had to do]. It was difficult because [insert why]. But it led to [insert positive outcome]. Difficult conversations create breakthrough moments.",
-                "placeholders": ["situation", "what you had to do", "why", "positive outcome"],
-                "engagement": "Medium",
-                "length": "Medium",
-                "hashtags": "#Courage #Communication #Leadership",
-                "preview": "Share how a tough conversation led to positive change..."
-            },
-            {
-                "id": "ps_008",
-                "title": "Memorable Learning Moment",
-                "structure": "I'll never forget [insert memorable moment]. It was [insert context]. In that moment, I learned [insert lesson]. This experience shaped how I [insert impact on behavior]. Some lessons can only be learned through experience.",
-                "placeholders": ["memorable moment", "context", "lesson", "impact on behavior"],
-                "engagement": "Medium",
-                "length": "Medium",
-                "hashtags": "#LifeLessons #Wisdom #Experience",
-                "preview": "Share an unforgettable moment that taught you something..."
-            },
-            {
-                "id": "ps_009",
-                "title": "Unique Journey Celebration",
-                "structure": "When I started [insert beginning], I had [insert initial state]. Everyone around me [insert others' situation]. But I believed [insert belief]. After [insert timeframe], I [insert achievement]. Your journey is unique—embrace it.",
-                "placeholders": ["beginning", "initial state", "others' situation", "belief", "timeframe", "achievement"],
-                "engagement": "Medium",
-                "length": "Long",
-                "hashtags": "#Authenticity #Journey #Success",
-                "preview": "Celebrate what makes your path different from others..."
-            },
-            {
-                "id": "ps_010",
-                "title": "Mentorship and Wisdom",
-                "structure": "The person who changed my perspective was [insert person]. They told me [insert advice/insight]. At first, I [insert initial reaction]. But over time, I realized [insert realization]. This wisdom now guides [insert how it guides you].",
-                "placeholders": ["person", "advice/insight", "initial reaction", "realization", "how it guides you"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#Mentorship #WisdomShared #Growth",
-                "preview": "Honor someone who shaped your thinking..."
-            }
-        ],
-        
-        "Lessons Learned": [
-            {
-                "id": "ll_001",
-                "title": "Top Professional Lessons",
-                "structure": "After [insert timeframe] in [insert field/role], here are the 3 most important lessons I've learned: 1) [insert lesson 1] 2) [insert lesson 2] 3) [insert lesson 3]. Which of these resonates most with your experience?",
-                "placeholders": ["timeframe", "field/role", "lesson 1", "lesson 2", "lesson 3"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#Leadership #Experience #Lessons",
-                "preview": "Share your top 3 professional lessons learned..."
-            },
-            {
-                "id": "ll_002",
-                "title": "Most Valuable Mistake",
-                "structure": "The mistake that taught me the most was [insert mistake]. I thought [insert wrong assumption]. The reality was [insert what actually happened]. Now I always [insert new approach]. What's the most valuable mistake you've made?",
-                "placeholders": ["mistake", "wrong assumption", "what actually happened", "new approach"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#LearningFromFailure #Growth #Mistakes",
-                "preview": "Turn your biggest mistake into a teaching moment..."
-            },
-            # Add more Lessons Learned templates (abbreviated for space)
-        ],
-        
-        "Career Advice": [
-            {
-                "id": "ca_001",
-                "title": "Hidden Career Advice",
-                "structure": "The career advice no one gives you: [insert advice]. Most people focus on [insert common focus]. But the real career accelerator is [insert real accelerator]. I learned this when [insert learning moment]. Apply this to [insert application].",
-                "placeholders": ["advice", "common focus", "real accelerator", "learning moment", "application"],
-                "engagement": "High",
-                "length": "Medium",
-                "hashtags": "#CareerGrowth #ProfessionalDevelopment #Advice",
-                "preview": "Share career advice that's not commonly given..."
-            },
-            # More career advice templates...
-        ]
-        
-        # Continue for other categories...
-    }
-    
-    @classmethod
-    def get_categories(cls):
-        """Get all available categories"""
-        return [{"id": key, **value} for key, value in cls.TEMPLATE_CATEGORIES.items()]
-    
-    @classmethod
-    def get_templates_by_category(cls, category_id):
-        """Get templates by category"""
-        templates = cls.TEMPLATE_STRUCTURES.get(category_id, [])
-        return [
-            {**template, "category": category_id, "categoryInfo": cls.TEMPLATE_CATEGORIES.get(category_id, {})}
-            for template in templates
-        ]
-    
-    @classmethod
-    def get_template(cls, category_id, template_index):
-        """Get specific template"""
-        templates = cls.TEMPLATE_STRUCTURES.get(category_id, [])
-        if 0 <= template_index < len(templates):
-            return {
-                **templates[template_index],
-                "category": category_id,
-                "categoryInfo": cls.TEMPLATE_CATEGORIES.get(category_id, {}),
-                "index": template_index
-            }
-        return None
-    
-    @classmethod
-    def search_templates(cls, keyword, filter_tags=None):
-        """Search templates by keyword"""
-        results = []
-        search_term = keyword.lower()
-        
-        for category_id, templates in cls.TEMPLATE_STRUCTURES.items():
-            category = cls.TEMPLATE_CATEGORIES[category_id]
-            
-            # Filter by tags if provided
-            if filter_tags:
-                has_matching_tag = any(tag.lower() in [t.lower() for t in category["tags"]] for tag in filter_tags)
-                if not has_matching_tag:
-                    continue
-            
-            for i, template in enumerate(templates):
-                searchable_text = f"{template['title']} {template['preview']} {template['structure']}".lower()
-                if search_term in searchable_text:
-                    results.append({
-                        **template,
-                        "category": category_id,
-                        "categoryInfo": category,
-                        "index": i
-                    })
-        
-        return results
-    
-    @classmethod
-    def get_all_tags(cls):
-        """Get all available tags"""
-        all_tags = set()
-        for category in cls.TEMPLATE_CATEGORIES.values():
-            all_tags.update(category["tags"])
-        return sorted(list(all_tags))
+# Search results are ranked and fetched one page at a time
+SEARCH_PAGE_SIZE = 10
+AUTOCOMPLETE_SIZE = 4
+RECOMMENDATION_COUNT = 10
+VALUE_SUGGESTION_COUNT = 3
+SORT_OPTIONS = ["relevance", "engagement", "length"]
+
+def apply_suggestion(completion):
+    """Apply a clicked autocomplete suggestion and count it towards its popularity"""
+    if completion.kind == "category":
+        category = TemplateStore.TEMPLATE_CATEGORIES[completion.text]
+        st.session_state.search_category = f"{category['icon']} {category['name']}"
+        st.session_state.search_term = ""
+    elif completion.kind == "tag":
+        st.session_state.search_tags = sorted(set(st.session_state.get("search_tags", [])) | {completion.text})
+        st.session_state.search_term = ""
+    else:
+        # Hashtags are searched as plain words, as in the template text
+        st.session_state.search_term = completion.text.lstrip("#")
+    TemplateStore.get_autocomplete_index().record_selection(completion.text, completion.kind)
+
+def set_placeholder_values(values):
+    """Button callback: prefill placeholder inputs (runs before the inputs are rendered)"""
+    for placeholder, value in values.items():
+        st.session_state[f"placeholder_{placeholder}"] = value
 
-def render_template_library():
-    """Main Streamlit component for template library"""
+def get_library_session():
+    """This browser session's LibrarySession (session_state only holds its id)"""
+    if 'library_session_id' not in st.session_state:
+        st.session_state.library_session_id = SESSIONS.new_session_id()
+    return SESSIONS.get(st.session_state.library_session_id)
+
+def render_template_library(ai_function=None, user_id=None):
+    """Main Streamlit component for template library
+    
+    Pass an ai_function (prompt -> str, or an iterable of streamed chunks) to enable AI auto-fill,
+    and the signed-in user's id to personalize recommendations (anonymous sessions get their own).
+    """
     
     # Initialize session state
-    if 'selected_template' not in st.session_state:
-        st.session_state.selected_template = None
-    if 'custom_placeholders' not in st.session_state:
-        st.session_state.custom_placeholders = {}
-    if 'redirect_to_generator' not in st.session_state:
-        st.session_state.redirect_to_generator = False
+    if user_id is not None:
+        st.session_state.user_id = user_id
+    elif 'user_id' not in st.session_state:
+        st.session_state.user_id = f"session-{uuid.uuid4().hex}"
+    # Selection state lives server-side as a template id and small maps (see template_session)
+    session = get_library_session()
     
     # Header
     st.title("📚 LinkedIn Template Library")
@@ -328,11 +82,23 @@ def render_template_library():
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        search_term = st.text_input("🔍 Search templates", placeholder="Enter keywords...")
+        search_term = st.text_input("🔍 Search templates", placeholder="Enter keywords...", key="search_term")
+        
+        # Prefix-index suggestions for the typed term (never scans the corpus)
+        suggestions = [
+            completion for completion in TemplateStore.autocomplete(search_term, k=AUTOCOMPLETE_SIZE)
+            if completion.text.lower() != search_term.strip().lower()
+        ]
+        if suggestions:
+            suggestion_cols = st.columns(len(suggestions))
+            for suggestion_col, completion in zip(suggestion_cols, suggestions):
+                with suggestion_col:
+                    st.button(completion.text, key=f"suggest_{completion.kind}_{completion.text}",
+                              on_click=apply_suggestion, args=(completion,))
     
     with col2:
         category_options = ["All Categories"] + [f"{cat['icon']} {cat['name']}" for cat in categories]
-        selected_category_display = st.selectbox("📂 Category", category_options)
+        selected_category_display = st.selectbox("📂 Category", category_options, key="search_category")
         
         # Extract actual category ID
         if selected_category_display == "All Categories":
@@ -342,25 +108,50 @@ def render_template_library():
     
     with col3:
         all_tags = TemplateStore.get_all_tags()
-        selected_tags = st.multiselect("🏷️ Tags", all_tags)
+        selected_tags = st.multiselect("🏷️ Tags", all_tags, key="search_tags")
     
     # Get filtered templates
+    search_page = None
     if search_term:
-        filtered_templates = TemplateStore.search_templates(search_term, selected_tags if selected_tags else None)
+        sort_col, _ = st.columns([1, 3])
+        with sort_col:
+            sort = st.selectbox("↕️ Sort by", SORT_OPTIONS, format_func=str.title, key="search_sort")
+        
+        # Cursor stack for the current query: one cursor per page visited, reset when the query changes
+        query = (search_term, tuple(selected_tags), sort)
+        if st.session_state.get("search_query") != query:
+            st.session_state.search_query = query
+            st.session_state.search_cursors = [None]
+        cursors = st.session_state.search_cursors
+        
+        search_page = TemplateStore.search_templates_page(
+            search_term, selected_tags if selected_tags else None, limit=SEARCH_PAGE_SIZE, cursor=cursors[-1], sort=sort
+        )
+        filtered_templates = search_page.results
     elif selected_category:
-        category_id = next((cat["id"] for cat in categories if cat["name"] == selected_category), None)
-        if category_id:
-            filtered_templates = TemplateStore.get_templates_by_category(category_id)
+        # Tags filter by category here as in search (a clicked tag suggestion clears the search term)
+        category = next((cat for cat in categories if cat["name"] == selected_category), None)
+        if category and TemplateStore.category_has_tags(category, selected_tags):
+            filtered_templates = TemplateStore.get_templates_by_category(category["id"])
         else:
             filtered_templates = []
     else:
-        # Show all templates from all categories
-        filtered_templates = []
-        for cat in categories[:5]:  # Limit to first 5 categories for performance
-            filtered_templates.extend(TemplateStore.get_templates_by_category(cat["id"])[:2])  # 2 per category
+        # Personalized picks from the user's past selections (popular templates for new users)
+        tagged_categories = [
+            cat["id"] for cat in categories if TemplateStore.category_has_tags(cat, selected_tags)
+        ] if selected_tags else None
+        filtered_templates = TemplateStore.recommend(
+            st.session_state.user_id, k=RECOMMENDATION_COUNT, categories=tagged_categories
+        )
     
     # Results header
-    st.markdown(f"**Found {len(filtered_templates)} templates**")
+    if search_page is not None:
+        page_number = len(st.session_state.search_cursors)
+        st.markdown(f"**Page {page_number}: {len(filtered_templates)} templates**")
+    elif not selected_category:
+        st.markdown("**⭐ Recommended for you**")
+    else:
+        st.markdown(f"**Found {len(filtered_templates)} templates**")
     
     if filtered_templates:
         # Display templates in a grid
@@ -381,19 +172,31 @@ def render_template_library():
     else:
         st.info("No templates found matching your criteria. Try adjusting your search or filters.")
     
+    if search_page is not None:
+        prev_col, _, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            if st.button("← Previous", disabled=len(st.session_state.search_cursors) == 1):
+                st.session_state.search_cursors.pop()
+                st.experimental_rerun()
+        with next_col:
+            if st.button("Next →", disabled=not search_page.has_more):
+                st.session_state.search_cursors.append(search_page.next_cursor)
+                st.experimental_rerun()
+    
     # Handle template selection modal
-    if st.session_state.selected_template:
-        render_customization_modal()
+    if session.selected_id:
+        render_customization_modal(session, ai_function)
     
     # Handle redirect to generator
-    if st.session_state.redirect_to_generator:
-        if st.session_state.selected_template.get('action') == 'load_into_generator':
+    if session.redirect:
+        result = session.result()
+        if session.action == 'load_into_generator':
             st.success("🔄 Template loaded into main generator! Check the generator interface above.")
         else:
             st.success("🎯 Template selected! Redirecting to AI Content Generator...")
-        st.session_state.redirect_to_generator = False
+        session.redirect = False
         # In a real app, you would change tabs/pages here
-        return st.session_state.selected_template
+        return result
 
 def render_template_card(template, key):
     """Render individual template card"""
@@ -414,7 +217,7 @@ def render_template_card(template, key):
                 <span style="color: #6b7280; font-size: 0.875rem; font-weight: 500;">
                     {template['categoryInfo']['name']}
                 </span>
-                {f'<span style="margin-left: auto; background: #10b981; color: white; padding: 0.25rem 0.5rem; border-radius: 9999px; font-size: 0.75rem;">High Engagement</span>' if template['engagement'] == 'High' else ''}
+                {f'<span style="margin-left: auto; background: #10b981; color: white; padding: 0.25rem 0.5rem; border-radius: 9999px; font-size: 0.75rem;">High Engagement</span>' if TemplateStore.engagement_level(template) == 'High' else ''}
             </div>
             
             <h4 style="margin: 0 0 0.5rem 0; font-weight: 600; color: #111827;">
@@ -452,9 +255,8 @@ def render_template_card(template, key):
         # Action buttons
         # Primary action - Load into Generator
         if st.button("🔄 Load into Generator", key=f"load_{key}", use_container_width=True, type="primary"):
-            st.session_state.selected_template = template
-            st.session_state.selected_template['action'] = 'load_into_generator'
-            st.session_state.redirect_to_generator = True
+            TemplateStore.record_selection(st.session_state.user_id, template['id'])
+            get_library_session().select(template['id'], 'load_into_generator')
             st.experimental_rerun()
         
         # Secondary actions
@@ -462,18 +264,24 @@ def render_template_card(template, key):
         
         with col1:
             if st.button("✏️ Customize", key=f"customize_{key}", use_container_width=True):
-                st.session_state.selected_template = template
+                # Opening the editor is a weaker signal than handing the template off
+                TemplateStore.record_selection(st.session_state.user_id, template['id'], weight=0.5)
+                get_library_session().select(template['id'])
                 st.experimental_rerun()
         
         with col2:
             if st.button("🚀 Use Template", key=f"use_{key}", use_container_width=True):
-                st.session_state.selected_template = template
-                st.session_state.redirect_to_generator = True
+                TemplateStore.record_selection(st.session_state.user_id, template['id'])
+                get_library_session().select(template['id'], 'use')
                 st.experimental_rerun()
 
-def render_customization_modal():
+def render_customization_modal(session, ai_function=None):
     """Render template customization modal"""
-    template = st.session_state.selected_template
+    template = session.selected_template()
+    if template is None:
+        # Removed from the store since it was selected
+        session.close()
+        return
     
     st.markdown("---")
     st.subheader("✏️ Customize Template")
@@ -487,16 +295,46 @@ def render_customization_modal():
     
     with col2:
         if st.button("❌ Close", type="secondary"):
-            st.session_state.selected_template = None
+            session.close()
             st.experimental_rerun()
     
     # Template preview
     st.markdown("**Template Structure:**")
     st.code(template['structure'], language="text")
     
+    # AI auto-fill: the preview updates as each placeholder (or streamed chunk) arrives
+    if ai_function is not None:
+        topic = st.text_input("🎯 Topic for AI auto-fill:", key="ai_fill_topic", placeholder="e.g. leading remote teams")
+        if st.button("✨ Auto-fill with AI", use_container_width=True):
+            plugin_module = load_plugin_module()
+            context = {"topic": topic} if topic else {}
+            preview = st.empty()
+            values = {}
+            for event in plugin_module.iter_fill_template(
+                template['structure'],
+                template['placeholders'],
+                ai_function,
+                lambda placeholder: plugin_module.build_fill_prompt(placeholder, context, template['structure'])
+            ):
+                values = event['values']
+                preview.markdown(f"""
+                <div style="background: #f0f9ff; padding: 1rem; border-radius: 0.5rem; border-left: 4px solid #3b82f6;">
+                    {event['text']}
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Prefill the inputs below (allowed because they have not been rendered yet in this run)
+            for placeholder, value in values.items():
+                st.session_state[f"placeholder_{placeholder}"] = value
+    
     # Placeholder inputs
     st.markdown("**Fill in the placeholders:**")
     
+    user_id = st.session_state.user_id
+    remembered = TemplateStore.prefill(user_id, template)
+    if remembered:
+        st.button("⚡ Prefill with my previous values", on_click=set_placeholder_values, args=(remembered,))
+    
     custom_values = {}
     for placeholder in template['placeholders']:
         custom_values[placeholder] = st.text_input(
@@ -504,6 +342,18 @@ def render_customization_modal():
             key=f"placeholder_{placeholder}",
             placeholder=f"Enter {placeholder}..."
         )
+        
+        # Past values matching what is typed so far; a click fills the input
+        suggestions = [
+            value for value in TemplateStore.suggest_values(
+                user_id, placeholder, custom_values[placeholder], k=VALUE_SUGGESTION_COUNT + 1
+            )
+            if value != custom_values[placeholder]
+        ][:VALUE_SUGGESTION_COUNT]
+        if suggestions:
+            for column, value in zip(st.columns(VALUE_SUGGESTION_COUNT), suggestions):
+                column.button(value, key=f"placeholder_suggestion_{placeholder}_{value}",
+                              on_click=set_placeholder_values, args=({placeholder: value},))
     
     # Preview with filled values
     if any(custom_values.values()):
@@ -522,10 +372,8 @@ def render_customization_modal():
     # Action buttons
     # Primary action - Load into Main Generator
     if st.button("🔄 Load into Main Generator", use_container_width=True, type="primary"):
-        st.session_state.selected_template['action'] = 'load_into_generator'
-        st.session_state.selected_template['customPlaceholders'] = custom_values
-        st.session_state.custom_placeholders = custom_values
-        st.session_state.redirect_to_generator = True
+        TemplateStore.record_fill(user_id, custom_values)
+        session.hand_off(custom_values, 'load_into_generator')
         st.experimental_rerun()
     
     # Secondary actions
@@ -533,14 +381,13 @@ def render_customization_modal():
     
     with col1:
         if st.button("📄 Use Empty Template", use_container_width=True):
-            st.session_state.custom_placeholders = {}
-            st.session_state.redirect_to_generator = True
+            session.hand_off()
             st.experimental_rerun()
     
     with col2:
         if st.button("🎯 Use with Custom Values", use_container_width=True):
-            st.session_state.custom_placeholders = custom_values
-            st.session_state.redirect_to_generator = True
+            TemplateStore.record_fill(user_id, custom_values)
+            session.hand_off(custom_values)
             st.experimental_rerun()
 
 # Main function for integration
@@ -131,6 +131,58 @@ Return the filled template as a complete LinkedIn post.
   }
 };
 
+// Incremental template library sync against the sharded export (GET /api/templates/...)
+export const templateShardSync = {
+  STORAGE_KEY: 'templateShards',
+
+  // Load the local copy: { etag, manifest, shards: { category: { hash, data } } }
+  load: (storage = window.localStorage) => {
+    try {
+      return JSON.parse(storage.getItem(templateShardSync.STORAGE_KEY)) || { etag: null, manifest: null, shards: {} };
+    } catch (error) {
+      return { etag: null, manifest: null, shards: {} };
+    }
+  },
+
+  // Fetch the manifest with If-None-Match and download only the shards whose hash changed
+  sync: async (baseUrl = '/api/templates', storage = window.localStorage) => {
+    const local = templateShardSync.load(storage);
+    const headers = local.etag ? { 'If-None-Match': local.etag } : {};
+
+    const response = await fetch(`${baseUrl}/manifest`, { headers });
+    if (response.status === 304) {
+      return { ...local, changed: [], removed: [] };
+    }
+    if (!response.ok) {
+      throw new Error(`Template manifest request failed: ${response.status}`);
+    }
+
+    const manifest = await response.json();
+    const changed = Object.keys(manifest.shards).filter(
+      category => local.shards[category]?.hash !== manifest.shards[category].hash
+    );
+    const removed = Object.keys(local.shards).filter(category => !manifest.shards[category]);
+
+    const shards = { ...local.shards };
+    removed.forEach(category => delete shards[category]);
+    await Promise.all(changed.map(async (category) => {
+      const shard = manifest.shards[category];
+      const shardResponse = await fetch(`${baseUrl}/shards/${shard.file}`);
+      if (!shardResponse.ok) {
+        throw new Error(`Template shard request failed for ${category}: ${shardResponse.status}`);
+      }
+      shards[category] = { hash: shard.hash, data: await shardResponse.json() };
+    }));
+
+    const synced = { etag: response.headers.get('ETag'), manifest, shards };
+    storage.setItem(templateShardSync.STORAGE_KEY, JSON.stringify(synced));
+    return { ...synced, changed, removed };
+  },
+
+  // Templates of one synced category, in corpus order
+  getTemplates: (synced, category) => synced.shards[category]?.data.templates || []
+};
+
 // React hook for template integration
 export const useTemplateLoader = (setGeneratorState) => {
   const loadTemplate = (templateData) => {
@@ -258,6 +310,7 @@ export const HTMLIntegration = {
 export default {
   handleTemplateLoad,
   templateUtils,
+  templateShardSync,
   useTemplateLoader,
   MainGeneratorIntegration
 };
\ No newline at end of file
@@ -0,0 +1,374 @@
+"""
+Template Library Load Test
+Simulates N concurrent sessions of the template library page (search with autocomplete,
+paging, category and tag filters, opening the customization modal and filling
+placeholders) and reports throughput, latency percentiles and memory per session.
+
+Two drivers:
+- "headless" replays the data work of each page rerun against TemplateStore
+  (what render_template_library computes per interaction, card markup included);
+  it needs nothing but this directory.
+- "apptest" runs the real page through streamlit.testing.v1.AppTest, one AppTest
+  per session (requires Streamlit).
+
+Sessions run on threads, as Streamlit runs script reruns, so the GIL contention
+of one Streamlit process is part of the measurement.
+
+    python template_loadtest.py --sessions 50 --iterations 20
+    python template_loadtest.py --ramp 1,10,25,50,100 --p95-budget-ms 100
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from template_store import TemplateStore
+from template_session import SESSIONS
+
+SORT_OPTIONS = ["relevance", "engagement", "length"]  # as on the page
+SEARCH_TERMS = ["leadership", "career", "ai", "growth", "team", "story", "success", "data", "lesson", "insight"]
+PAGE_SIZE = 10
+PAGE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "TemplateLibraryStreamlit.py")
+
+
+class HeadlessSession:
+    """One browser session of the library page, replaying each rerun's data work"""
+
+    def __init__(self, store=TemplateStore, user_id=None, sessions=SESSIONS):
+        self.store = store
+        self.sessions = sessions
+        self.user_id = user_id or f"loadtest-{id(self)}"
+        # Mirrors st.session_state: widget values and ids only, selection state lives in `sessions`
+        self.state = {
+            "library_session_id": sessions.new_session_id(),
+            "search_term": "",
+            "search_category": None,
+            "search_tags": [],
+            "search_sort": "relevance",
+            "search_cursors": [None],
+            "placeholders": {}
+        }
+        self.result_ids = []
+        self.next_cursor = None
+
+    @property
+    def session(self):
+        return self.sessions.get(self.state["library_session_id"])
+
+    def rerun(self):
+        """Everything render_template_library computes for one script run"""
+        state = self.state
+        session = self.session
+        categories = self.store.get_categories()
+        sum(len(self.store.get_templates_by_category(cat["id"])) for cat in categories)
+        self.store.get_all_tags()
+
+        term = state["search_term"]
+        self.store.autocomplete(term, k=4)
+        if term:
+            page = self.store.search_templates_page(
+                term, state["search_tags"] or None, limit=PAGE_SIZE,
+                cursor=state["search_cursors"][-1], sort=state["search_sort"]
+            )
+            results = page.results
+            self.next_cursor = page.next_cursor
+        elif state["search_category"]:
+            category = self.store.TEMPLATE_CATEGORIES[state["search_category"]]
+            if self.store.category_has_tags(category, state["search_tags"]):
+                results = self.store.get_templates_by_category(state["search_category"])
+            else:
+                results = []
+        else:
+            tagged = [
+                cat["id"] for cat in categories if self.store.category_has_tags(cat, state["search_tags"])
+            ] if state["search_tags"] else None
+            results = self.store.recommend(self.user_id, k=10, categories=tagged)
+
+        for template in results:
+            render_card_markup(template)
+        self.result_ids = [template["id"] for template in results]
+
+        template = session.selected_template(self.store)
+        if template:
+            self.store.prefill(self.user_id, template)
+            for placeholder in template["placeholders"]:
+                self.store.suggest_values(self.user_id, placeholder, state["placeholders"].get(placeholder, ""), k=4)
+            preview = template["structure"]
+            for placeholder, value in state["placeholders"].items():
+                if value:
+                    preview = preview.replace(f"[insert {placeholder}]", f"**{value}**")
+
+    # Interactions (each one triggers a rerun, as a widget change does in Streamlit)
+
+    def search(self, term, sort="relevance"):
+        # Typing reruns the page once per committed value; suggestions are shown for each prefix
+        for end in range(2, len(term), 3):
+            self.store.autocomplete(term[:end], k=4)
+        self.state["search_term"] = term
+        self.state["search_cursors"] = [None]
+        self.rerun()
+        if sort != self.state["search_sort"]:
+            # The sort selectbox only appears once there is a search term
+            self.state["search_sort"] = sort
+            self.state["search_cursors"] = [None]
+            self.rerun()
+
+    def next_page(self):
+        if self.state["search_term"] and self.next_cursor:
+            self.state["search_cursors"].append(self.next_cursor)
+        self.rerun()
+
+    def filter(self, category, tags):
+        self.state["search_term"] = ""
+        self.state["search_category"] = category
+        self.state["search_tags"] = tags
+        self.rerun()
+
+    def open_modal(self, rng):
+        if self.result_ids:
+            template_id = rng.choice(self.result_ids)
+            self.store.record_selection(self.user_id, template_id, weight=0.5)
+            self.session.select(template_id)
+            self.state["placeholders"] = {}
+        self.rerun()
+
+    def fill_placeholders(self):
+        template = self.session.selected_template(self.store)
+        if template:
+            for placeholder in template["placeholders"]:
+                self.state["placeholders"][placeholder] = f"my {placeholder}"
+                self.rerun()
+            # As the modal's "Load into Main Generator" button does
+            self.store.record_fill(self.user_id, self.state["placeholders"])
+            self.session.hand_off(self.state["placeholders"], "load_into_generator")
+            self.rerun()
+            self.session.result(self.store)
+            self.session.redirect = False
+
+    def close_modal(self):
+        self.session.close()
+        self.state["placeholders"] = {}
+        self.rerun()
+
+
+class AppTestSession:
+    """One session of the real Streamlit page, driven through AppTest"""
+
+    def __init__(self, timeout=30):
+        from streamlit.testing.v1 import AppTest
+
+        self.timeout = timeout
+        self.app = AppTest.from_file(PAGE_SCRIPT, default_timeout=timeout)
+        self.app.run()
+
+    def _run(self):
+        self.app.run()
+        if self.app.exception:
+            raise RuntimeError(f"Template library page failed: {self.app.exception[0].value}")
+
+    def search(self, term, sort="relevance"):
+        self.app.text_input(key="search_term").input(term)
+        self._run()
+        if self.app.selectbox(key="search_sort").value != sort:
+            self.app.selectbox(key="search_sort").select(sort)
+            self._run()
+
+    def next_page(self):
+        buttons = [button for button in self.app.button if button.label == "Next →" and not button.disabled]
+        if buttons:
+            buttons[0].click()
+        self._run()
+
+    def filter(self, category, tags):
+        self.app.text_input(key="search_term").input("")
+        option = next(option for option in self.app.selectbox(key="search_category").options if option.endswith(category))
+        self.app.selectbox(key="search_category").select(option)
+        self.app.multiselect(key="search_tags").set_value(tags)
+        self._run()
+
+    def open_modal(self, rng):
+        buttons = [button for button in self.app.button if (button.key or "").startswith("customize_")]
+        if buttons:
+            rng.choice(buttons).click()
+        self._run()
+
+    def fill_placeholders(self):
+        for text_input in list(self.app.text_input):
+            if (text_input.key or "").startswith("placeholder_"):
+                self.app.text_input(key=text_input.key).input(f"my {text_input.key[len('placeholder_'):]}")
+                self._run()
+
+    def close_modal(self):
+        buttons = [button for button in self.app.button if button.label == "❌ Close"]
+        if buttons:
+            buttons[0].click()
+        self._run()
+
+
+def render_card_markup(template):
+    """String work of render_template_card (markup that Streamlit would serialize)"""
+    structure = template["structure"]
+    tags = " ".join(f"<span>{tag}</span>" for tag in template["categoryInfo"]["tags"][:2])
+    return (
+        f"<div><span>{template['categoryInfo']['icon']}</span><span>{template['categoryInfo']['name']}</span>"
+        f"{'<span>High Engagement</span>' if TemplateStore.engagement_level(template) == 'High' else ''}"
+        f"<h4>{template['title']}</h4><p>{template['preview']}</p>"
+        f"<div>{structure[:150]}{'...' if len(structure) > 150 else ''}</div>"
+        f"<span>{len(template['placeholders'])} placeholders</span><span>{template['length']} length</span>"
+        f"<div>{tags}</div></div>"
+    )
+
+
+def run_scenario(session, rng, record, think_seconds=0.0):
+    """One user journey: search, page, filter, open the modal, fill placeholders, close"""
+    # Only categories with templates, and only their own tags, so the modal and fill steps have work to do
+    categories = [cat for cat in TemplateStore.get_categories() if TemplateStore.get_templates_by_category(cat["id"])]
+
+    def filter_step():
+        category = rng.choice(categories)
+        session.filter(category["id"], rng.sample(category["tags"], rng.randint(0, min(2, len(category["tags"])))))
+
+    steps = [
+        ("search", lambda: session.search(rng.choice(SEARCH_TERMS), rng.choice(SORT_OPTIONS))),
+        ("next_page", session.next_page),
+        ("filter", filter_step),
+        ("open_modal", lambda: session.open_modal(rng)),
+        ("fill_placeholders", session.fill_placeholders),
+        ("close_modal", session.close_modal)
+    ]
+    for name, step in steps:
+        started = time.perf_counter()
+        step()
+        record(name, time.perf_counter() - started)
+        if think_seconds:
+            time.sleep(rng.expovariate(1 / think_seconds))
+
+
+def percentiles(samples):
+    """p50/p95/p99/max in milliseconds"""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def at(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 3)
+
+    return {"count": len(ordered), "p50_ms": at(0.50), "p95_ms": at(0.95), "p99_ms": at(0.99),
+            "max_ms": round(ordered[-1] * 1000, 3)}
+
+
+def _make_session(driver):
+    if driver == "headless":
+        return HeadlessSession()
+    if driver == "apptest":
+        return AppTestSession()
+    raise ValueError(f"Unknown driver '{driver}'. Available drivers: ['headless', 'apptest']")
+
+
+def measure_session_memory(driver="headless", sessions=20, seed=0):
+    """Bytes retained per session after one journey each (session state, caches excluded)"""
+    # Warm the shared caches and lazy imports first so they are not billed to sessions
+    run_scenario(_make_session(driver), random.Random(seed), lambda name, seconds: None)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        live = []
+        for i in range(sessions):
+            session = _make_session(driver)
+            run_scenario(session, random.Random(seed + i), lambda name, seconds: None)
+            live.append(session)
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"bytes_per_session": round((after - before) / sessions), "peak_bytes": peak - before}
+
+
+def run_load(sessions=10, iterations=10, driver="headless", think_ms=0.0, seed=0, memory_sessions=20):
+    """Run `sessions` concurrent sessions, each doing `iterations` journeys; returns a report dict"""
+    samples = {}
+    lock = threading.Lock()
+
+    def record(name, seconds):
+        with lock:
+            samples.setdefault(name, []).append(seconds)
+
+    def session_main(number):
+        rng = random.Random(seed * 100003 + number)
+        session = _make_session(driver)
+        for _ in range(iterations):
+            run_scenario(session, rng, record, think_ms / 1000)
+
+    # Lazy imports and index builds happen once per process, not per session
+    run_scenario(_make_session(driver), random.Random(seed), lambda name, seconds: None)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        for future in [executor.submit(session_main, number) for number in range(sessions)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    all_samples = [seconds for values in samples.values() for seconds in values]
+    report = {
+        "driver": driver,
+        "sessions": sessions,
+        "iterations": iterations,
+        "duration_s": round(elapsed, 3),
+        "interactions": len(all_samples),
+        "throughput_per_s": round(len(all_samples) / elapsed, 1) if elapsed else 0.0,
+        "latency": percentiles(all_samples),
+        "latency_by_action": {name: percentiles(values) for name, values in samples.items()},
+        "search_cache": TemplateStore.search_cache_stats(),
+        "library_sessions": SESSIONS.stats()
+    }
+    if memory_sessions:
+        report["memory"] = measure_session_memory(driver, memory_sessions, seed)
+    return report
+
+
+def find_capacity(levels=(1, 5, 10, 25, 50, 100), p95_budget_ms=100.0, **options):
+    """Ramp concurrency and report the highest level whose p95 latency stays within budget"""
+    steps = []
+    capacity = None
+    for sessions in levels:
+        report = run_load(sessions, memory_sessions=0, **options)
+        within = report["latency"]["p95_ms"] <= p95_budget_ms
+        steps.append({"sessions": sessions, "throughput_per_s": report["throughput_per_s"],
+                      "p95_ms": report["latency"]["p95_ms"], "within_budget": within})
+        if not within:
+            break
+        capacity = sessions
+    return {"p95_budget_ms": p95_budget_ms, "capacity_sessions": capacity, "steps": steps}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the template library page")
+    parser.add_argument("--driver", choices=["headless", "apptest"], default="headless")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=10, help="Journeys per session")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean think time between interactions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ramp", help="Comma-separated session counts to find capacity (e.g. 1,10,50,100)")
+    parser.add_argument("--p95-budget-ms", type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    options = {"iterations": args.iterations, "driver": args.driver, "think_ms": args.think_ms, "seed": args.seed}
+    if args.ramp:
+        levels = [int(level) for level in args.ramp.split(",")]
+        report = find_capacity(levels, args.p95_budget_ms, **options)
+    else:
+        report = run_load(args.sessions, **options)
+    print(json.dumps(report, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
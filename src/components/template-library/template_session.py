@@ -0,0 +1,128 @@
+"""
+Template Library Sessions
+Lean server-side state for template library page sessions. Streamlit's session_state
+keeps only a session id; the session's selection is a template id plus small maps
+(placeholder values, action flags) held here and resolved against TemplateStore when a
+rerun needs them, so no template dicts are copied per session. Sessions idle for longer
+than max_idle_seconds are evicted and start over with nothing selected.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from template_store import TemplateStore
+
+ACTIONS = ("customize", "load_into_generator", "use")
+
+
+class LibrarySession:
+    """Selection state of one page session: a template id, an action and placeholder values"""
+
+    __slots__ = ("session_id", "selected_id", "action", "values", "redirect", "last_active")
+
+    def __init__(self, session_id, now=0.0):
+        self.session_id = session_id
+        self.selected_id = None
+        self.action = None
+        self.values = {}
+        self.redirect = False
+        self.last_active = now
+
+    def select(self, template_id, action="customize"):
+        """Select a template; load_into_generator and use hand it off right away"""
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action '{action}'. Available actions: {list(ACTIONS)}")
+        self.selected_id = template_id
+        self.action = action
+        self.values = {}
+        self.redirect = action != "customize"
+
+    def hand_off(self, values=None, action="use"):
+        """Hand the selected template to the generator with the given placeholder values"""
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action '{action}'. Available actions: {list(ACTIONS)}")
+        self.action = action
+        self.values = {placeholder: value for placeholder, value in (values or {}).items() if value}
+        self.redirect = True
+
+    def close(self):
+        self.selected_id = None
+        self.action = None
+        self.values = {}
+        self.redirect = False
+
+    def selected_template(self, store=TemplateStore):
+        """The selected template dict from the store (None if nothing is selected or it was removed)"""
+        return store.get_template_by_id(self.selected_id) if self.selected_id else None
+
+    def result(self, store=TemplateStore):
+        """The handed-off template with its action and customPlaceholders (built on demand, not stored)"""
+        template = self.selected_template(store)
+        if template is None:
+            return None
+        return {**template, "action": self.action, "customPlaceholders": dict(self.values)}
+
+
+class SessionStore:
+    """Sessions by id in least-recently-active order, so idle ones are evicted from the front"""
+
+    def __init__(self, max_idle_seconds=1800.0, max_sessions=10000, clock=time.monotonic):
+        self.max_idle_seconds = max_idle_seconds
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self.evicted = 0
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    @staticmethod
+    def new_session_id():
+        return uuid.uuid4().hex
+
+    def get(self, session_id):
+        """The session for an id (a fresh one if it never existed or was evicted), marked active"""
+        now = self.clock()
+        with self._lock:
+            self._evict(now)
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = LibrarySession(session_id, now)
+                if len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+                    self.evicted += 1
+            else:
+                session.last_active = now
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def drop(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def evict_idle(self):
+        """Drop sessions idle for longer than max_idle_seconds; returns how many were dropped"""
+        with self._lock:
+            return self._evict(self.clock())
+
+    def _evict(self, now):
+        dropped = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_active <= self.max_idle_seconds:
+                break
+            self._sessions.popitem(last=False)
+            dropped += 1
+        self.evicted += dropped
+        return dropped
+
+    def stats(self):
+        return {"sessions": len(self._sessions), "evicted": self.evicted,
+                "max_idle_seconds": self.max_idle_seconds, "max_sessions": self.max_sessions}
+
+
+# Shared by all sessions of one Streamlit server process
+SESSIONS = SessionStore()
@@ -0,0 +1,680 @@
+"""
+Template Store
+UI-free Python version of templateStore.js: template data, listing and search.
+Safe to import from API workers and batch jobs: it never imports Streamlit and
+changes nothing at import time. TemplateLibraryStreamlit.py renders it.
+"""
+
+import os
+import sys
+
+# The LinkedIn templates plugin (AI fill helpers) lives in src/plugins
+PLUGINS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "plugins"))
+
+def load_plugin_module(name: str = "linkedin_templates"):
+    """Import a module from the LinkedIn templates plugin on first use"""
+    if PLUGINS_DIR not in sys.path:
+        sys.path.append(PLUGINS_DIR)
+    return __import__(name)
+
+# Template data and logic (Python version of templateStore.js)
+class TemplateStore:
+    """Python version of the Template Store"""
+    
+    # Search results are cached across sessions until the corpus version changes
+    SEARCH_CACHE_SIZE = 256
+    _search_cache = None
+    _corpus_version = 0
+    _autocomplete = None  # (corpus version, AutocompleteIndex)
+    _id_index = None  # (corpus version, {template id: (category id, index)})
+    _recommender = None
+    _recommender_version = None
+    _feedback = None  # linkedin_feedback.FeedbackStore keyed by template id
+    _fill_history = None
+    
+    TEMPLATE_CATEGORIES = {
+        "Personal Story": {
+            "name": "Personal Story",
+            "description": "Share personal experiences and transformations",
+            "tags": ["inspirational", "authentic", "engagement"],
+            "icon": "👤",
+            "color": "#3B82F6"
+        },
+        "Lessons Learned": {
+            "name": "Lessons Learned", 
+            "description": "Share professional insights and key learnings",
+            "tags": ["educational", "wisdom", "professional"],
+            "icon": "💡",
+            "color": "#10B981"
+        },
+        "Industry Insights": {
+            "name": "Industry Insights",
+            "description": "Share industry trends and expert analysis", 
+            "tags": ["technical", "analytical", "thought-leadership"],
+            "icon": "📊",
+            "color": "#8B5CF6"
+        },
+        "Career Advice": {
+            "name": "Career Advice",
+            "description": "Provide guidance for professional development",
+            "tags": ["educational", "mentoring", "growth"],
+            "icon": "🚀",
+            "color": "#F59E0B"
+        },
+        "Leadership": {
+            "name": "Leadership",
+            "description": "Leadership principles and management insights",
+            "tags": ["professional", "management", "inspiration"],
+            "icon": "👑",
+            "color": "#EF4444"
+        },
+        "Success Stories": {
+            "name": "Success Stories",
+            "description": "Share achievements and case studies",
+            "tags": ["inspirational", "proof", "achievement"],
+            "icon": "🏆",
+            "color": "#06B6D4"
+        },
+        "Motivation": {
+            "name": "Motivation",
+            "description": "Inspire and motivate your audience",
+            "tags": ["inspirational", "engagement", "energy"],
+            "icon": "⚡",
+            "color": "#EC4899"
+        },
+        "Business Strategy": {
+            "name": "Business Strategy",
+            "description": "Strategic insights and business analysis",
+            "tags": ["technical", "analytical", "strategic"],
+            "icon": "🎯",
+            "color": "#6366F1"
+        },
+        "Technology Trends": {
+            "name": "Technology Trends",
+            "description": "Tech insights and digital transformation",
+            "tags": ["technical", "innovation", "future"],
+            "icon": "🔬",
+            "color": "#059669"
+        },
+        "Team Building": {
+            "name": "Team Building",
+            "description": "Team dynamics and collaboration insights",
+            "tags": ["professional", "collaboration", "culture"],
+            "icon": "🤝",
+            "color": "#DC2626"
+        }
+    }
+    
+    TEMPLATE_STRUCTURES = {
+        "Personal Story": [
+            {
+                "id": "ps_001",
+                "title": "Challenge to Success Journey",
+                "structure": "Three years ago, I [insert challenge]. Today, I [insert current state]. Here's what I learned: [insert lesson]. The key insight: [insert insight]. What challenges have shaped your career?",
+                "placeholders": ["challenge", "current state", "lesson", "insight"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#PersonalGrowth #CareerJourney #Lessons",
+                "preview": "Share your transformation story from struggle to success..."
+            },
+            {
+                "id": "ps_002", 
+                "title": "Belief Transformation",
+                "structure": "I used to believe [insert old belief]. Then [insert pivotal moment] happened. Now I understand that [insert new perspective]. This shift changed everything: [insert impact]. Sometimes our biggest assumptions need questioning.",
+                "placeholders": ["old belief", "pivotal moment", "new perspective", "impact"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#Mindset #Growth #Transformation",
+                "preview": "Tell the story of how your perspective fundamentally changed..."
+            },
+            {
+                "id": "ps_003",
+                "title": "Moment of Realization",
+                "structure": "The moment I realized [insert realization] was when [insert situation]. It felt [insert emotion], but it taught me [insert lesson]. Now I approach [insert area] completely differently: [insert new approach].",
+                "placeholders": ["realization", "situation", "emotion", "lesson", "area", "new approach"],
+                "engagement": "Medium",
+                "length": "Long",
+                "hashtags": "#PersonalDevelopment #Lessons #Growth",
+                "preview": "Share a pivotal moment that changed your approach..."
+            },
+            {
+                "id": "ps_004",
+                "title": "Failure to Learning",
+                "structure": "My biggest failure was [insert failure]. I felt [insert emotion] and wanted to [insert initial reaction]. Instead, I [insert what you did]. The result? [insert outcome]. Failure isn't the opposite of success—it's part of it.",
+                "placeholders": ["failure", "emotion", "initial reaction", "what you did", "outcome"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#Resilience #FailureToSuccess #Growth",
+                "preview": "Turn your biggest setback into a learning story..."
+            },
+            {
+                "id": "ps_005",
+                "title": "Overcoming Limitations",
+                "structure": "Growing up, I was told [insert limiting belief]. For years, I [insert how it affected you]. Then I met [insert person/situation] who showed me [insert new perspective]. Today, I [insert current state]. Your background doesn't define your future.",
+                "placeholders": ["limiting belief", "how it affected you", "person/situation", "new perspective", "current state"],
+                "engagement": "High",
+                "length": "Long",
+                "hashtags": "#Inspiration #OvercomingLimits #Success",
+                "preview": "Share how you overcame limiting beliefs about yourself..."
+            },
+            # Add more Personal Story templates...
+            {
+                "id": "ps_006",
+                "title": "Risk Taking Story",
+                "structure": "Last [insert timeframe], I took a risk: [insert risk]. People said [insert criticism]. My family worried about [insert concern]. But I knew [insert conviction]. The outcome? [insert result]. Sometimes you have to bet on yourself.",
+                "placeholders": ["timeframe", "risk", "criticism", "concern", "conviction", "result"],
+                "engagement": "Medium",
+                "length": "Long",
+                "hashtags": "#TakingRisks #Entrepreneurship #Courage",
+                "preview": "Tell about a time you took a leap of faith..."
+            },
+            {
+                "id": "ps_007",
+                "title": "Difficult Conversation Impact",
+                "structure": "The hardest conversation I ever had was [insert situation]. I had to [insert what you had to do]. It was difficult because [insert why]. But it led to [insert positive outcome]. Difficult conversations create breakthrough moments.",
+                "placeholders": ["situation", "what you had to do", "why", "positive outcome"],
+                "engagement": "Medium",
+                "length": "Medium",
+                "hashtags": "#Courage #Communication #Leadership",
+                "preview": "Share how a tough conversation led to positive change..."
+            },
+            {
+                "id": "ps_008",
+                "title": "Memorable Learning Moment",
+                "structure": "I'll never forget [insert memorable moment]. It was [insert context]. In that moment, I learned [insert lesson]. This experience shaped how I [insert impact on behavior]. Some lessons can only be learned through experience.",
+                "placeholders": ["memorable moment", "context", "lesson", "impact on behavior"],
+                "engagement": "Medium",
+                "length": "Medium",
+                "hashtags": "#LifeLessons #Wisdom #Experience",
+                "preview": "Share an unforgettable moment that taught you something..."
+            },
+            {
+                "id": "ps_009",
+                "title": "Unique Journey Celebration",
+                "structure": "When I started [insert beginning], I had [insert initial state]. Everyone around me [insert others' situation]. But I believed [insert belief]. After [insert timeframe], I [insert achievement]. Your journey is unique—embrace it.",
+                "placeholders": ["beginning", "initial state", "others' situation", "belief", "timeframe", "achievement"],
+                "engagement": "Medium",
+                "length": "Long",
+                "hashtags": "#Authenticity #Journey #Success",
+                "preview": "Celebrate what makes your path different from others..."
+            },
+            {
+                "id": "ps_010",
+                "title": "Mentorship and Wisdom",
+                "structure": "The person who changed my perspective was [insert person]. They told me [insert advice/insight]. At first, I [insert initial reaction]. But over time, I realized [insert realization]. This wisdom now guides [insert how it guides you].",
+                "placeholders": ["person", "advice/insight", "initial reaction", "realization", "how it guides you"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#Mentorship #WisdomShared #Growth",
+                "preview": "Honor someone who shaped your thinking..."
+            }
+        ],
+        
+        "Lessons Learned": [
+            {
+                "id": "ll_001",
+                "title": "Top Professional Lessons",
+                "structure": "After [insert timeframe] in [insert field/role], here are the 3 most important lessons I've learned: 1) [insert lesson 1] 2) [insert lesson 2] 3) [insert lesson 3]. Which of these resonates most with your experience?",
+                "placeholders": ["timeframe", "field/role", "lesson 1", "lesson 2", "lesson 3"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#Leadership #Experience #Lessons",
+                "preview": "Share your top 3 professional lessons learned..."
+            },
+            {
+                "id": "ll_002",
+                "title": "Most Valuable Mistake",
+                "structure": "The mistake that taught me the most was [insert mistake]. I thought [insert wrong assumption]. The reality was [insert what actually happened]. Now I always [insert new approach]. What's the most valuable mistake you've made?",
+                "placeholders": ["mistake", "wrong assumption", "what actually happened", "new approach"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#LearningFromFailure #Growth #Mistakes",
+                "preview": "Turn your biggest mistake into a teaching moment..."
+            },
+            # Add more Lessons Learned templates (abbreviated for space)
+        ],
+        
+        "Career Advice": [
+            {
+                "id": "ca_001",
+                "title": "Hidden Career Advice",
+                "structure": "The career advice no one gives you: [insert advice]. Most people focus on [insert common focus]. But the real career accelerator is [insert real accelerator]. I learned this when [insert learning moment]. Apply this to [insert application].",
+                "placeholders": ["advice", "common focus", "real accelerator", "learning moment", "application"],
+                "engagement": "High",
+                "length": "Medium",
+                "hashtags": "#CareerGrowth #ProfessionalDevelopment #Advice",
+                "preview": "Share career advice that's not commonly given..."
+            },
+            # More career advice templates...
+        ]
+        
+        # Continue for other categories...
+    }
+    
+    @classmethod
+    def get_categories(cls):
+        """Get all available categories"""
+        return [{"id": key, **value} for key, value in cls.TEMPLATE_CATEGORIES.items()]
+    
+    @classmethod
+    def get_templates_by_category(cls, category_id):
+        """Get templates by category"""
+        templates = cls.TEMPLATE_STRUCTURES.get(category_id, [])
+        return [
+            {**template, "category": category_id, "categoryInfo": cls.TEMPLATE_CATEGORIES.get(category_id, {})}
+            for template in templates
+        ]
+    
+    @classmethod
+    def get_template(cls, category_id, template_index):
+        """Get specific template"""
+        templates = cls.TEMPLATE_STRUCTURES.get(category_id, [])
+        if 0 <= template_index < len(templates):
+            return {
+                **templates[template_index],
+                "category": category_id,
+                "categoryInfo": cls.TEMPLATE_CATEGORIES.get(category_id, {}),
+                "index": template_index
+            }
+        return None
+    
+    @staticmethod
+    def category_has_tags(category, filter_tags):
+        """True if a category carries any of the filter tags (or no filter is given)"""
+        if not filter_tags:
+            return True
+        category_tags = [t.lower() for t in category["tags"]]
+        return any(tag.lower() in category_tags for tag in filter_tags)
+    
+    @staticmethod
+    def template_matches(template, search_term):
+        """True if a lowercased search term appears in the template's title, preview or structure"""
+        searchable_text = f"{template['title']} {template['preview']} {template['structure']}".lower()
+        return search_term in searchable_text
+    
+    @classmethod
+    def corpus_version(cls):
+        """Version of the template data; cached search results from other versions are discarded"""
+        return cls._corpus_version
+    
+    @classmethod
+    def bump_corpus_version(cls):
+        """Call after changing TEMPLATE_CATEGORIES or TEMPLATE_STRUCTURES in place"""
+        cls._corpus_version += 1
+    
+    @classmethod
+    def get_search_cache(cls):
+        """Get the shared search result cache (see linkedin_search.SearchCache)"""
+        if TemplateStore._search_cache is None:
+            TemplateStore._search_cache = load_plugin_module("linkedin_search").SearchCache(cls.SEARCH_CACHE_SIZE)
+        return TemplateStore._search_cache
+    
+    @classmethod
+    def search_cache_stats(cls):
+        """Hit-rate metrics of the shared search result cache"""
+        return cls.get_search_cache().stats()
+    
+    @classmethod
+    def cached_search(cls, kind, compute, keyword, filter_tags=None, limit=None, cursor=None, sort=None,
+                      scope=None, version=None):
+        """Look a query up in the shared cache, computing it on a miss"""
+        key = (kind, cls, scope, *load_plugin_module("linkedin_search").normalize_query(
+            keyword, None, filter_tags, sort, limit, cursor
+        ))
+        # Engagement order follows live feedback, so those pages also expire when feedback arrives
+        feedback_version = TemplateStore._feedback.version if sort == "engagement" and TemplateStore._feedback else None
+        return cls.get_search_cache().get_or_compute(key, (cls._corpus_version, version, feedback_version), compute)
+    
+    @classmethod
+    def search_templates(cls, keyword, filter_tags=None):
+        """Search templates by keyword (results are cached per corpus version)"""
+        return cls.cached_search("all", lambda: cls._scan_templates(keyword, filter_tags), keyword, filter_tags)
+    
+    @classmethod
+    def _scan_templates(cls, keyword, filter_tags=None):
+        results = []
+        search_term = keyword.lower()
+        
+        for category_id, templates in cls.TEMPLATE_STRUCTURES.items():
+            category = cls.TEMPLATE_CATEGORIES[category_id]
+            
+            # Filter by tags if provided
+            if not cls.category_has_tags(category, filter_tags):
+                continue
+            
+            for i, template in enumerate(templates):
+                if cls.template_matches(template, search_term):
+                    results.append({
+                        **template,
+                        "category": category_id,
+                        "categoryInfo": category,
+                        "index": i
+                    })
+        
+        return results
+    
+    @classmethod
+    def search_templates_page(cls, keyword, filter_tags=None, limit=20, cursor=None, sort="relevance"):
+        """Ranked, cursor-paginated search (a linkedin_search.SearchPage)
+        
+        sort is "relevance", "engagement" or "length"; pass page.next_cursor for the next page.
+        """
+        return cls.cached_search(
+            "page",
+            lambda: cls.rank_matches(
+                ((category_id, enumerate(templates)) for category_id, templates in cls.TEMPLATE_STRUCTURES.items()),
+                keyword, filter_tags, limit, cursor, sort
+            ),
+            keyword, filter_tags, limit, cursor, sort
+        )
+    
+    @classmethod
+    def rank_matches(cls, categories, keyword, filter_tags, limit, cursor, sort):
+        """Heap top-k over (category_id, [(index, template), ...]) pairs, in category order"""
+        search = load_plugin_module("linkedin_search")
+        search_term = keyword.lower()
+        order = {category_id: position for position, category_id in enumerate(cls.TEMPLATE_CATEGORIES)}
+        
+        def hits():
+            for category_id, templates in categories:
+                category = cls.TEMPLATE_CATEGORIES[category_id]
+                if not cls.category_has_tags(category, filter_tags):
+                    continue
+                for i, template in templates:
+                    if not cls.template_matches(template, search_term):
+                        continue
+                    score = search.relevance(search_term, f"{template['preview']} {template['structure']}",
+                                             template['title'])
+                    engagement = cls.engagement_level(template) if sort == "engagement" else None
+                    key = search.sort_key(sort, score, engagement, len(template['structure']),
+                                          (order.get(category_id, len(order)), i))
+                    yield key, {**template, "category": category_id, "categoryInfo": category, "index": i}
+        
+        return search.top_k_page(hits(), limit, cursor, sort)
+    
+    @classmethod
+    def get_template_by_id(cls, template_id):
+        """Get a template by its id (O(1) through an index rebuilt when the corpus changes)"""
+        if cls._id_index is None or cls._id_index[0] != cls._corpus_version:
+            cls._id_index = (cls._corpus_version, {
+                template["id"]: (category_id, i)
+                for category_id, templates in cls.TEMPLATE_STRUCTURES.items()
+                for i, template in enumerate(templates)
+            })
+        ref = cls._id_index[1].get(template_id)
+        return cls.get_template(*ref) if ref else None
+    
+    @classmethod
+    def get_recommender(cls):
+        """Get the shared per-user recommender (see linkedin_recommend); histories survive corpus changes"""
+        recommend = load_plugin_module("linkedin_recommend")
+        if cls._recommender is None:
+            cls._recommender = recommend.TemplateRecommender.from_template_store(cls)
+            cls._recommender_version = cls._corpus_version
+        elif cls._recommender_version != cls._corpus_version:
+            cls._recommender.set_items(*recommend.template_store_items(cls))
+            cls._recommender_version = cls._corpus_version
+        return cls._recommender
+    
+    @classmethod
+    def record_selection(cls, user_id, template_id, weight=1.0):
+        """Record that a user picked (or handed off) a template"""
+        cls.get_recommender().record_selection(user_id, template_id, weight)
+    
+    @classmethod
+    def recommend(cls, user_id, k=10, categories=None):
+        """Personalized top-k templates for a user, best first (popular ones for new users)"""
+        return [
+            {**cls.get_template_by_id(template_id), "score": score}
+            for template_id, score in cls.get_recommender().recommend(user_id, k, groups=categories)
+        ]
+    
+    @classmethod
+    def attach_feedback(cls, feedback):
+        """Drive engagement levels from recorded outcomes (shared by all stores, like the search cache)"""
+        TemplateStore._feedback = feedback
+    
+    @classmethod
+    def get_feedback(cls):
+        """Get the shared engagement feedback store (in-memory unless one was attached)"""
+        if TemplateStore._feedback is None:
+            TemplateStore._feedback = load_plugin_module("linkedin_feedback").FeedbackStore()
+        return TemplateStore._feedback
+    
+    @classmethod
+    def record_engagement(cls, template_id, impressions=0, reactions=0, comments=0):
+        """Record the outcome of a published post made from a template"""
+        cls.get_feedback().record_post(template_id, impressions, reactions, comments)
+    
+    @classmethod
+    def engagement_level(cls, template):
+        """Live engagement level of a template dict, or its static "engagement" until enough impressions exist"""
+        static = template.get("engagement", "Medium")
+        if TemplateStore._feedback is None:
+            return static
+        return TemplateStore._feedback.engagement_level(template["id"], default=static)
+    
+    @classmethod
+    def filter_by_engagement(cls, min_level="High", filter_tags=None):
+        """Templates whose live engagement level is at least min_level"""
+        rank = load_plugin_module("linkedin_search").ENGAGEMENT_RANK
+        if min_level not in rank:
+            raise ValueError(f"Unknown engagement level '{min_level}'. Available levels: {list(rank)}")
+        results = []
+        for category_id, templates in cls.TEMPLATE_STRUCTURES.items():
+            category = cls.TEMPLATE_CATEGORIES[category_id]
+            if not cls.category_has_tags(category, filter_tags):
+                continue
+            for i, template in enumerate(templates):
+                if rank.get(cls.engagement_level(template), 1) >= rank[min_level]:
+                    results.append({**template, "category": category_id, "categoryInfo": category, "index": i})
+        return results
+    
+    @classmethod
+    def get_fill_history(cls):
+        """Get the shared per-user placeholder value history (see linkedin_fill_history)"""
+        if TemplateStore._fill_history is None:
+            TemplateStore._fill_history = load_plugin_module("linkedin_fill_history").FillHistory()
+        return TemplateStore._fill_history
+    
+    @classmethod
+    def record_fill(cls, user_id, values):
+        """Remember the placeholder values a user filled in (feeds suggest_values and prefill)"""
+        cls.get_fill_history().record(user_id, values)
+    
+    @classmethod
+    def suggest_values(cls, user_id, placeholder, prefix="", k=5):
+        """Past values of a placeholder for a user, best first, optionally by typed prefix"""
+        return cls.get_fill_history().suggest(user_id, placeholder, prefix, k)
+    
+    @classmethod
+    def prefill(cls, user_id, template):
+        """Best remembered value for each placeholder of a template dict"""
+        return cls.get_fill_history().prefill(user_id, template["placeholders"])
+    
+    @classmethod
+    def get_autocomplete_index(cls):
+        """Get the prefix index over titles, categories, tags and hashtags (rebuilt when the corpus changes)"""
+        if cls._autocomplete is None or cls._autocomplete[0] != cls._corpus_version:
+            index = load_plugin_module("linkedin_autocomplete").AutocompleteIndex.from_template_store(cls)
+            cls._autocomplete = (cls._corpus_version, index)
+        return cls._autocomplete[1]
+    
+    @classmethod
+    def autocomplete(cls, prefix, k=8):
+        """Top-k completions (Completion text, kind and score) for a partially typed search term"""
+        if not prefix.strip():
+            return []
+        return cls.get_autocomplete_index().complete(prefix, k)
+    
+    @classmethod
+    def get_all_tags(cls):
+        """Get all available tags"""
+        all_tags = set()
+        for category in cls.TEMPLATE_CATEGORIES.values():
+            all_tags.update(category["tags"])
+        return sorted(list(all_tags))
+
+class TenantTemplateStore:
+    """Copy-on-write tenant view over the shared TemplateStore
+    
+    Stores only the tenant's field overrides (by template id), added templates and
+    deleted ids; listing and search merge them with the shared data lazily.
+    Indexes are positions in the tenant's merged category list, as in TemplateStore.
+    """
+    
+    def __init__(self, tenant_id=None, base=TemplateStore):
+        self.tenant_id = tenant_id
+        self.base = base
+        self._edits = {}
+        self._additions = {}
+        self._deleted = set()
+        self._version = 0
+        self._cache_token = object()
+    
+    def _cache_scope(self):
+        # A tenant without overlay entries sees exactly the shared corpus, so it shares its cache entries
+        if not self.overlay_size():
+            return {"scope": None, "version": None}
+        return {"scope": self._cache_token, "version": self._version}
+    
+    def edit_template(self, template_id, **fields):
+        """Override fields (structure, title, hashtags, ...) of a template for this tenant"""
+        fields.pop("id", None)
+        for additions in self._additions.values():
+            for template in additions:
+                if template["id"] == template_id:
+                    template.update(fields)
+                    self._version += 1
+                    return
+        self._edits.setdefault(template_id, {}).update(fields)
+        self._version += 1
+    
+    def add_template(self, category_id, template):
+        """Add a tenant-only template dict (needs a unique 'id')"""
+        if category_id not in self.base.TEMPLATE_CATEGORIES:
+            raise ValueError(f"Category '{category_id}' not found")
+        self._additions.setdefault(category_id, []).append(dict(template))
+        self._version += 1
+    
+    def delete_template(self, template_id):
+        """Hide a template from this tenant"""
+        self._edits.pop(template_id, None)
+        self._deleted.add(template_id)
+        self._version += 1
+    
+    def overlay_size(self):
+        """Number of overlay entries held by this view"""
+        return len(self._edits) + len(self._deleted) + sum(len(items) for items in self._additions.values())
+    
+    def _iter_category(self, category_id):
+        for template in self.base.TEMPLATE_STRUCTURES.get(category_id, []):
+            if template["id"] in self._deleted:
+                continue
+            edit = self._edits.get(template["id"])
+            yield {**template, **edit} if edit else template
+        for template in self._additions.get(category_id, []):
+            if template["id"] not in self._deleted:
+                yield template
+    
+    def get_categories(self):
+        """Get all available categories"""
+        return self.base.get_categories()
+    
+    def get_all_tags(self):
+        """Get all available tags"""
+        return self.base.get_all_tags()
+    
+    def get_templates_by_category(self, category_id):
+        """Get templates by category"""
+        category = self.base.TEMPLATE_CATEGORIES.get(category_id, {})
+        return [
+            {**template, "category": category_id, "categoryInfo": category, "index": i}
+            for i, template in enumerate(self._iter_category(category_id))
+        ]
+    
+    def get_template(self, category_id, template_index):
+        """Get specific template"""
+        for i, template in enumerate(self._iter_category(category_id)):
+            if i == template_index:
+                return {
+                    **template,
+                    "category": category_id,
+                    "categoryInfo": self.base.TEMPLATE_CATEGORIES.get(category_id, {}),
+                    "index": i
+                }
+        return None
+    
+    def search_templates(self, keyword, filter_tags=None):
+        """Search templates by keyword (results are cached per corpus and overlay version)"""
+        return self.base.cached_search(
+            "all", lambda: self._scan_templates(keyword, filter_tags), keyword, filter_tags,
+            **self._cache_scope()
+        )
+    
+    def _scan_templates(self, keyword, filter_tags=None):
+        results = []
+        search_term = keyword.lower()
+        
+        for category_id in self.base.TEMPLATE_CATEGORIES:
+            category = self.base.TEMPLATE_CATEGORIES[category_id]
+            if not self.base.category_has_tags(category, filter_tags):
+                continue
+            
+            for i, template in enumerate(self._iter_category(category_id)):
+                if self.base.template_matches(template, search_term):
+                    results.append({**template, "category": category_id, "categoryInfo": category, "index": i})
+        
+        return results
+    
+    def search_templates_page(self, keyword, filter_tags=None, limit=20, cursor=None, sort="relevance"):
+        """Ranked, cursor-paginated search over the tenant's merged templates"""
+        return self.base.cached_search(
+            "page",
+            lambda: self.base.rank_matches(
+                ((category_id, enumerate(self._iter_category(category_id))) for category_id in self.base.TEMPLATE_CATEGORIES),
+                keyword, filter_tags, limit, cursor, sort
+            ),
+            keyword, filter_tags, limit, cursor, sort, **self._cache_scope()
+        )
+
+def measure_import_time(module: str = "template_store") -> dict:
+    """Import `module` in a fresh interpreter and report its cumulative import time
+    
+    Returns the module's cumulative import time in milliseconds (from -X importtime)
+    and whether Streamlit got pulled in along the way.
+    """
+    import re
+    import subprocess
+    
+    code = f"import sys, {module}; print('streamlit' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    cumulative_us = 0
+    for line in completed.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$', line)
+        if match and match.group(2) == module:
+            cumulative_us = int(match.group(1))
+    return {
+        "module": module,
+        "import_ms": cumulative_us / 1000,
+        "streamlit_loaded": completed.stdout.strip() == "True"
+    }
+
+def check_import_budget(budget_ms: float = 50.0, module: str = "template_store") -> dict:
+    """Raise if importing `module` exceeds the budget or loads Streamlit"""
+    report = measure_import_time(module)
+    if report["streamlit_loaded"]:
+        raise RuntimeError(f"Importing {module} loaded Streamlit")
+    if report["import_ms"] > budget_ms:
+        raise RuntimeError(f"Importing {module} took {report['import_ms']:.1f} ms (budget {budget_ms:.1f} ms)")
+    return report
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else 50.0
+    print(check_import_budget(budget))
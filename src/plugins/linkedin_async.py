@@ -0,0 +1,149 @@
+"""
+LinkedIn Templates asyncio API
+Async facade over LinkedInTemplatePlugin for async web stacks: auto-fill with coroutine
+(or sync, offloaded) AI functions, concurrent batch fills, streaming fills and search
+offloaded to a thread when the corpus is large. Cancellation and timeouts reach
+coroutine and async-generator AI calls; a sync AI function already running in a worker
+thread cannot be interrupted, so its result is discarded when it finishes.
+"""
+
+import asyncio
+import inspect
+from contextlib import nullcontext
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from linkedin_ratelimit import RateLimitError, estimate_tokens
+from linkedin_templates import LinkedInTemplatePlugin, render_partial_fill
+
+
+class AsyncLinkedInTemplatePlugin:
+    """asyncio front end for a (shared) LinkedInTemplatePlugin"""
+
+    def __init__(self, plugin: Optional[LinkedInTemplatePlugin] = None, max_concurrency: int = 16,
+                 search_offload_threshold: int = 1000):
+        self.plugin = plugin or LinkedInTemplatePlugin()
+        self.max_concurrency = max_concurrency
+        self.search_offload_threshold = search_offload_threshold
+
+    def __getattr__(self, name):
+        # Cheap synchronous reads (get_categories, fill_template, ...) pass straight through
+        return getattr(self.plugin, name)
+
+    async def _call_ai(self, ai_function, prompt: str, rate_limiter=None) -> str:
+        """Call a coroutine, async-generator or sync ai_function without blocking the loop"""
+        if isinstance(ai_function, (list, tuple, dict)):
+            ai_function = self.plugin.get_hedged_ai_function(ai_function)
+
+        attempts = 0
+        while True:
+            try:
+                if rate_limiter is None:
+                    return await _invoke(ai_function, prompt)
+                # Holds one of the provider's max_concurrent slots for the duration of the call
+                async with rate_limiter.async_slot(estimate_tokens(prompt) + rate_limiter.max_output_tokens):
+                    return await _invoke(ai_function, prompt)
+            except Exception as e:
+                if rate_limiter is None or not isinstance(e, RateLimitError) or attempts >= 3:
+                    raise
+                rate_limiter.penalize(e.retry_after)
+                attempts += 1
+
+    async def auto_fill(self, category: str, index: int, context: Dict[str, str], ai_function=None,
+                        timeout: Optional[float] = None, rate_limiter=None) -> str:
+        """Auto-fill a template; placeholders are generated concurrently"""
+        if ai_function is None:
+            raise ValueError("AI function must be provided for auto-fill functionality")
+
+        placeholders = list(dict.fromkeys(self.plugin.get_template_placeholders(category, index)))
+        template = self.plugin.templates[category][index]
+
+        async def fill() -> str:
+            values = await asyncio.gather(*(
+                self._call_ai(ai_function, self.plugin.build_fill_prompt(placeholder, context, template), rate_limiter)
+                for placeholder in placeholders
+            ))
+            return self.plugin.fill_template(category, index, dict(zip(placeholders, values)))
+
+        return await asyncio.wait_for(fill(), timeout) if timeout else await fill()
+
+    async def iter_auto_fill(self, category: str, index: int, context: Dict[str, str],
+                             ai_function=None, rate_limiter=None) -> AsyncIterator[Dict]:
+        """Async streaming fill: yields the same events as iter_fill_template
+
+        Async-generator ai_functions stream chunk by chunk; other kinds yield once per placeholder.
+        """
+        if ai_function is None:
+            raise ValueError("AI function must be provided for auto-fill functionality")
+
+        template = self.plugin.templates[category][index]
+        values: Dict[str, str] = {}
+
+        for placeholder in dict.fromkeys(self.plugin.get_template_placeholders(category, index)):
+            prompt = self.plugin.build_fill_prompt(placeholder, context, template)
+            if inspect.isasyncgenfunction(ai_function):
+                slot = (rate_limiter.async_slot(estimate_tokens(prompt) + rate_limiter.max_output_tokens)
+                        if rate_limiter is not None else nullcontext())
+                partial = ""
+                async with slot:
+                    async for chunk in ai_function(prompt):
+                        partial += chunk
+                        yield {"placeholder": placeholder, "chunk": chunk, "values": dict(values),
+                               "text": render_partial_fill(template, values, placeholder, partial), "done": False}
+                values[placeholder] = partial.strip()
+                continue
+
+            values[placeholder] = await self._call_ai(ai_function, prompt, rate_limiter)
+            yield {"placeholder": placeholder, "chunk": values[placeholder], "values": dict(values),
+                   "text": render_partial_fill(template, values), "done": False}
+
+        yield {"placeholder": None, "chunk": None, "values": dict(values),
+               "text": render_partial_fill(template, values), "done": True}
+
+    async def batch_fill(self, requests: Iterable[Union[Dict, Tuple[str, int, Dict[str, str]]]], ai_function=None,
+                         concurrency: Optional[int] = None, timeout: Optional[float] = None,
+                         rate_limiter=None) -> List[Union[str, Exception]]:
+        """
+        Fill many templates on one event loop, at most `concurrency` at a time.
+
+        requests are (category, index, context) tuples or dicts with those keys. Results come
+        back in request order; a failed or timed-out fill is returned as its exception.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+
+        async def one(request):
+            if isinstance(request, dict):
+                category, index, context = request["category"], request["index"], request.get("context", {})
+            else:
+                category, index, context = request
+            async with semaphore:
+                return await self.auto_fill(category, index, context, ai_function, timeout, rate_limiter)
+
+        return await asyncio.gather(*(one(request) for request in requests), return_exceptions=True)
+
+    async def search(self, keyword: str, categories: Optional[List[str]] = None) -> List[Dict]:
+        """Search templates; large corpora are scanned in a worker thread"""
+        total = sum(len(templates) for templates in self.plugin.templates.values())
+        if total < self.search_offload_threshold:
+            return self.plugin.search_templates(keyword, categories)
+        return await asyncio.to_thread(self.plugin.search_templates, keyword, categories)
+
+
+async def _invoke(ai_function, prompt: str) -> str:
+    if hasattr(ai_function, "acall"):
+        value = await ai_function.acall(prompt)
+    elif inspect.iscoroutinefunction(ai_function) or inspect.isasyncgenfunction(ai_function):
+        value = ai_function(prompt)
+    else:
+        # Streams from sync providers are read in the worker thread, not on the event loop
+        return await asyncio.to_thread(_call_and_join, ai_function, prompt)
+
+    if inspect.isawaitable(value):
+        value = await value
+    if hasattr(value, "__aiter__"):
+        return "".join([chunk async for chunk in value]).strip()
+    return value if isinstance(value, str) else "".join(value).strip()
+
+
+def _call_and_join(ai_function, prompt: str) -> str:
+    value = ai_function(prompt)
+    return value if isinstance(value, str) else "".join(value).strip()
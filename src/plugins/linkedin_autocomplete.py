@@ -0,0 +1,160 @@
+"""
+LinkedIn Template Autocomplete
+Prefix trie over template titles, category names, tags and hashtags for search-as-you-type.
+Every trie node keeps its own top-k completions, so a lookup walks the prefix and returns
+a precomputed list: its cost depends on the prefix length, not on the corpus size.
+Phrases are indexed from every word, so "lead" completes "Thought Leadership".
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from linkedin_search import ENGAGEMENT_RANK
+from linkedin_templates import extract_hashtags
+
+KINDS = ("title", "category", "tag", "hashtag")
+
+
+@dataclass(frozen=True)
+class Completion:
+    """One autocomplete suggestion"""
+    text: str
+    kind: str
+    score: float
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[int] = []  # entry ids, best first
+
+
+class AutocompleteIndex:
+    """Prefix trie with per-node top-k lists, ranked by score (popularity or engagement)"""
+
+    def __init__(self, k: int = 10):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self._root = _Node()
+        self._entries: List[List] = []  # [text, kind, score]
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._paths: List[List[_Node]] = []  # entry id -> nodes whose top list may hold it
+
+    @classmethod
+    def from_plugin(cls, plugin, k: int = 10) -> "AutocompleteIndex":
+        """Index a LinkedInTemplatePlugin: titles by engagement, categories by size, hashtags by use"""
+        index = cls(k)
+        for category, templates in plugin.templates.items():
+            index.add(category, "category", len(templates))
+            for i, template in enumerate(templates):
+                index.add_template(plugin.metadata[category][i].title, plugin.metadata[category][i].engagement_level,
+                                   extract_hashtags(template))
+        return index
+
+    @classmethod
+    def from_template_store(cls, store, k: int = 10) -> "AutocompleteIndex":
+        """Index TemplateStore data: titles by engagement, categories by size, tags and hashtags by use"""
+        index = cls(k)
+        for category_id, category in store.TEMPLATE_CATEGORIES.items():
+            templates = store.TEMPLATE_STRUCTURES.get(category_id, [])
+            index.add(category["name"], "category", len(templates))
+            for tag in category["tags"]:
+                index.add(tag, "tag", 1, accumulate=True)
+            for template in templates:
+                index.add_template(template["title"], template.get("engagement", "Medium"),
+                                   extract_hashtags(template.get("hashtags", "")))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_template(self, title: str, engagement_level: str, hashtags: Iterable[str]):
+        """Index one template's title and hashtags"""
+        self.add(title, "title", ENGAGEMENT_RANK.get(engagement_level, 1))
+        for hashtag in hashtags:
+            self.add(hashtag, "hashtag", 1, accumulate=True)
+
+    def add(self, text: str, kind: str, score: float = 1.0, accumulate: bool = False):
+        """Add a completion, or raise its score (accumulate=True adds to it instead)"""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown completion kind '{kind}'. Available kinds: {list(KINDS)}")
+        key = (text.lower(), kind)
+        entry_id = self._ids.get(key)
+        if entry_id is None:
+            entry_id = len(self._entries)
+            self._ids[key] = entry_id
+            self._entries.append([text, kind, score])
+            self._paths.append(self._insert_paths(text))
+        else:
+            entry = self._entries[entry_id]
+            entry[2] = entry[2] + score if accumulate else max(entry[2], score)
+        self._rerank(entry_id)
+
+    def record_selection(self, text: str, kind: Optional[str] = None, weight: float = 1.0):
+        """Count a chosen suggestion towards its popularity"""
+        for entry_kind in ([kind] if kind else KINDS):
+            entry_id = self._ids.get((text.lower(), entry_kind))
+            if entry_id is not None:
+                self._entries[entry_id][2] += weight
+                self._rerank(entry_id)
+                return
+
+    def complete(self, prefix: str, k: Optional[int] = None, kinds: Optional[Iterable[str]] = None) -> List[Completion]:
+        """Top-k completions for a prefix (case-insensitive; matches the start of any word)"""
+        node = self._root
+        for char in " ".join(prefix.lower().split()).lstrip("#"):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        if prefix and prefix[-1].isspace() and node is not self._root:
+            node = node.children.get(" ")
+            if node is None:
+                return []
+
+        allowed = set(kinds) if kinds else None
+        completions = []
+        for entry_id in node.top:
+            text, kind, score = self._entries[entry_id]
+            if allowed is None or kind in allowed:
+                completions.append(Completion(text, kind, score))
+                if len(completions) == (k or self.k):
+                    break
+        return completions
+
+    # Trie maintenance
+
+    def _insert_paths(self, text: str) -> List[_Node]:
+        """Create the trie paths for every word start of text and return their nodes"""
+        words = text.lower().lstrip("#").split()
+        nodes = []
+        seen = set()
+        for start in range(len(words)):
+            node = self._root
+            for char in " ".join(words[start:]).lstrip("#"):
+                node = node.children.setdefault(char, _Node())
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    nodes.append(node)
+        return nodes
+
+    def _rank_key(self, entry_id: int) -> Tuple[float, str]:
+        text, _, score = self._entries[entry_id]
+        return -score, text.lower()
+
+    def _rerank(self, entry_id: int):
+        """Place an entry in the top lists along its paths (scores only grow, so it can only move up)"""
+        key = self._rank_key(entry_id)
+        for node in self._paths[entry_id]:
+            top = node.top
+            if entry_id in top:
+                top.remove(entry_id)
+            elif len(top) >= self.k and key >= self._rank_key(top[-1]):
+                continue
+            position = 0
+            while position < len(top) and self._rank_key(top[position]) <= key:
+                position += 1
+            top.insert(position, entry_id)
+            del top[self.k:]
@@ -0,0 +1,265 @@
+"""
+LinkedIn Templates CLI
+Command-line entry point for offline jobs: search, fill, batch fill, random picks,
+export and placeholder listing. Run from src/plugins (or with it on PYTHONPATH):
+
+    python -m linkedin_cli search leadership --category Leadership
+    python -m linkedin_cli -o filled.jsonl batch-fill jobs.jsonl
+    python -m linkedin_cli --timing --budget-ms 50 random --count 5 --weighted --seed 7
+    python -m linkedin_cli replay-bench fills.jsonl.gz --fills 200 --concurrency 16 --latency-scale 0.1
+
+The plugin module is imported only after arguments are parsed, and output is streamed
+line by line.
+"""
+
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import json
+import os
+import sys
+
+
+def _load_plugin(args):
+    # Importing the module dominates startup; building the corpus from it is cheaper than loading a cache
+    from linkedin_templates import LinkedInTemplatePlugin
+
+    return LinkedInTemplatePlugin()
+
+
+def _emit(out, record):
+    out.write(json.dumps(record, ensure_ascii=False))
+    out.write("\n")
+
+
+def _open_input(path):
+    return sys.stdin if path in (None, "-") else open(path, encoding="utf-8")
+
+
+def _open_output(path):
+    return sys.stdout if path in (None, "-") else open(path, "w", encoding="utf-8")
+
+
+def _parse_values(pairs):
+    values = {}
+    for pair in pairs or []:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"Invalid --value '{pair}', expected name=value")
+        values[name] = value
+    return values
+
+
+def cmd_search(plugin, args, out):
+    for result in plugin.search_templates(args.keyword, args.category or None):
+        _emit(out, {"category": result["category"], "index": result["index"], "template": result["template"]})
+
+
+def cmd_fill(plugin, args, out):
+    values = _parse_values(args.value)
+    if args.values_json:
+        values.update(json.loads(args.values_json))
+    out.write(plugin.fill_template(args.category, args.index, values))
+    out.write("\n")
+
+
+def cmd_batch_fill(plugin, args, out):
+    """Each input line: {"category": ..., "index": ..., "values": {...}} (extra keys are passed through)"""
+    failed = 0
+
+    def filled(lines):
+        nonlocal failed
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise TypeError("Each line must be a JSON object")
+                values = job.get("values", {})
+                if not isinstance(values, dict):
+                    raise TypeError("values must be a JSON object")
+                job["text"] = plugin.fill_template(job["category"], int(job["index"]), values)
+            except (ValueError, KeyError, TypeError) as e:
+                failed += 1
+                job = {"line": line_number, "error": str(e)}
+            yield job
+
+    with _open_input(args.input) as lines:
+        jobs = filled(lines)
+        if args.check:
+            from linkedin_quality import iter_checked
+
+            for job, quality in iter_checked(jobs, text=lambda job: job.get("text", "")):
+                if "text" in job:
+                    job["quality"] = quality
+                _emit(out, job)
+        else:
+            for job in jobs:
+                _emit(out, job)
+    if failed:
+        print(f"{failed} line(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_random(plugin, args, out):
+    if args.seed is not None or args.weighted:
+        # --seed alone keeps uniform draws; only --weighted weights by engagement
+        sampler = plugin.get_sampler(weights=None if args.weighted else (lambda meta: 1.0), seed=args.seed)
+        if args.category and args.category not in plugin.templates:
+            raise ValueError(f"Category '{args.category}' not found")
+        picks = (sampler.draw(args.category) for _ in range(args.count))
+    else:
+        picks = (plugin.get_random_template(args.category) for _ in range(args.count))
+    for pick in picks:
+        _emit(out, {"category": pick["category"], "index": pick["index"], "template": pick["template"]})
+
+
+def cmd_export(plugin, args, out):
+    if args.shards:
+        manifest = plugin.export_shards(args.shards)
+        print(f"{len(manifest['shards'])} shards written to {args.shards} (etag {manifest['etag']})", file=sys.stderr)
+        return
+    out.write(plugin.export_to_json())
+    out.write("\n")
+
+
+def cmd_placeholders(plugin, args, out):
+    if args.index is not None:
+        for placeholder in plugin.get_template_placeholders(args.category, args.index):
+            out.write(placeholder + "\n")
+        return
+    categories = [args.category] if args.category else plugin.get_categories()
+    for category in categories:
+        for i in range(len(plugin.get_templates(category))):
+            _emit(out, {"category": category, "index": i, "placeholders": plugin.get_template_placeholders(category, i)})
+
+
+def cmd_replay_bench(plugin, args, out):
+    """Auto-fill templates against a recorded provider and report throughput"""
+    import asyncio
+
+    from linkedin_async import AsyncLinkedInTemplatePlugin
+    from linkedin_replay import ReplayProvider
+
+    replay = ReplayProvider(args.recording, latency_scale=args.latency_scale, latency=args.latency,
+                            on_miss=args.on_miss, seed=args.seed)
+    refs = [(category, i) for category in plugin.get_categories() for i in range(len(plugin.get_templates(category)))]
+    context = json.loads(args.context_json) if args.context_json else {}
+    requests = [(*refs[n % len(refs)], context) for n in range(args.fills)]
+
+    started = time.perf_counter()
+    results = asyncio.run(AsyncLinkedInTemplatePlugin(plugin).batch_fill(
+        requests, replay, concurrency=args.concurrency
+    ))
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for result in results if isinstance(result, Exception))
+    _emit(out, {
+        "fills": len(results),
+        "failed": failed,
+        "seconds": round(elapsed, 4),
+        "fills_per_second": round(len(results) / elapsed, 2) if elapsed else None,
+        "replay": replay.stats(),
+        "prompt_cache": plugin.prompt_cache_stats()
+    })
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="linkedin_cli", description="LinkedIn templates command-line tools")
+    parser.add_argument("-o", "--output", metavar="PATH", help="Write output to a file instead of stdout")
+    parser.add_argument("--timing", action="store_true", help="Report cold-start and command time on stderr")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 3 if startup exceeds this many milliseconds")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Search templates by keyword (JSON lines)")
+    search.add_argument("keyword")
+    search.add_argument("--category", action="append", help="Restrict to a category (repeatable)")
+    search.set_defaults(handler=cmd_search)
+
+    fill = commands.add_parser("fill", help="Fill one template")
+    fill.add_argument("category")
+    fill.add_argument("index", type=int)
+    fill.add_argument("--value", action="append", metavar="NAME=VALUE", help="Placeholder value (repeatable)")
+    fill.add_argument("--values-json", help="Placeholder values as a JSON object")
+    fill.set_defaults(handler=cmd_fill)
+
+    batch = commands.add_parser("batch-fill", help="Fill templates from JSON lines (file or stdin)")
+    batch.add_argument("input", nargs="?", default="-")
+    batch.add_argument("--check", action="store_true",
+                       help="Add quality metrics (leftover placeholders, length, fold, hashtags) to each line")
+    batch.set_defaults(handler=cmd_batch_fill)
+
+    random_cmd = commands.add_parser("random", help="Pick random templates (JSON lines)")
+    random_cmd.add_argument("--category")
+    random_cmd.add_argument("--count", type=int, default=1)
+    random_cmd.add_argument("--weighted", action="store_true", help="Weight by engagement level")
+    random_cmd.add_argument("--seed", type=int, help="Reproducible picks (uniform unless --weighted is given)")
+    random_cmd.set_defaults(handler=cmd_random)
+
+    export = commands.add_parser("export", help="Export the corpus as JSON")
+    export.add_argument("--shards", metavar="DIR",
+                        help="Write one content-hashed file per category plus manifest.json to DIR")
+    export.set_defaults(handler=cmd_export)
+
+    placeholders = commands.add_parser("placeholders", help="List placeholders of one template or of a corpus slice")
+    placeholders.add_argument("category", nargs="?")
+    placeholders.add_argument("index", nargs="?", type=int)
+    placeholders.set_defaults(handler=cmd_placeholders)
+
+    replay = commands.add_parser("replay-bench", help="Benchmark AI auto-fill offline against a recorded provider")
+    replay.add_argument("recording", help="Recording written by linkedin_replay.AIRecorder")
+    replay.add_argument("--fills", type=int, default=100, help="Templates to fill (corpus order, wrapping around)")
+    replay.add_argument("--concurrency", type=int, default=16)
+    replay.add_argument("--latency-scale", type=float, default=1.0, help="Multiply recorded latencies (0 disables)")
+    replay.add_argument("--latency", choices=["original", "sampled"], default="original",
+                        help="Per-prompt recorded latency, or draws from the recorded distribution")
+    replay.add_argument("--on-miss", choices=["error", "any"], default="error",
+                        help="For prompts not in the recording: fail, or serve any recorded call")
+    replay.add_argument("--context-json", help="Fill context as a JSON object (must match the recording's)")
+    replay.add_argument("--seed", type=int, default=0)
+    replay.set_defaults(handler=cmd_replay_bench)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    loaded = time.perf_counter()
+    plugin = _load_plugin(args)
+    ready = time.perf_counter()
+    startup_ms = (ready - _STARTED) * 1000
+
+    out = _open_output(args.output)
+    try:
+        status = args.handler(plugin, args, out) or 0
+        out.flush()
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        status = 2
+    except BrokenPipeError:
+        # Downstream closed the pipe (e.g. `| head`); stop quietly like other shell tools
+        sys.stdout = open(os.devnull, "w")
+        status = 0
+    finally:
+        if out is not sys.stdout and out is not sys.__stdout__:
+            out.close()
+
+    if args.timing:
+        print(
+            f"startup {startup_ms:.1f} ms (corpus load {(ready - loaded) * 1000:.1f} ms), "
+            f"command {(time.perf_counter() - ready) * 1000:.1f} ms",
+            file=sys.stderr
+        )
+    if args.budget_ms is not None and startup_ms > args.budget_ms:
+        print(f"startup budget exceeded: {startup_ms:.1f} ms > {args.budget_ms:.1f} ms", file=sys.stderr)
+        return status or 3
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
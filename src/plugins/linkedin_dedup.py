@@ -0,0 +1,209 @@
+"""
+LinkedIn Near-Duplicate Detection
+MinHash signatures with LSH banding over generated posts, partitioned into daily
+segments so "too similar to anything published in the last N days" only probes N
+segments, and old days expire in bulk by dropping whole segments.
+"""
+
+import json
+import re
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SECONDS_PER_DAY = 86400
+
+# Post ids are stored as JSON by save(), so only ids that round-trip unchanged are accepted
+PostId = Union[str, int]
+
+
+def shingles(text: str, size: int = 3) -> List[str]:
+    """Word n-grams of a post (lowercased, punctuation and hashtags' '#' stripped)"""
+    words = re.findall(r'\w+', text.lower())
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+class _Segment:
+    """One day of posts: ids, timestamps, signatures and per-band buckets"""
+
+    def __init__(self, day: int, num_perm: int, bands: int, capacity: int = 256):
+        self.day = day
+        self.ids: List[PostId] = []
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.signatures = np.zeros((capacity, num_perm), dtype=np.uint32)
+        # band hash -> row, or list of rows on collision
+        self.buckets: List[Dict[int, object]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, post_id: PostId, timestamp: float, signature: np.ndarray, band_hashes: Iterable[int]):
+        row = len(self.ids)
+        if row == len(self.timestamps):
+            self.timestamps = np.concatenate([self.timestamps, np.zeros_like(self.timestamps)])
+            self.signatures = np.concatenate([self.signatures, np.zeros_like(self.signatures)])
+        self.ids.append(post_id)
+        self.timestamps[row] = timestamp
+        self.signatures[row] = signature
+        for bucket, key in zip(self.buckets, band_hashes):
+            existing = bucket.get(key)
+            if existing is None:
+                bucket[key] = row
+            elif isinstance(existing, list):
+                existing.append(row)
+            else:
+                bucket[key] = [existing, row]
+
+    def candidates(self, band_hashes: Iterable[int]) -> set:
+        rows = set()
+        for bucket, key in zip(self.buckets, band_hashes):
+            hit = bucket.get(key)
+            if hit is None:
+                continue
+            if isinstance(hit, list):
+                rows.update(hit)
+            else:
+                rows.add(hit)
+        return rows
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index answering "is this post too similar to a recent one?"
+
+    With the default 128 permutations in 16 bands of 8 rows, a pair with Jaccard
+    similarity s shares a bucket with probability 1 - (1 - s**8)**16: about 0.95 at
+    the default 0.8 threshold, 0.61 at 0.7 and 0.24 at 0.6. Candidates are then
+    verified against the full signature before being reported.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, threshold: float = 0.8,
+                 shingle_size: int = 3, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) % _MERSENNE_PRIME
+        self._b = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) % _MERSENNE_PRIME
+        self._band_mix = rng.randint(1, np.iinfo(np.int64).max, size=self.rows, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+        self._segments: Dict[int, _Segment] = {}
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments.values())
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature (uint32 array of num_perm values)"""
+        tokens = shingles(text, self.shingle_size)
+        if not tokens:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in tokens), dtype=np.uint64, count=len(tokens))
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        """64-bit hash per band; works on one signature or a (n, num_perm) matrix"""
+        banded = signatures.astype(np.uint64).reshape(signatures.shape[:-1] + (self.bands, self.rows))
+        with np.errstate(over="ignore"):
+            return (banded * self._band_mix).sum(axis=-1)
+
+    def add(self, post_id: PostId, text: str, timestamp: Optional[float] = None) -> np.ndarray:
+        """Index a published post; returns its signature"""
+        signature = self.signature(text)
+        self.add_signature(post_id, signature, timestamp)
+        return signature
+
+    def add_signature(self, post_id: PostId, signature: np.ndarray, timestamp: Optional[float] = None):
+        """Index a precomputed signature; post_id must be a str or int so save() and load() round-trip it"""
+        if isinstance(post_id, bool) or not isinstance(post_id, (str, int)):
+            raise ValueError(f"Post id must be a str or int, got {type(post_id).__name__}")
+        timestamp = time.time() if timestamp is None else timestamp
+        day = int(timestamp // _SECONDS_PER_DAY)
+        segment = self._segments.get(day)
+        if segment is None:
+            segment = self._segments[day] = _Segment(day, self.num_perm, self.bands)
+        segment.append(post_id, timestamp, signature, self._band_hashes(signature).tolist())
+
+    def find_similar(self, text: str, days: int = 30, threshold: Optional[float] = None,
+                     now: Optional[float] = None) -> List[Tuple[PostId, float]]:
+        """Posts from the last `days` days with estimated Jaccard similarity >= threshold, most similar first"""
+        return self.find_similar_signature(self.signature(text), days, threshold, now)
+
+    def find_similar_signature(self, signature: np.ndarray, days: int = 30, threshold: Optional[float] = None,
+                               now: Optional[float] = None) -> List[Tuple[PostId, float]]:
+        threshold = self.threshold if threshold is None else threshold
+        now = time.time() if now is None else now
+        cutoff = now - days * _SECONDS_PER_DAY
+        band_hashes = self._band_hashes(signature).tolist()
+
+        matches = []
+        for day in range(int(cutoff // _SECONDS_PER_DAY), int(now // _SECONDS_PER_DAY) + 1):
+            segment = self._segments.get(day)
+            if segment is None:
+                continue
+            rows = [row for row in segment.candidates(band_hashes) if segment.timestamps[row] >= cutoff]
+            if not rows:
+                continue
+            similarity = (segment.signatures[rows] == signature).mean(axis=1)
+            matches.extend(
+                (segment.ids[row], float(score)) for row, score in zip(rows, similarity) if score >= threshold
+            )
+
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def is_duplicate(self, text: str, days: int = 30, threshold: Optional[float] = None,
+                     now: Optional[float] = None) -> bool:
+        """True if the post is too similar to anything indexed in the last `days` days"""
+        return bool(self.find_similar(text, days, threshold, now))
+
+    def expire(self, older_than_days: int, now: Optional[float] = None) -> int:
+        """Drop every daily segment older than the window; returns the number of posts removed"""
+        now = time.time() if now is None else now
+        oldest_day = int((now - older_than_days * _SECONDS_PER_DAY) // _SECONDS_PER_DAY)
+        expired = [day for day in self._segments if day < oldest_day]
+        removed = sum(len(self._segments.pop(day)) for day in expired)
+        return removed
+
+    def save(self, path: str):
+        """Persist signatures compactly (buckets are rebuilt on load)"""
+        arrays = {
+            "config": np.array(json.dumps({
+                "num_perm": self.num_perm, "bands": self.bands, "threshold": self.threshold,
+                "shingle_size": self.shingle_size, "seed": self.seed
+            }))
+        }
+        for day, segment in self._segments.items():
+            size = len(segment)
+            arrays[f"ids_{day}"] = np.array(json.dumps(segment.ids))
+            arrays[f"timestamps_{day}"] = segment.timestamps[:size]
+            arrays[f"signatures_{day}"] = segment.signatures[:size]
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "NearDuplicateIndex":
+        """Load an index saved with save()"""
+        with np.load(path) as data:
+            index = cls(**json.loads(str(data["config"])))
+            days = sorted(int(key.split("_", 1)[1]) for key in data.files if key.startswith("ids_"))
+            for day in days:
+                ids = json.loads(str(data[f"ids_{day}"]))
+                timestamps = data[f"timestamps_{day}"]
+                signatures = data[f"signatures_{day}"]
+                segment = index._segments[day] = _Segment(day, index.num_perm, index.bands, max(1, len(ids)))
+                for post_id, timestamp, signature, band_hashes in zip(
+                    ids, timestamps, signatures, index._band_hashes(signatures).tolist()
+                ):
+                    segment.append(post_id, float(timestamp), signature, band_hashes)
+        return index
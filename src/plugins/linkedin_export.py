@@ -0,0 +1,141 @@
+"""
+LinkedIn Template Sharded Export
+Writes the corpus as one content-hashed JSON file per category plus a small manifest.
+A shard's file name carries its hash, so shards are immutable and cacheable forever;
+the manifest (served with its own ETag) tells clients which shards changed, and they
+fetch only those instead of re-downloading the whole library.
+
+    out/
+        manifest.json                     {"etag": ..., "shards": {category: {"file", "hash", ...}}, "retained": [...]}
+        leadership.3f9c2a1b7d04e6aa.json  {"category": ..., "templates": [...], "metadata": [...]}
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+HASH_LENGTH = 16
+SHARD_FILE_PATTERN = re.compile(rf'^[a-z0-9-]+\.[0-9a-f]{{{HASH_LENGTH}}}\.json$')
+
+
+def metadata_to_dict(meta) -> Dict:
+    """JSON form of TemplateMetadata, as in export_to_json"""
+    return {
+        "category": meta.category,
+        "index": meta.index,
+        "title": meta.title,
+        "description": meta.description,
+        "placeholders": list(meta.placeholders),
+        "estimated_length": meta.estimated_length,
+        "engagement_level": meta.engagement_level
+    }
+
+
+def canonical_json(data) -> bytes:
+    """Deterministic encoding, so identical content always hashes (and diffs) the same"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def shard_filename(category: str, digest: str) -> str:
+    slug = re.sub(r'[^a-z0-9]+', '-', category.lower()).strip('-') or "category"
+    return f"{slug}.{digest}.json"
+
+
+def build_shards(plugin) -> Dict[str, bytes]:
+    """Encode every category of a plugin as a canonical JSON shard"""
+    return {
+        category: canonical_json({
+            "category": category,
+            "templates": list(templates),
+            "metadata": [metadata_to_dict(meta) for meta in plugin.metadata[category]]
+        })
+        for category, templates in plugin.templates.items()
+    }
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def export_shards(plugin, directory: str, prune: bool = True) -> Dict:
+    """
+    Write changed category shards and a fresh manifest to directory; returns the manifest.
+
+    Unchanged shards already on disk are not rewritten. With prune, shard files referenced by
+    neither the new manifest nor the one it replaces are removed once the new manifest is in
+    place; the replaced manifest's shards are listed under "retained" so clients still holding
+    it can finish fetching, and are pruned by the next export that changes the corpus.
+    """
+    os.makedirs(directory, exist_ok=True)
+    previous = load_manifest(directory)
+    shards = {}
+    for category, data in build_shards(plugin).items():
+        digest = content_hash(data)
+        filename = shard_filename(category, digest)
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            _write_atomic(path, data)
+        shards[category] = {
+            "file": filename,
+            "hash": digest,
+            "bytes": len(data),
+            "templates": len(plugin.templates[category])
+        }
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "etag": content_hash(canonical_json({category: shard["hash"] for category, shard in shards.items()})),
+        "categories": list(shards),
+        "total_templates": sum(shard["templates"] for shard in shards.values()),
+        "shards": shards
+    }
+    referenced = {shard["file"] for shard in shards.values()}
+    if previous is None:
+        retained = []
+    elif previous.get("etag") == manifest["etag"]:
+        # Re-exporting unchanged content must not cut short the grace period of older shards
+        retained = previous.get("retained", [])
+    else:
+        retained = sorted({shard["file"] for shard in previous.get("shards", {}).values()} - referenced)
+    manifest["retained"] = retained
+    # The manifest goes last, so readers never see it point at a missing shard
+    _write_atomic(os.path.join(directory, MANIFEST_NAME), json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    if prune:
+        keep = referenced.union(retained)
+        for filename in os.listdir(directory):
+            if SHARD_FILE_PATTERN.match(filename) and filename not in keep:
+                os.remove(os.path.join(directory, filename))
+    return manifest
+
+
+def load_manifest(directory: str) -> Optional[Dict]:
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def diff_manifests(old: Optional[Dict], new: Dict) -> Dict[str, List[str]]:
+    """Categories a client holding `old` must fetch (changed) or drop (removed) to match `new`"""
+    old_shards = (old or {}).get("shards", {})
+    new_shards = new["shards"]
+    return {
+        "changed": [
+            category for category, shard in new_shards.items()
+            if old_shards.get(category, {}).get("hash") != shard["hash"]
+        ],
+        "removed": [category for category in old_shards if category not in new_shards]
+    }
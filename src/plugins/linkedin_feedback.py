@@ -0,0 +1,246 @@
+"""
+LinkedIn Engagement Feedback
+Append-only store of real post outcomes (impressions, reactions, comments) per template,
+with running aggregates updated in O(1) per event: totals, smoothed engagement rates and
+exponentially decayed scores. Readers (ranking, sampling, filtering) use the aggregates
+and never scan raw events.
+
+On disk a store is a directory with an append-only event log and a snapshot of the
+aggregates. compact() folds the log into a new snapshot; events carry sequence numbers,
+so a crash between writing the snapshot and truncating the log never double-counts.
+
+    feedback/
+        snapshot.json   aggregates as of sequence number N
+        events.log      [seq, template, kind, count, timestamp] JSON lines after N
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Hashable, Iterator, List, Optional
+
+EVENT_KINDS = ("impression", "reaction", "comment")
+# Comments signal more engagement than reactions
+INTERACTION_WEIGHTS = {"reaction": 1.0, "comment": 3.0}
+
+# Live level relative to the corpus-wide engagement rate
+LEVEL_THRESHOLDS = (("High", 1.5), ("Medium-High", 1.15), ("Medium", 0.75))
+
+SNAPSHOT_NAME = "snapshot.json"
+LOG_NAME = "events.log"
+
+
+class EngagementStats:
+    """Running aggregates for one template (or the whole corpus)"""
+
+    __slots__ = ("impressions", "reactions", "comments", "decayed_impressions", "decayed_interactions", "updated_at")
+
+    def __init__(self, impressions=0, reactions=0, comments=0, decayed_impressions=0.0, decayed_interactions=0.0,
+                 updated_at=0.0):
+        self.impressions = impressions
+        self.reactions = reactions
+        self.comments = comments
+        self.decayed_impressions = decayed_impressions
+        self.decayed_interactions = decayed_interactions
+        self.updated_at = updated_at
+
+    def add(self, kind: str, count: int, timestamp: float, half_life: float):
+        # Decay both counters to `timestamp`, then add: O(1) whatever the history length
+        if timestamp > self.updated_at:
+            factor = 0.5 ** ((timestamp - self.updated_at) / half_life)
+            self.decayed_impressions *= factor
+            self.decayed_interactions *= factor
+            self.updated_at = timestamp
+        if kind == "impression":
+            self.impressions += count
+            self.decayed_impressions += count
+        else:
+            if kind == "reaction":
+                self.reactions += count
+            else:
+                self.comments += count
+            self.decayed_interactions += INTERACTION_WEIGHTS[kind] * count
+
+    def to_list(self) -> List:
+        return [getattr(self, name) for name in self.__slots__]
+
+
+class FeedbackStore:
+    """Per-template engagement aggregates fed by an append-only event log"""
+
+    def __init__(self, directory: Optional[str] = None, half_life_days: float = 14.0,
+                 prior_impressions: float = 200.0, min_impressions: int = 100, compact_every: int = 10000):
+        self.directory = directory
+        self.half_life = half_life_days * 86400
+        self.prior_impressions = prior_impressions
+        self.min_impressions = min_impressions
+        self.compact_every = compact_every
+        self.version = 0  # bumped on every event, so derived caches know when to refresh
+        self._stats: Dict[Hashable, EngagementStats] = {}
+        self._global = EngagementStats()
+        self._seq = 0
+        self._pending = 0
+        self._lock = threading.RLock()
+        self._log = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+            self._log = open(os.path.join(directory, LOG_NAME), "a", encoding="utf-8")
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    # Recording
+
+    def record(self, template: Hashable, kind: str, count: int = 1, timestamp: Optional[float] = None):
+        """Append one event and update the aggregates in O(1)"""
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown event kind '{kind}'. Available kinds: {list(EVENT_KINDS)}")
+        if count < 0:
+            raise ValueError("count must be non-negative")
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._seq += 1
+            if self._log is not None:
+                self._log.write(json.dumps([self._seq, _encode_key(template), kind, count, timestamp]) + "\n")
+                self._log.flush()
+            self._apply(template, kind, count, timestamp)
+            self._pending += 1
+            if self._log is not None and self._pending >= self.compact_every:
+                self.compact()
+
+    def record_post(self, template: Hashable, impressions: int = 0, reactions: int = 0, comments: int = 0,
+                    timestamp: Optional[float] = None):
+        """Record the outcome counts of one published post"""
+        for kind, count in (("impression", impressions), ("reaction", reactions), ("comment", comments)):
+            if count:
+                self.record(template, kind, count, timestamp)
+
+    def _apply(self, template: Hashable, kind: str, count: int, timestamp: float):
+        stats = self._stats.get(template)
+        if stats is None:
+            stats = self._stats[template] = EngagementStats()
+        stats.add(kind, count, timestamp, self.half_life)
+        self._global.add(kind, count, timestamp, self.half_life)
+        self.version += 1
+
+    # Reading (O(1) per template)
+
+    def stats(self, template: Hashable) -> Optional[EngagementStats]:
+        return self._stats.get(template)
+
+    def global_rate(self) -> float:
+        """Corpus-wide interactions per impression (decayed)"""
+        stats = self._global
+        return stats.decayed_interactions / stats.decayed_impressions if stats.decayed_impressions else 0.0
+
+    def summary(self, template: Hashable) -> Dict:
+        """Totals, mean rates and decayed score of one template"""
+        stats = self._stats.get(template) or EngagementStats()
+        impressions = stats.impressions
+        return {
+            "impressions": impressions,
+            "reactions": stats.reactions,
+            "comments": stats.comments,
+            "reaction_rate": stats.reactions / impressions if impressions else 0.0,
+            "comment_rate": stats.comments / impressions if impressions else 0.0,
+            "score": self.score(template),
+            "level": self.engagement_level(template)
+        }
+
+    def score(self, template: Hashable) -> float:
+        """Decayed interactions per impression, smoothed towards the corpus rate for sparse templates"""
+        stats = self._stats.get(template)
+        prior_rate = self.global_rate()
+        if stats is None:
+            return prior_rate
+        return (stats.decayed_interactions + prior_rate * self.prior_impressions) / (
+            stats.decayed_impressions + self.prior_impressions
+        )
+
+    def relative_score(self, template: Hashable) -> Optional[float]:
+        """score / corpus rate, or None until the template has min_impressions"""
+        stats = self._stats.get(template)
+        global_rate = self.global_rate()
+        if stats is None or stats.impressions < self.min_impressions or not global_rate:
+            return None
+        return self.score(template) / global_rate
+
+    def engagement_level(self, template: Hashable, default: Optional[str] = None) -> Optional[str]:
+        """Live "High" / "Medium-High" / "Medium" / "Low" level, or default without enough data"""
+        relative = self.relative_score(template)
+        if relative is None:
+            return default
+        for level, threshold in LEVEL_THRESHOLDS:
+            if relative >= threshold:
+                return level
+        return "Low"
+
+    def templates(self) -> Iterator[Hashable]:
+        return iter(self._stats)
+
+    # Persistence
+
+    def compact(self):
+        """Write the aggregates as a new snapshot and start an empty event log"""
+        if not self.directory:
+            return
+        with self._lock:
+            snapshot = {
+                "seq": self._seq,
+                "half_life": self.half_life,
+                "global": self._global.to_list(),
+                "templates": [[_encode_key(key), stats.to_list()] for key, stats in self._stats.items()]
+            }
+            path = os.path.join(self.directory, SNAPSHOT_NAME)
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(f"{path}.tmp", path)
+
+            if self._log is not None:
+                self._log.close()
+            self._log = open(os.path.join(self.directory, LOG_NAME), "w", encoding="utf-8")
+            self._pending = 0
+
+    def _load(self):
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self._seq = snapshot["seq"]
+            self._global = EngagementStats(*snapshot["global"])
+            self._stats = {_decode_key(key): EngagementStats(*values) for key, values in snapshot["templates"]}
+
+        log_path = os.path.join(self.directory, LOG_NAME)
+        if not os.path.exists(log_path):
+            return
+        valid_end = 0
+        with open(log_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final line from a crash mid-write
+                try:
+                    seq, key, kind, count, timestamp = json.loads(line)
+                except ValueError:
+                    break
+                valid_end += len(line)
+                if seq > self._seq:
+                    self._apply(_decode_key(key), kind, count, timestamp)
+                    self._seq = seq
+                    self._pending += 1
+            torn = f.seek(0, os.SEEK_END) > valid_end
+        if torn:
+            # Drop the torn tail so new events are not appended onto it (and lost on the next load)
+            with open(log_path, "r+b") as f:
+                f.truncate(valid_end)
+
+
+def _encode_key(key: Hashable):
+    return list(key) if isinstance(key, tuple) else key
+
+
+def _decode_key(key) -> Hashable:
+    return tuple(key) if isinstance(key, list) else key
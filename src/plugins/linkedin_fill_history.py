@@ -0,0 +1,172 @@
+"""
+LinkedIn Placeholder Fill History
+Per-user history of the values typed into each placeholder ("role", "company",
+"timeframe", ...), so forms can suggest and prefill them. Values are ranked by
+frecency: every use adds 1 to a score that halves every `half_life` fills of that
+user. Each placeholder keeps a small sorted list of lowercased values, so prefix
+lookup is a bisect. Size is bounded at every level (values per placeholder,
+placeholders per user, users) and the lowest-ranked or least recently active
+entries are evicted first.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional
+
+
+class _PlaceholderValues:
+    """Values of one placeholder for one user: {value: [score, last fill]} plus a sorted prefix index"""
+
+    __slots__ = ("values", "keys")
+
+    def __init__(self):
+        self.values: Dict[str, List[float]] = {}
+        self.keys: List[tuple] = []  # sorted (value.lower(), value)
+
+    def add(self, value: str, clock: int, half_life: float, max_values: int):
+        entry = self.values.get(value)
+        if entry is None:
+            self.values[value] = [1.0, clock]
+            insort(self.keys, (value.lower(), value))
+            if len(self.values) > max_values:
+                self._evict(clock, half_life)
+        else:
+            entry[0] = _decayed(entry, clock, half_life) + 1.0
+            entry[1] = clock
+
+    def _evict(self, clock: int, half_life: float):
+        weakest = min(self.values, key=lambda value: (_decayed(self.values[value], clock, half_life), value))
+        del self.values[weakest]
+        self.keys.pop(bisect_left(self.keys, (weakest.lower(), weakest)))
+
+    def ranked(self, prefix: str, clock: int, half_life: float) -> List[str]:
+        prefix = prefix.lower()
+        start = bisect_left(self.keys, (prefix,))
+        matches = []
+        for lowered, value in self.keys[start:]:
+            if not lowered.startswith(prefix):
+                break
+            matches.append(value)
+        return sorted(matches, key=lambda value: -_decayed(self.values[value], clock, half_life))
+
+
+class _UserHistory:
+    __slots__ = ("clock", "placeholders")
+
+    def __init__(self):
+        self.clock = 0  # number of fills recorded for this user
+        self.placeholders: "OrderedDict[str, _PlaceholderValues]" = OrderedDict()
+
+
+class FillHistory:
+    """Bounded per-user, per-placeholder value history with prefix suggestions"""
+
+    def __init__(self, max_users: int = 10000, max_placeholders: int = 50, max_values: int = 20,
+                 max_value_length: int = 200, half_life: float = 10.0):
+        if min(max_users, max_placeholders, max_values, max_value_length) <= 0:
+            raise ValueError("History limits must be positive")
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        self.max_users = max_users
+        self.max_placeholders = max_placeholders
+        self.max_values = max_values
+        self.max_value_length = max_value_length
+        self.half_life = half_life
+        self._users: "OrderedDict[Hashable, _UserHistory]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def users(self) -> int:
+        return len(self._users)
+
+    def record(self, user_id: Hashable, values: Dict[str, str]):
+        """Record one fill (placeholder -> value); empty and over-long values are skipped"""
+        values = {
+            normalize_placeholder(placeholder): value.strip()
+            for placeholder, value in values.items()
+            if value and value.strip() and len(value.strip()) <= self.max_value_length
+        }
+        if not values:
+            return
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None:
+                user = self._users[user_id] = _UserHistory()
+                if len(self._users) > self.max_users:
+                    self._users.popitem(last=False)
+            else:
+                self._users.move_to_end(user_id)
+            user.clock += 1
+            for placeholder, value in values.items():
+                history = user.placeholders.get(placeholder)
+                if history is None:
+                    history = user.placeholders[placeholder] = _PlaceholderValues()
+                    if len(user.placeholders) > self.max_placeholders:
+                        user.placeholders.popitem(last=False)
+                else:
+                    user.placeholders.move_to_end(placeholder)
+                history.add(value, user.clock, self.half_life, self.max_values)
+
+    def suggest(self, user_id: Hashable, placeholder: str, prefix: str = "", k: int = 5) -> List[str]:
+        """Top-k past values of a placeholder starting with prefix (case-insensitive), best first"""
+        with self._lock:
+            user = self._users.get(user_id)
+            history = user.placeholders.get(normalize_placeholder(placeholder)) if user else None
+            if history is None:
+                return []
+            return history.ranked(prefix.strip(), user.clock, self.half_life)[:k]
+
+    def prefill(self, user_id: Hashable, placeholders: Iterable[str]) -> Dict[str, str]:
+        """Best past value for each placeholder that has one"""
+        prefilled = {}
+        for placeholder in placeholders:
+            suggestions = self.suggest(user_id, placeholder, k=1)
+            if suggestions:
+                prefilled[placeholder] = suggestions[0]
+        return prefilled
+
+    def forget_user(self, user_id: Hashable):
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    # Persistence
+
+    def export_state(self, user_id: Hashable) -> Optional[Dict]:
+        """One user's history as plain data (for a user profile store)"""
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None:
+                return None
+            return {
+                "clock": user.clock,
+                "placeholders": {
+                    placeholder: {value: list(entry) for value, entry in history.values.items()}
+                    for placeholder, history in user.placeholders.items()
+                }
+            }
+
+    def load_state(self, user_id: Hashable, state: Dict):
+        user = _UserHistory()
+        user.clock = state["clock"]
+        for placeholder, values in list(state["placeholders"].items())[-self.max_placeholders:]:
+            history = user.placeholders[placeholder] = _PlaceholderValues()
+            for value, (score, last_fill) in values.items():
+                history.values[value] = [score, last_fill]
+            history.keys = sorted((value.lower(), value) for value in history.values)
+            while len(history.values) > self.max_values:
+                history._evict(user.clock, self.half_life)
+        with self._lock:
+            self._users[user_id] = user
+            self._users.move_to_end(user_id)
+            if len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+
+
+def normalize_placeholder(placeholder: str) -> str:
+    """Placeholder names are matched case- and whitespace-insensitively ("Company" == "company ")"""
+    return " ".join(placeholder.lower().split())
+
+
+def _decayed(entry: List[float], clock: int, half_life: float) -> float:
+    return entry[0] * 0.5 ** ((clock - entry[1]) / half_life)
@@ -0,0 +1,147 @@
+"""
+LinkedIn Hashtag Index
+Hashtag -> templates index with a NumPy co-occurrence matrix for related-hashtag suggestions.
+Works with the plugin templates (inline hashtags) and the TemplateStore `hashtags` field.
+"""
+
+import re
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from linkedin_templates import extract_hashtags
+
+
+class HashtagIndex:
+    """Inverted index from hashtag to template keys, plus an incremental co-occurrence matrix"""
+
+    def __init__(self, initial_capacity: int = 64):
+        self._tag_ids: Dict[str, int] = {}       # normalized tag -> row/column in the matrix
+        self._labels: List[str] = []             # display form of each tag ("#PersonalGrowth")
+        self._templates: List[Set[Hashable]] = []  # tag id -> template keys
+        self._template_tags: Dict[Hashable, Tuple[int, ...]] = {}
+        self._cooccurrence = np.zeros((initial_capacity, initial_capacity), dtype=np.int32)
+
+    @classmethod
+    def from_plugin(cls, plugin) -> "HashtagIndex":
+        """Build an index over LinkedInTemplatePlugin templates, keyed by (category, index)"""
+        index = cls()
+        for category, templates in plugin.templates.items():
+            for i, template in enumerate(templates):
+                index.add_template((category, i), extract_hashtags(template))
+        return index
+
+    @classmethod
+    def from_template_store(cls, store) -> "HashtagIndex":
+        """Build an index over TemplateStore structures, keyed by template id"""
+        index = cls()
+        for templates in store.TEMPLATE_STRUCTURES.values():
+            for template in templates:
+                index.add_template(template["id"], extract_hashtags(template.get("hashtags", "")))
+        return index
+
+    @staticmethod
+    def _normalize(hashtag: str) -> str:
+        return hashtag.lstrip("#").lower()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, hashtag: str) -> bool:
+        return self._normalize(hashtag) in self._tag_ids
+
+    @property
+    def hashtags(self) -> List[str]:
+        """All indexed hashtags in insertion order"""
+        return list(self._labels)
+
+    def _tag_id(self, hashtag: str) -> int:
+        key = self._normalize(hashtag)
+        tag_id = self._tag_ids.get(key)
+        if tag_id is None:
+            tag_id = len(self._labels)
+            self._tag_ids[key] = tag_id
+            self._labels.append(hashtag if hashtag.startswith("#") else f"#{hashtag}")
+            self._templates.append(set())
+            self._ensure_capacity(tag_id + 1)
+        return tag_id
+
+    def _ensure_capacity(self, size: int):
+        capacity = self._cooccurrence.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity += max(1, capacity // 2)
+        grown = np.zeros((capacity, capacity), dtype=self._cooccurrence.dtype)
+        old = self._cooccurrence.shape[0]
+        grown[:old, :old] = self._cooccurrence
+        self._cooccurrence = grown
+
+    def add_template(self, key: Hashable, hashtags: Iterable[str]):
+        """Index a template's hashtags and update co-occurrence counts incrementally"""
+        if key in self._template_tags:
+            self.remove_template(key)
+
+        ids = tuple(sorted({self._tag_id(tag) for tag in hashtags}))
+        self._template_tags[key] = ids
+        for tag_id in ids:
+            self._templates[tag_id].add(key)
+
+        if ids:
+            idx = np.asarray(ids)
+            self._cooccurrence[np.ix_(idx, idx)] += 1
+
+    def remove_template(self, key: Hashable):
+        """Remove a template from the index (its hashtags stay in the vocabulary)"""
+        ids = self._template_tags.pop(key, ())
+        for tag_id in ids:
+            self._templates[tag_id].discard(key)
+
+        if ids:
+            idx = np.asarray(ids)
+            self._cooccurrence[np.ix_(idx, idx)] -= 1
+
+    def templates_for(self, hashtag: str) -> List[Hashable]:
+        """Get the keys of all templates using a hashtag"""
+        tag_id = self._tag_ids.get(self._normalize(hashtag))
+        if tag_id is None:
+            return []
+        return list(self._templates[tag_id])
+
+    def frequency(self, hashtag: str) -> int:
+        """Number of templates using a hashtag"""
+        tag_id = self._tag_ids.get(self._normalize(hashtag))
+        return 0 if tag_id is None else int(self._cooccurrence[tag_id, tag_id])
+
+    def related(self, hashtags: Iterable[str], k: int = 5) -> List[Tuple[str, int]]:
+        """Top-k hashtags co-occurring with the given set, as (hashtag, count) pairs"""
+        ids = [self._tag_ids[key] for key in {self._normalize(tag) for tag in hashtags} if key in self._tag_ids]
+        if not ids or k <= 0:
+            return []
+
+        size = len(self._labels)
+        scores = self._cooccurrence[ids, :size].sum(axis=0)
+        scores[ids] = 0
+
+        k = min(k, size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._labels[i], int(scores[i])) for i in top if scores[i] > 0]
+
+    def suggest_for_text(self, text: str, k: int = 5) -> List[Tuple[str, int]]:
+        """Suggest hashtags for a post from its own hashtags and words matching known hashtags"""
+        seeds = {self._normalize(tag) for tag in extract_hashtags(text)}
+        words = set(re.findall(r'\w+', text.lower()))
+        seeds.update(word for word in words if word in self._tag_ids)
+
+        suggestions = self.related(seeds, k)
+        # Words that are hashtags but not yet written as one are good suggestions too
+        written = {self._normalize(tag) for tag in extract_hashtags(text)}
+        matched = [
+            (self._labels[self._tag_ids[word]], self.frequency(word))
+            for word in sorted(seeds - written)
+        ]
+        suggested = {tag for tag, _ in suggestions}
+        merged = suggestions + [item for item in matched if item[0] not in suggested]
+        merged.sort(key=lambda item: -item[1])
+        return merged[:k]
@@ -0,0 +1,286 @@
+"""
+LinkedIn Hedged AI Calls
+Sends a prompt to a ranked set of providers: the primary first, then a hedged duplicate
+to the next provider if no good answer arrived within an adaptive delay. The first good
+answer wins and the other calls are cancelled. Per-provider latencies are recorded so the
+hedge delay follows the observed percentile. Streaming providers are read to the end
+before their answer is judged, so hedging applies to the whole answer, not the first chunk.
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "linkedin_templates_config.json")
+
+
+class LatencyTracker:
+    """Sliding window of call latencies per provider"""
+
+    def __init__(self, window: int = 512):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float, ok: bool = True):
+        with self._lock:
+            self._samples.setdefault(provider, deque(maxlen=self.window)).append(seconds)
+            counts = self._counts.setdefault(provider, {"calls": 0, "errors": 0, "wins": 0, "hedges": 0})
+            counts["calls"] += 1
+            if not ok:
+                counts["errors"] += 1
+
+    def count(self, provider: str, event: str):
+        with self._lock:
+            self._counts.setdefault(provider, {"calls": 0, "errors": 0, "wins": 0, "hedges": 0})[event] += 1
+
+    def samples(self, provider: str) -> int:
+        with self._lock:
+            return len(self._samples.get(provider, ()))
+
+    def percentile(self, provider: str, percentile: float) -> Optional[float]:
+        """Latency percentile in seconds, or None without samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, max(0, int(round(percentile / 100.0 * (len(samples) - 1)))))
+        return samples[rank]
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            providers = list(self._counts)
+            counts = {provider: dict(self._counts[provider]) for provider in providers}
+        return {
+            provider: {
+                **counts[provider],
+                "p50": self.percentile(provider, 50),
+                "p95": self.percentile(provider, 95),
+                "p99": self.percentile(provider, 99)
+            }
+            for provider in providers
+        }
+
+
+# Shared by default so hedge delays keep adapting across HedgedAIFunction instances
+LATENCY = LatencyTracker()
+
+
+def _provider_name(ai_function: Callable) -> str:
+    return getattr(ai_function, "provider", None) or getattr(ai_function, "__name__", repr(ai_function))
+
+
+def rank_providers(providers: Union[Dict[str, Callable], Sequence[Callable], Sequence[Tuple[str, Callable]]]
+                   ) -> List[Tuple[str, Callable]]:
+    """(name, ai_function) pairs in rank order from a name -> function dict or a ranked list"""
+    if isinstance(providers, dict):
+        return list(providers.items())
+    return [item if isinstance(item, tuple) else (_provider_name(item), item) for item in providers]
+
+
+def _call_and_join(ai_function: Callable, prompt: str) -> str:
+    """Call a provider; a streamed answer is read to the end (in the calling thread) before it is judged"""
+    value = ai_function(prompt)
+    return value if isinstance(value, str) else "".join(value).strip()
+
+
+def _default_is_good(value) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+class HedgedAIFunction:
+    """ai_function over ranked providers with hedged duplicates and failover"""
+
+    def __init__(self, providers: Union[Dict[str, Callable], Sequence[Callable], Sequence[Tuple[str, Callable]]],
+                 hedge_delay: float = 1.0, hedge_percentile: float = 95.0, min_delay: float = 0.05,
+                 min_samples: int = 20, max_providers: Optional[int] = None,
+                 is_good: Callable[[str], bool] = _default_is_good, tracker: LatencyTracker = LATENCY,
+                 max_workers: int = 32):
+        ranked = rank_providers(providers)
+        if not ranked:
+            raise ValueError("At least one provider is required")
+
+        self.providers: List[Tuple[str, Callable]] = ranked[:max_providers] if max_providers else ranked
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.is_good = is_good
+        self.tracker = tracker
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+
+    @classmethod
+    def from_config(cls, providers: Dict[str, Callable], config_path: str = CONFIG_PATH, **options) -> "HedgedAIFunction":
+        """Rank providers by their order in ai_integration.supported_models"""
+        with open(config_path, encoding="utf-8") as f:
+            supported = json.load(f)["ai_integration"]["supported_models"]
+        unknown = [name for name in providers if name not in supported]
+        if unknown:
+            raise ValueError(f"Unsupported providers {unknown}. Supported: {supported}")
+        return cls([(name, providers[name]) for name in supported if name in providers], **options)
+
+    def delay_for(self, provider: str) -> float:
+        """Seconds to wait on `provider` before hedging to the next one"""
+        if self.tracker.samples(provider) < self.min_samples:
+            return self.hedge_delay
+        return max(self.min_delay, self.tracker.percentile(provider, self.hedge_percentile))
+
+    def _timed(self, name: str, ai_function: Callable[[str], str], prompt: str) -> str:
+        started = time.monotonic()
+        try:
+            value = _call_and_join(ai_function, prompt)
+        except BaseException:
+            self.tracker.record(name, time.monotonic() - started, ok=False)
+            raise
+        self.tracker.record(name, time.monotonic() - started, ok=self.is_good(value))
+        return value
+
+    def __call__(self, prompt: str) -> str:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="hedge")
+
+        pending = {}
+        remaining = list(self.providers)
+        errors = []
+
+        def launch():
+            name, ai_function = remaining.pop(0)
+            if pending:
+                self.tracker.count(name, "hedges")
+            pending[self._executor.submit(self._timed, name, ai_function, prompt)] = name
+
+        launch()
+        try:
+            while pending:
+                timeout = self.delay_for(pending[next(reversed(pending))]) if remaining else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    continue
+                for future in done:
+                    name = pending.pop(future)
+                    error = future.exception()
+                    if error is None and self.is_good(future.result()):
+                        self.tracker.count(name, "wins")
+                        return future.result()
+                    errors.append(f"{name}: {error!r}" if error else f"{name}: unusable answer")
+                # A failed call triggers the next provider immediately
+                if remaining and not pending:
+                    launch()
+        finally:
+            # Threads cannot be interrupted; calls not yet started are dropped, running ones are ignored
+            for future in pending:
+                future.cancel()
+
+        raise RuntimeError(f"All providers failed: {'; '.join(errors)}")
+
+    async def acall(self, prompt: str) -> str:
+        """Async variant; providers may be coroutine functions and losing calls are cancelled"""
+        loop = asyncio.get_running_loop()
+
+        async def timed(name, ai_function):
+            started = time.monotonic()
+            try:
+                if asyncio.iscoroutinefunction(ai_function):
+                    value = await ai_function(prompt)
+                else:
+                    value = await loop.run_in_executor(None, _call_and_join, ai_function, prompt)
+            except asyncio.CancelledError:
+                raise
+            except BaseException:
+                self.tracker.record(name, time.monotonic() - started, ok=False)
+                raise
+            self.tracker.record(name, time.monotonic() - started, ok=self.is_good(value))
+            return value
+
+        pending = {}
+        remaining = list(self.providers)
+        errors = []
+
+        def launch():
+            name, ai_function = remaining.pop(0)
+            if pending:
+                self.tracker.count(name, "hedges")
+            pending[asyncio.ensure_future(timed(name, ai_function))] = name
+
+        launch()
+        try:
+            while pending:
+                timeout = self.delay_for(pending[next(reversed(pending))]) if remaining else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    continue
+                for task in done:
+                    name = pending.pop(task)
+                    error = task.exception()
+                    if error is None and self.is_good(task.result()):
+                        self.tracker.count(name, "wins")
+                        return task.result()
+                    errors.append(f"{name}: {error!r}" if error else f"{name}: unusable answer")
+                if remaining and not pending:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise RuntimeError(f"All providers failed: {'; '.join(errors)}")
+
+    def close(self):
+        """Shut down the hedging threads; calls still running finish in the background"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self) -> "HedgedAIFunction":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-provider calls, errors, wins, hedges and latency percentiles"""
+        names = {name for name, _ in self.providers}
+        return {name: stats for name, stats in self.tracker.stats().items() if name in names}
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, tail_probability: float = 0.0,
+                      tail_seconds: float = 0.0) -> Callable[[random.Random], float]:
+    """Latency distribution for stub providers: lognormal around `median` plus optional stalls"""
+    def sample(rng: random.Random) -> float:
+        latency = rng.lognormvariate(0.0, sigma) * median
+        if tail_probability and rng.random() < tail_probability:
+            latency += tail_seconds
+        return latency
+    return sample
+
+
+def stub_provider(name: str, latency: Callable[[random.Random], float], response: str = "stub value",
+                  failure_rate: float = 0.0, seed: Optional[int] = None) -> Callable[[str], str]:
+    """Local stand-in provider with an injected latency distribution, for testing hedging offline"""
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    def ai_function(prompt: str) -> str:
+        with lock:
+            delay = latency(rng)
+            failed = rng.random() < failure_rate
+        time.sleep(delay)
+        if failed:
+            raise RuntimeError(f"{name}: injected failure")
+        return f"{response} ({name})"
+
+    ai_function.provider = name
+    ai_function.__name__ = name
+    return ai_function
@@ -0,0 +1,274 @@
+"""
+LinkedIn Fill Job Queue
+Durable SQLite-backed queue for AI fill jobs with idempotent job keys, leases
+(at-least-once delivery), per-job retry with exponential backoff, and per-placeholder
+checkpoints so a restarted job resumes from the last resolved placeholder.
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fill_jobs (
+    job_key TEXT PRIMARY KEY,
+    batch TEXT,
+    category TEXT NOT NULL,
+    template_index INTEGER NOT NULL,
+    context TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    leased_until REAL,
+    progress TEXT NOT NULL DEFAULT '{}',
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fill_jobs_claim ON fill_jobs (status, available_at);
+CREATE INDEX IF NOT EXISTS idx_fill_jobs_batch ON fill_jobs (batch, status);
+"""
+
+
+@dataclass
+class FillJob:
+    """A claimed fill job"""
+    job_key: str
+    batch: Optional[str]
+    category: str
+    index: int
+    context: Dict[str, str]
+    attempts: int
+    progress: Dict[str, str]
+    lease_owner: str
+
+
+class FillJobQueue:
+    """SQLite job queue for template fills; one instance per process"""
+
+    def __init__(self, path: str, lease_seconds: float = 300.0, max_attempts: int = 5,
+                 base_backoff: float = 2.0, max_backoff: float = 300.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def enqueue(self, job_key: str, category: str, index: int, context: Dict[str, str],
+                batch: Optional[str] = None) -> bool:
+        """Add a job; returns False if a job with this key already exists"""
+        return self.enqueue_many([(job_key, category, index, context)], batch) == 1
+
+    def enqueue_many(self, jobs: Iterable[Tuple[str, str, int, Dict[str, str]]], batch: Optional[str] = None) -> int:
+        """Add (job_key, category, index, context) jobs in one transaction; existing keys are skipped"""
+        now = time.time()
+        rows = (
+            (job_key, batch, category, index, json.dumps(context), now, now, now)
+            for job_key, category, index, context in jobs
+        )
+        with self._transaction():
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO fill_jobs (job_key, batch, category, template_index, context, "
+                "available_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return cursor.rowcount
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def claim(self, worker_id: str) -> Optional[FillJob]:
+        """Lease the next available job (pending, or running with an expired lease)
+
+        A job whose lease expired on its last allowed attempt is marked failed instead of run again.
+        """
+        now = time.time()
+        with self._transaction():
+            while True:
+                row = self._conn.execute(
+                    "SELECT job_key, batch, category, template_index, context, attempts, progress, status "
+                    "FROM fill_jobs WHERE (status = 'pending' AND available_at <= ?) "
+                    "OR (status = 'running' AND leased_until < ?) ORDER BY available_at LIMIT 1",
+                    (now, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[7] == "running" and row[5] >= self.max_attempts:
+                    self._conn.execute(
+                        "UPDATE fill_jobs SET status = 'failed', error = ?, lease_owner = NULL, leased_until = NULL, "
+                        "updated_at = ? WHERE job_key = ?",
+                        (f"Lease expired on attempt {row[5]} of {self.max_attempts}", now, row[0])
+                    )
+                    continue
+                self._conn.execute(
+                    "UPDATE fill_jobs SET status = 'running', attempts = attempts + 1, lease_owner = ?, "
+                    "leased_until = ?, updated_at = ? WHERE job_key = ?",
+                    (worker_id, now + self.lease_seconds, now, row[0])
+                )
+                break
+        return FillJob(
+            job_key=row[0],
+            batch=row[1],
+            category=row[2],
+            index=row[3],
+            context=json.loads(row[4]),
+            attempts=row[5] + 1,
+            progress=json.loads(row[6]),
+            lease_owner=worker_id
+        )
+
+    def checkpoint(self, job: FillJob) -> bool:
+        """Persist the job's resolved placeholders and extend its lease; False if the lease was lost"""
+        now = time.time()
+        cursor = self._conn.execute(
+            "UPDATE fill_jobs SET progress = ?, leased_until = ?, updated_at = ? "
+            "WHERE job_key = ? AND status = 'running' AND lease_owner = ?",
+            (json.dumps(job.progress), now + self.lease_seconds, now, job.job_key, job.lease_owner)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job: FillJob, result: str) -> bool:
+        """Mark a job done; False if another worker took over the lease"""
+        cursor = self._conn.execute(
+            "UPDATE fill_jobs SET status = 'done', result = ?, progress = ?, error = NULL, lease_owner = NULL, "
+            "leased_until = NULL, updated_at = ? WHERE job_key = ? AND status = 'running' AND lease_owner = ?",
+            (result, json.dumps(job.progress), time.time(), job.job_key, job.lease_owner)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job: FillJob, error: str) -> bool:
+        """Record a failure and schedule a retry with backoff, or give up after max_attempts"""
+        now = time.time()
+        if job.attempts >= self.max_attempts:
+            status, available_at = "failed", now
+        else:
+            delay = min(self.max_backoff, self.base_backoff * 2 ** (job.attempts - 1))
+            status, available_at = "pending", now + delay * random.uniform(0.5, 1.0)
+        cursor = self._conn.execute(
+            "UPDATE fill_jobs SET status = ?, available_at = ?, error = ?, progress = ?, lease_owner = NULL, "
+            "leased_until = NULL, updated_at = ? WHERE job_key = ? AND status = 'running' AND lease_owner = ?",
+            (status, available_at, error, json.dumps(job.progress), now, job.job_key, job.lease_owner)
+        )
+        return cursor.rowcount == 1
+
+    def retry_failed(self, batch: Optional[str] = None) -> int:
+        """Put permanently failed jobs back in the queue (keeping their checkpoints)"""
+        query = "UPDATE fill_jobs SET status = 'pending', attempts = 0, available_at = ?, updated_at = ? WHERE status = 'failed'"
+        params: List = [time.time(), time.time()]
+        if batch is not None:
+            query += " AND batch = ?"
+            params.append(batch)
+        return self._conn.execute(query, params).rowcount
+
+    def stats(self, batch: Optional[str] = None) -> Dict[str, int]:
+        """Job counts by status"""
+        query = "SELECT status, COUNT(*) FROM fill_jobs"
+        params: List = []
+        if batch is not None:
+            query += " WHERE batch = ?"
+            params.append(batch)
+        counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update(dict(self._conn.execute(query + " GROUP BY status", params).fetchall()))
+        return counts
+
+    def results(self, batch: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+        """Stream (job_key, filled template) for completed jobs"""
+        query = "SELECT job_key, result FROM fill_jobs WHERE status = 'done'"
+        params: List = []
+        if batch is not None:
+            query += " AND batch = ?"
+            params.append(batch)
+        yield from self._conn.execute(query + " ORDER BY created_at, job_key", params)
+
+
+def process_job(queue: FillJobQueue, plugin, job: FillJob, ai_function: Callable[[str], str]) -> bool:
+    """Resolve a job's remaining placeholders, checkpointing after each one"""
+    try:
+        template = plugin.templates[job.category][job.index]
+        for placeholder in plugin.get_template_placeholders(job.category, job.index):
+            if placeholder in job.progress:
+                continue
+            value = ai_function(plugin.build_fill_prompt(placeholder, job.context, template))
+            # Streaming providers return an iterable of chunks, as in auto_fill_with_ai
+            job.progress[placeholder] = value if isinstance(value, str) else "".join(value).strip()
+            if not queue.checkpoint(job):
+                return False
+        return queue.complete(job, plugin.fill_template(job.category, job.index, job.progress))
+    except Exception as e:
+        queue.fail(job, f"{type(e).__name__}: {e}")
+        return False
+
+
+def run_worker(db_path: str, ai_function_factory: Callable[[], Callable[[str], str]],
+               worker_id: Optional[str] = None, poll_interval: float = 0.5, stop_when_idle: bool = True,
+               **queue_options) -> int:
+    """Claim and process jobs until the queue is idle; returns the number of jobs completed"""
+    from linkedin_templates import create_linkedin_plugin
+
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = FillJobQueue(db_path, **queue_options)
+    plugin = create_linkedin_plugin()
+    ai_function = ai_function_factory()
+    completed = 0
+
+    try:
+        while True:
+            job = queue.claim(worker_id)
+            if job is None:
+                counts = queue.stats()
+                if stop_when_idle and counts["pending"] == 0 and counts["running"] == 0:
+                    break
+                time.sleep(poll_interval)
+                continue
+            if process_job(queue, plugin, job, ai_function):
+                completed += 1
+    finally:
+        queue.close()
+
+    return completed
+
+
+def run_workers(db_path: str, ai_function_factory: Callable[[], Callable[[str], str]], workers: int = 4,
+                **worker_options) -> List[int]:
+    """Run worker processes against the queue until it drains; returns their exit codes
+
+    ai_function_factory must be picklable (a module-level function) so each process builds its own client.
+    """
+    processes = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(db_path, ai_function_factory),
+            kwargs={"worker_id": f"{socket.gethostname()}:{os.getpid()}:{n}", **worker_options},
+            daemon=True
+        )
+        for n in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return [process.exitcode for process in processes]
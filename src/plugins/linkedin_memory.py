@@ -0,0 +1,82 @@
+"""
+LinkedIn Templates Memory Report
+tracemalloc-based measurements of the corpus, metadata and indexes, reported as
+bytes per template, so workers can enforce a memory budget as tenant corpora grow.
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def traced(build: Callable[[], T]) -> Tuple[T, int]:
+    """Run `build` and return its result with the bytes it left allocated"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if started:
+            tracemalloc.stop()
+    return result, after - before
+
+
+def memory_report(compact: bool = False, corpus: Optional[Dict] = None, indexes: bool = True) -> Dict:
+    """
+    Measure a plugin built from a freshly loaded corpus (as a tenant corpus read from storage would be).
+
+    corpus is a {category: [template, ...]} dict; defaults to a JSON round-trip of the built-in
+    templates so every string is a new allocation rather than a code constant.
+    """
+    from linkedin_templates import LinkedInTemplatePlugin
+
+    if corpus is None:
+        source = json.dumps(LinkedInTemplatePlugin().templates)
+    else:
+        source = json.dumps(corpus)
+
+    if indexes:
+        # Import index modules (and NumPy) up front so their import cost is not billed to the corpus
+        import linkedin_hashtags  # noqa: F401
+        import linkedin_sampling  # noqa: F401
+
+    tracemalloc.start()
+    try:
+        templates, templates_bytes = traced(lambda: json.loads(source))
+        plugin, metadata_bytes = traced(lambda: LinkedInTemplatePlugin(templates, compact=compact))
+        count = sum(len(category_templates) for category_templates in plugin.templates.values())
+        measured = {"templates": templates_bytes, "metadata": metadata_bytes}
+
+        if indexes:
+            _, measured["hashtag_index"] = traced(plugin.get_hashtag_index)
+            _, measured["sampler"] = traced(plugin.get_sampler)
+    finally:
+        tracemalloc.stop()
+
+    total = sum(measured.values())
+    return {
+        "compact": compact,
+        "templates": count,
+        "bytes": measured,
+        "bytes_per_template": {name: round(size / count, 1) for name, size in measured.items()},
+        "total_bytes": total,
+        "total_bytes_per_template": round(total / count, 1) if count else 0.0
+    }
+
+
+def check_memory_budget(bytes_per_template: float, compact: bool = True, corpus: Optional[Dict] = None) -> Dict:
+    """Raise MemoryError if the measured footprint exceeds the per-template budget"""
+    report = memory_report(compact=compact, corpus=corpus)
+    if report["total_bytes_per_template"] > bytes_per_template:
+        raise MemoryError(
+            f"{report['total_bytes_per_template']:.0f} bytes/template exceeds the budget of {bytes_per_template:.0f}"
+        )
+    return report
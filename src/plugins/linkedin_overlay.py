@@ -0,0 +1,231 @@
+"""
+LinkedIn Tenant Overlays
+Copy-on-write tenant views over a shared, never-mutated LinkedInTemplatePlugin.
+A view stores only the tenant's edits, additions and deletions; reads, search and
+hashtag lookups merge base and overlay results lazily, so memory grows with the
+size of the edits rather than with the number of tenants.
+
+Template indexes are stable identities: deleting a template does not renumber the
+rest, and added templates are numbered after the base templates of their category.
+"""
+
+import heapq
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from linkedin_templates import TemplateMetadata, extract_hashtags
+
+Ref = Tuple[str, int]
+
+
+class TenantTemplateView:
+    """One tenant's view of the shared template library"""
+
+    def __init__(self, base, tenant_id: Optional[str] = None):
+        self.base = base
+        self.tenant_id = tenant_id
+        self._edits: Dict[Ref, Tuple[str, TemplateMetadata]] = {}
+        self._additions: Dict[str, List[Tuple[str, TemplateMetadata]]] = {}
+        self._deleted: Set[Ref] = set()
+
+    # Overlay edits
+
+    def _base_count(self, category: str) -> int:
+        return len(self.base.templates.get(category, ()))
+
+    def _check(self, category: str, index: int):
+        if not self.has_template(category, index):
+            raise ValueError(f"Index {index} out of range for category '{category}'")
+
+    def has_template(self, category: str, index: int) -> bool:
+        if (category, index) in self._deleted:
+            return False
+        base_count = self._base_count(category)
+        if 0 <= index < base_count:
+            return True
+        return 0 <= index - base_count < len(self._additions.get(category, ()))
+
+    def edit_template(self, category: str, index: int, template: str, title: Optional[str] = None,
+                      engagement_level: Optional[str] = None) -> TemplateMetadata:
+        """Replace a template for this tenant only"""
+        self._check(category, index)
+        current = self.get_template_metadata(category, index)
+        meta = self.base._build_metadata(
+            category, index, template,
+            title or current.title,
+            engagement_level or current.engagement_level
+        )
+        if index < self._base_count(category):
+            self._edits[(category, index)] = (template, meta)
+        else:
+            self._additions[category][index - self._base_count(category)] = (template, meta)
+        return meta
+
+    def add_template(self, category: str, template: str, title: Optional[str] = None,
+                     engagement_level: str = "Medium") -> TemplateMetadata:
+        """Add a tenant-only template (to a base category or a new one)"""
+        additions = self._additions.setdefault(category, [])
+        meta = self.base._build_metadata(category, self._base_count(category) + len(additions), template,
+                                         title, engagement_level)
+        additions.append((template, meta))
+        return meta
+
+    def delete_template(self, category: str, index: int):
+        """Hide a template from this tenant"""
+        self._check(category, index)
+        self._edits.pop((category, index), None)
+        self._deleted.add((category, index))
+
+    def revert_template(self, category: str, index: int):
+        """Drop the tenant's edit or deletion of a base template"""
+        self._edits.pop((category, index), None)
+        self._deleted.discard((category, index))
+
+    def overlay_size(self) -> int:
+        """Number of overlay entries held by this view"""
+        return len(self._edits) + len(self._deleted) + sum(len(items) for items in self._additions.values())
+
+    # Reads (same interface as LinkedInTemplatePlugin)
+
+    def get_categories(self) -> List[str]:
+        categories = self.base.get_categories()
+        return categories + [category for category in self._additions if category not in self.base.templates]
+
+    def template(self, category: str, index: int) -> str:
+        return self._entry(category, index)[0]
+
+    def _entry(self, category: str, index: int) -> Tuple[str, TemplateMetadata]:
+        self._check(category, index)
+        ref = (category, index)
+        if ref in self._edits:
+            return self._edits[ref]
+        base_count = self._base_count(category)
+        if index < base_count:
+            return self.base.templates[category][index], self.base.metadata[category][index]
+        return self._additions[category][index - base_count]
+
+    def iter_templates(self, category: str) -> Iterator[Tuple[int, str, TemplateMetadata]]:
+        """Live (index, template, metadata) entries of a category in index order"""
+        if category not in self.base.templates and category not in self._additions:
+            raise ValueError(f"Category '{category}' not found. Available categories: {self.get_categories()}")
+        base_count = self._base_count(category)
+        for index in range(base_count + len(self._additions.get(category, ()))):
+            if (category, index) not in self._deleted:
+                yield (index, *self._entry(category, index))
+
+    def get_templates(self, category: str) -> List[str]:
+        """Live templates of a category (deleted ones are skipped, so positions may differ from indexes)"""
+        return [template for _, template, _ in self.iter_templates(category)]
+
+    def get_template_metadata(self, category: str, index: Optional[int] = None):
+        if index is not None:
+            return self._entry(category, index)[1]
+        return [meta for _, _, meta in self.iter_templates(category)]
+
+    def get_template_placeholders(self, category: str, index: int) -> List[str]:
+        return list(self._entry(category, index)[1].placeholders)
+
+    def get_template_hashtags(self, category: str, index: int) -> List[str]:
+        return extract_hashtags(self.template(category, index))
+
+    def fill_template(self, category: str, index: int, values_dict: Dict[str, str]) -> str:
+        filled_template = self.template(category, index)
+        for placeholder, value in values_dict.items():
+            filled_template = filled_template.replace(f"[insert {placeholder}]", value)
+        return filled_template
+
+    def auto_fill_with_ai(self, category: str, index: int, context: Dict[str, str], ai_function=None) -> str:
+        if ai_function is None:
+            raise ValueError("AI function must be provided for auto-fill functionality")
+        values = {}
+        for placeholder in self.get_template_placeholders(category, index):
+            value = ai_function(self.base.build_fill_prompt(placeholder, context, self.template(category, index)))
+            values[placeholder] = value if isinstance(value, str) else "".join(value).strip()
+        return self.fill_template(category, index, values)
+
+    # Merged search and indexes
+
+    def _overlay_refs(self, categories: Optional[List[str]] = None) -> Iterator[Tuple[Ref, str, TemplateMetadata]]:
+        for (category, index), (template, meta) in self._edits.items():
+            if categories is None or category in categories:
+                yield (category, index), template, meta
+        for category, additions in self._additions.items():
+            if categories is None or category in categories:
+                base_count = self._base_count(category)
+                for offset, (template, meta) in enumerate(additions):
+                    if (category, base_count + offset) not in self._deleted:
+                        yield (category, base_count + offset), template, meta
+
+    def iter_search(self, keyword: str, categories: Optional[List[str]] = None) -> Iterator[Dict]:
+        """Lazily merge base search hits (minus overridden ones) with matching overlay templates"""
+        # Base hits come in the order of `categories` when given, so overlay hits must sort the same way
+        order = {category: position for position, category in enumerate(dict.fromkeys(categories or self.get_categories()))}
+        keyword_lower = keyword.lower()
+
+        def sort_key(result):
+            return order.get(result['category'], len(order)), result['index']
+
+        base_hits = (
+            result for result in self.base.search_templates(keyword, categories)
+            if (result['category'], result['index']) not in self._edits
+            and (result['category'], result['index']) not in self._deleted
+        )
+        overlay_hits = sorted(
+            (
+                {'category': category, 'index': index, 'template': template, 'metadata': meta}
+                for (category, index), template, meta in self._overlay_refs(categories)
+                if keyword_lower in template.lower()
+            ),
+            key=sort_key
+        )
+        return heapq.merge(base_hits, overlay_hits, key=sort_key)
+
+    def search_templates(self, keyword: str, categories: Optional[List[str]] = None) -> List[Dict]:
+        """Search templates by keyword across categories (base and overlay)"""
+        return list(self.iter_search(keyword, categories))
+
+    def templates_for_hashtag(self, hashtag: str) -> List[Ref]:
+        """Templates using a hashtag, from the shared base index plus the tenant's edits"""
+        key = hashtag.lstrip("#").lower()
+        refs = [
+            ref for ref in self.base.get_hashtag_index().templates_for(hashtag)
+            if ref not in self._edits and ref not in self._deleted
+        ]
+        refs.extend(
+            ref for ref, template, _ in self._overlay_refs()
+            if key in {tag.lstrip("#").lower() for tag in extract_hashtags(template)}
+        )
+        return sorted(refs)
+
+    # Persistence of the overlay only
+
+    def to_dict(self) -> Dict:
+        """Serializable tenant edits (the base is not included)"""
+        def entry(template, meta):
+            return {"template": template, "title": meta.title, "engagement_level": meta.engagement_level}
+
+        return {
+            "tenant_id": self.tenant_id,
+            "edits": [
+                {"category": category, "index": index, **entry(*value)}
+                for (category, index), value in self._edits.items()
+            ],
+            "additions": {
+                category: [entry(*value) for value in additions]
+                for category, additions in self._additions.items()
+            },
+            "deleted": [list(ref) for ref in sorted(self._deleted)]
+        }
+
+    @classmethod
+    def from_dict(cls, base, data: Dict) -> "TenantTemplateView":
+        """Rebuild a view saved with to_dict() on top of a base plugin"""
+        view = cls(base, data.get("tenant_id"))
+        for category, additions in data.get("additions", {}).items():
+            for item in additions:
+                view.add_template(category, item["template"], item.get("title"), item.get("engagement_level", "Medium"))
+        for item in data.get("edits", []):
+            view.edit_template(item["category"], item["index"], item["template"], item.get("title"),
+                               item.get("engagement_level"))
+        for category, index in data.get("deleted", []):
+            view._deleted.add((category, index))
+        return view
@@ -0,0 +1,292 @@
+"""
+LinkedIn Content-Calendar Planner
+Generates N weeks of scheduled drafts for many users on top of the template plugin:
+category-diverse template picks, AI fills with a shared cache and a concurrency limit,
+and streamed output in the server's post payload format (see POST /api/posts/bulk).
+"""
+
+import json
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# POST /api/posts and /api/posts/bulk reject longer content (server/routes/posts.js)
+MAX_CONTENT_LENGTH = 3000
+
+
+@dataclass
+class Cadence:
+    """When posts go out: weekdays (0=Monday) and a posting time, repeated every week"""
+    weekdays: Tuple[int, ...] = (1, 3)
+    post_time: time = time(9, 0)
+
+    def slots(self, start: date, weeks: int) -> Iterator[datetime]:
+        """Posting datetimes for `weeks` weeks starting on the week of `start`"""
+        week_start = start - timedelta(days=start.weekday())
+        for week in range(weeks):
+            for weekday in sorted(self.weekdays):
+                day = week_start + timedelta(weeks=week, days=weekday)
+                if day >= start:
+                    yield datetime.combine(day, self.post_time)
+
+
+@dataclass
+class PlannerUser:
+    """A user to plan for, with the context passed to the AI fill"""
+    user_id: str
+    topic: str = "professional development"
+    context: str = "business professional sharing insights"
+    category_mix: Optional[Dict[str, float]] = None
+
+
+@dataclass
+class ScheduledDraft:
+    """A filled template scheduled for a user"""
+    user_id: str
+    scheduled_at: datetime
+    category: str
+    index: int
+    content: str
+    error: Optional[str] = None
+    metadata: Dict = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        """Filled without errors, within the server's length limit and without leftover [insert ...] placeholders"""
+        if self.error or len(self.content) > MAX_CONTENT_LENGTH:
+            return False
+        quality = self.metadata.get("quality")
+        if quality is not None:
+            return not quality["leftover"]
+        return "[insert " not in self.content
+
+    def to_post(self) -> Dict:
+        """Post payload accepted by POST /api/posts and /api/posts/bulk (drafts that are not ready stay drafts)
+
+        Content over MAX_CONTENT_LENGTH is cut to fit, so one long draft does not fail a whole bulk request.
+        """
+        truncated = len(self.content) > MAX_CONTENT_LENGTH
+        return {
+            "user_id": self.user_id,
+            "content": self.content[:MAX_CONTENT_LENGTH] if truncated else self.content,
+            "platform": "linkedin",
+            "scheduled_at": self.scheduled_at.isoformat(),
+            "status": "scheduled" if self.ready else "draft",
+            "metadata": {
+                "source": "linkedin_templates",
+                "category": self.category,
+                "template_index": self.index,
+                **({"error": self.error} if self.error else {}),
+                **({"truncated_from": len(self.content)} if truncated else {}),
+                **self.metadata
+            }
+        }
+
+
+class CachedAIFunction:
+    """Thread-safe LRU cache around an ai_function, shared by all fills in a run
+
+    Concurrent calls with the same prompt wait for the first one instead of calling the provider again.
+    """
+
+    def __init__(self, ai_function: Callable[[str], str], max_entries: int = 10000):
+        self.ai_function = ai_function
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt: str) -> str:
+        with self._lock:
+            if prompt in self._cache:
+                self._cache.move_to_end(prompt)
+                self.hits += 1
+                return self._cache[prompt]
+            pending = self._in_flight.get(prompt)
+            if pending is None:
+                pending = self._in_flight[prompt] = Future()
+                owner = True
+                self.misses += 1
+            else:
+                owner = False
+                self.hits += 1
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = self.ai_function(prompt)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[prompt]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[prompt]
+            self._cache[prompt] = value
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        pending.set_result(value)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CategoryRotation:
+    """Smooth weighted round-robin over categories: proportional to the mix, never bunched up"""
+
+    def __init__(self, category_mix: Dict[str, float]):
+        self._weights = [(category, float(weight)) for category, weight in category_mix.items() if weight > 0]
+        if not self._weights:
+            raise ValueError("Category mix needs at least one category with a positive weight")
+        self._total = sum(weight for _, weight in self._weights)
+        self._current = [0.0] * len(self._weights)
+
+    def next(self) -> str:
+        best = 0
+        for i, (_, weight) in enumerate(self._weights):
+            self._current[i] += weight
+            if self._current[i] > self._current[best]:
+                best = i
+        self._current[best] -= self._total
+        return self._weights[best][0]
+
+
+class ContentPlanner:
+    """Plans and fills scheduled drafts for many users with bounded memory"""
+
+    def __init__(self, plugin, ai_function: Optional[Callable[[str], str]] = None,
+                 max_workers: int = 8, max_in_flight: Optional[int] = None,
+                 cache_size: int = 10000, seed: Optional[int] = None):
+        self.plugin = plugin
+        self.ai_function = CachedAIFunction(ai_function, cache_size) if ai_function else None
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or max_workers * 4
+        # A sampler of its own: rotations reset here must not touch the plugin's shared sampler
+        from linkedin_sampling import TemplateSampler
+        self.sampler = TemplateSampler(plugin, seed=seed)
+
+    def _check_mix(self, category_mix: Dict[str, float]):
+        for category in category_mix:
+            if category not in self.plugin.templates:
+                raise ValueError(f"Category '{category}' not found")
+
+    def _fill(self, user: PlannerUser, scheduled_at: datetime, category: str, index: int) -> ScheduledDraft:
+        draft = ScheduledDraft(user.user_id, scheduled_at, category, index, self.plugin.templates[category][index])
+        if self.ai_function is None:
+            draft.error = "No AI function provided; template left unfilled"
+            return draft
+        try:
+            draft.content = self.plugin.auto_fill_with_ai(
+                category, index, {"topic": user.topic, "context": user.context}, self.ai_function
+            )
+        except Exception as e:
+            draft.error = str(e)
+        return draft
+
+    def _plan_user(self, user: PlannerUser, slots: List[datetime],
+                   category_mix: Dict[str, float]) -> Iterator[Tuple[PlannerUser, datetime, str, int]]:
+        rotation = CategoryRotation(user.category_mix or category_mix)
+        for scheduled_at in slots:
+            picked = self.sampler.next_for_user(user.user_id, rotation.next())
+            yield user, scheduled_at, picked["category"], picked["index"]
+        # Rotation state is only needed while the user's drafts are being planned
+        self.sampler.reset_rotation(user.user_id)
+
+    def plan(self, users: Iterable[Union[str, Dict, PlannerUser]], weeks: int, cadence: Cadence = None,
+             category_mix: Optional[Dict[str, float]] = None, start: Optional[date] = None,
+             check_quality: bool = True) -> Iterator[ScheduledDraft]:
+        """
+        Stream scheduled drafts, user by user in schedule order.
+
+        users may be a generator; at most max_in_flight fills are pending at any time,
+        so memory does not grow with the number of users. Category mixes of a list of users
+        are checked up front; users from a generator are checked as they are read, before
+        any of their drafts. With check_quality, each draft's metadata gets a "quality"
+        record (see linkedin_quality), computed in batches.
+        """
+        category_mix = category_mix or {category: 1.0 for category in self.plugin.get_categories()}
+        self._check_mix(category_mix)
+        if isinstance(users, Sequence) and not isinstance(users, str):
+            # Fail before the first draft rather than partway through the stream
+            users = [_as_user(user) for user in users]
+            for user in users:
+                if user.category_mix:
+                    self._check_mix(user.category_mix)
+
+        drafts = self._plan(users, weeks, cadence, category_mix, start)
+        if not check_quality:
+            return drafts
+
+        from linkedin_quality import iter_checked
+
+        def checked():
+            for draft, quality in iter_checked(drafts, self.max_in_flight, text=lambda draft: draft.content):
+                draft.metadata["quality"] = quality
+                yield draft
+
+        return checked()
+
+    def _plan(self, users: Iterable[Union[str, Dict, PlannerUser]], weeks: int, cadence: Optional[Cadence],
+              category_mix: Dict[str, float], start: Optional[date]) -> Iterator[ScheduledDraft]:
+        cadence = cadence or Cadence()
+        start = start or date.today()
+        slots = list(cadence.slots(start, weeks))
+
+        def picks():
+            for user in users:
+                user = _as_user(user)
+                if user.category_mix:
+                    self._check_mix(user.category_mix)
+                yield from self._plan_user(user, slots, category_mix)
+
+        pending: deque = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for pick in picks():
+                pending.append(executor.submit(self._fill, *pick))
+                if len(pending) >= self.max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def _as_user(user: Union[str, Dict, PlannerUser]) -> PlannerUser:
+    if isinstance(user, str):
+        return PlannerUser(user)
+    if isinstance(user, dict):
+        return PlannerUser(**user)
+    return user
+
+
+def write_jsonl(drafts: Iterable[ScheduledDraft], fp: IO[str]) -> int:
+    """Stream drafts as JSON lines of post payloads; returns the number written"""
+    count = 0
+    for draft in drafts:
+        fp.write(json.dumps(draft.to_post(), ensure_ascii=False))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def iter_bulk_requests(drafts: Iterable[ScheduledDraft], batch_size: int = 100) -> Iterator[Tuple[str, Dict]]:
+    """Group consecutive drafts into (user_id, {"posts": [...]}) bodies for POST /api/posts/bulk"""
+    user_id, posts = None, []
+    for draft in drafts:
+        if posts and (draft.user_id != user_id or len(posts) >= batch_size):
+            yield user_id, {"posts": posts}
+            posts = []
+        user_id = draft.user_id
+        post = draft.to_post()
+        del post["user_id"]
+        posts.append(post)
+    if posts:
+        yield user_id, {"posts": posts}
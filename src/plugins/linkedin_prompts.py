@@ -0,0 +1,152 @@
+"""
+LinkedIn Fill Prompts
+Prompt construction for AI auto-fill, ordered for prompt prefix caching. Each
+per-placeholder prompt is a shared prefix (instructions, template, topic and context,
+from most to least stable) followed by a short placeholder-specific suffix. The prefix
+is byte-identical for every placeholder of a fill, and for every fill of the same
+template with the same context, so a provider's prefix/KV cache (llama.cpp and Ollama
+slots, OpenAI automatic caching, Claude cache_control blocks) can reuse it.
+
+Profiles describe how each provider caches. FillPromptBuilder also estimates the
+share of prompt tokens served from cache; providers that report real usage can
+override the estimate through record_usage.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+
+from linkedin_ratelimit import estimate_tokens
+
+INSTRUCTIONS = (
+    "You write the value of one placeholder in a LinkedIn post template. "
+    "Reply with the value only, without quotes, labels or explanations. "
+    "Keep it concise and engaging, and consistent with the rest of the post."
+)
+DEFAULT_TOPIC = "professional development"
+DEFAULT_CONTEXT = "business professional sharing insights"
+
+
+@dataclass(frozen=True)
+class PromptProfile:
+    """How a provider caches prompt prefixes"""
+    name: str
+    include_template: bool = True  # the template gives the model structure and lengthens the shared prefix
+    min_cached_tokens: int = 0     # shorter prefixes are never cached
+    cache_block_tokens: int = 1    # cache hits are counted in blocks of this many tokens
+    cache_entries: int = 64        # prefixes the provider keeps warm (a llama.cpp slot keeps its last prompt)
+    explicit_cache: bool = False   # caching must be requested (e.g. a cache_control block): use build_parts
+
+
+# Keyed like linkedin_ratelimit.DEFAULT_LIMITS (ai_integration.supported_models)
+PROVIDER_PROFILES = {
+    "Ollama": PromptProfile("Ollama", cache_entries=1),
+    "Local LLMs": PromptProfile("Local LLMs", cache_entries=1),
+    "OpenAI GPT": PromptProfile("OpenAI GPT", min_cached_tokens=1024, cache_block_tokens=128),
+    "Claude": PromptProfile("Claude", min_cached_tokens=1024, explicit_cache=True)
+}
+DEFAULT_PROFILE = "Ollama"
+
+
+class FillPromptBuilder:
+    """Builds prefix-first fill prompts for one provider profile and tracks cached-token share"""
+
+    def __init__(self, profile: Union[str, PromptProfile] = DEFAULT_PROFILE):
+        if isinstance(profile, str):
+            if profile not in PROVIDER_PROFILES:
+                raise ValueError(f"Unknown provider '{profile}'. Available providers: {list(PROVIDER_PROFILES)}")
+            profile = PROVIDER_PROFILES[profile]
+        self.profile = profile
+        self.prompts = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.reported = {"prompts": 0, "prompt_tokens": 0, "cached_tokens": 0}
+        self._warm: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefix(self, context: Dict[str, str], template: Optional[str] = None) -> str:
+        """Shared part of every placeholder prompt of one fill (stable text first, no placeholder name)"""
+        lines = [INSTRUCTIONS, ""]
+        if template and self.profile.include_template:
+            lines += ["Template:", template, ""]
+        lines.append(f"Post topic: {context.get('topic', DEFAULT_TOPIC)}")
+        lines.append(f"Context: {context.get('context', DEFAULT_CONTEXT)}")
+        # Any other context keys, in a fixed order so the prefix stays byte-identical
+        lines += [f"{key.title()}: {context[key]}" for key in sorted(context) if key not in ("topic", "context")]
+        return "\n".join(lines) + "\n\n"
+
+    @staticmethod
+    def suffix(placeholder: str) -> str:
+        return f"Placeholder: [insert {placeholder}]\nValue:"
+
+    def build_parts(self, placeholder: str, context: Dict[str, str], template: Optional[str] = None) -> Tuple[str, str]:
+        """(cacheable prefix, suffix) for providers that mark the cached block explicitly"""
+        prefix, suffix = self.prefix(context, template), self.suffix(placeholder)
+        self._track(prefix, suffix, marked=True)
+        return prefix, suffix
+
+    def build(self, placeholder: str, context: Dict[str, str], template: Optional[str] = None) -> str:
+        """One prompt string; explicit-cache providers do not cache it (use build_parts for those)"""
+        prefix, suffix = self.prefix(context, template), self.suffix(placeholder)
+        self._track(prefix, suffix, marked=False)
+        return prefix + suffix
+
+    # Cached-token metrics
+
+    def _track(self, prefix: str, suffix: str, marked: bool):
+        """Estimate cache hits: the prefix is served from cache if it is still warm at the provider
+
+        Explicit-cache providers only cache (and serve) prefixes sent as a marked block via build_parts.
+        """
+        prefix_tokens = estimate_tokens(prefix)
+        cacheable = prefix_tokens - prefix_tokens % self.profile.cache_block_tokens
+        cached = marked or not self.profile.explicit_cache
+        with self._lock:
+            hit = cached and prefix in self._warm
+            if hit:
+                self._warm.move_to_end(prefix)
+            elif cached:
+                self._warm[prefix] = None
+                if len(self._warm) > self.profile.cache_entries:
+                    self._warm.popitem(last=False)
+            self.prompts += 1
+            self.prompt_tokens += prefix_tokens + estimate_tokens(suffix)
+            if hit and cacheable >= max(self.profile.min_cached_tokens, 1):
+                self.cached_tokens += cacheable
+
+    def record_usage(self, prompt_tokens: int, cached_tokens: int):
+        """Count real usage reported by a provider (e.g. usage.prompt_tokens_details.cached_tokens)"""
+        with self._lock:
+            self.reported["prompts"] += 1
+            self.reported["prompt_tokens"] += prompt_tokens
+            self.reported["cached_tokens"] += cached_tokens
+
+    def cached_token_ratio(self) -> float:
+        """Share of prompt tokens served from cache: reported usage if any, else the estimate"""
+        if self.reported["prompt_tokens"]:
+            return self.reported["cached_tokens"] / self.reported["prompt_tokens"]
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "provider": self.profile.name,
+            "prompts": self.prompts,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "reported": dict(self.reported),
+            "cached_token_ratio": round(self.cached_token_ratio(), 4)
+        }
+
+
+_builders: Dict[str, FillPromptBuilder] = {}
+_builders_lock = threading.Lock()
+
+
+def get_prompt_builder(provider: str = DEFAULT_PROFILE) -> FillPromptBuilder:
+    """Get the process-wide builder for a provider (metrics accumulate across callers)"""
+    with _builders_lock:
+        builder = _builders.get(provider)
+        if builder is None:
+            builder = _builders[provider] = FillPromptBuilder(provider)
+        return builder
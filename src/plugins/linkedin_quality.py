@@ -0,0 +1,191 @@
+"""
+LinkedIn Post Quality Checks
+Column-wise checks of filled posts before scheduling: leftover [insert ...] markers,
+the LinkedIn length limit, the "see more" fold, hashtag count and duplicate hashtags.
+
+Posts are analyzed in chunks. Hashtags of a whole chunk are matched in one pass over the
+joined text; match positions are mapped back to posts with searchsorted, and counts and
+duplicates come from bincount/unique. Thresholds are applied as array operations, and
+results are a NumPy structured array of 15 bytes per post.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from linkedin_templates import HASHTAG_PATTERN
+
+T = TypeVar("T")
+
+MAX_POST_LENGTH = 3000   # LinkedIn post character limit
+SEE_MORE_FOLD = 210      # characters shown before "...see more"
+MAX_HASHTAGS = 5
+
+LEFTOVER_MARKER = "[insert "
+# The hook ends at the first line break or sentence end
+HOOK_END_PATTERN = re.compile(r'[.!?](?=\s)|\n')
+
+# Issue flags (bitmask in the "flags" column)
+LEFTOVER_PLACEHOLDER = 1
+TOO_LONG = 2
+HOOK_PAST_FOLD = 4
+TOO_MANY_HASHTAGS = 8
+DUPLICATE_HASHTAGS = 16
+
+ISSUES = {
+    LEFTOVER_PLACEHOLDER: "leftover_placeholder",
+    TOO_LONG: "too_long",
+    HOOK_PAST_FOLD: "hook_past_fold",
+    TOO_MANY_HASHTAGS: "too_many_hashtags",
+    DUPLICATE_HASHTAGS: "duplicate_hashtags"
+}
+
+QUALITY_DTYPE = np.dtype([
+    ("length", np.int32),
+    ("hook_length", np.int32),  # characters up to the first line break or sentence end
+    ("leftover", np.uint16),
+    ("hashtags", np.uint16),
+    ("duplicate_hashtags", np.uint16),
+    ("flags", np.uint8)
+])
+
+_SEPARATOR = "\x00"
+
+
+class QualityTable:
+    """Per-post quality metrics as a structured array, with summaries"""
+
+    def __init__(self, rows: np.ndarray, max_length: int = MAX_POST_LENGTH, fold: int = SEE_MORE_FOLD,
+                 max_hashtags: int = MAX_HASHTAGS):
+        self.rows = rows
+        self.max_length = max_length
+        self.fold = fold
+        self.max_hashtags = max_hashtags
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, i: int) -> Dict:
+        row = self.rows[i]
+        record = {name: int(row[name]) for name in QUALITY_DTYPE.names if name != "flags"}
+        record["issues"] = issue_names(int(row["flags"]))
+        return record
+
+    @property
+    def ok(self) -> np.ndarray:
+        """Boolean mask of posts without issues"""
+        return self.rows["flags"] == 0
+
+    def failing(self, flag: Optional[int] = None) -> np.ndarray:
+        """Indexes of posts with any issue (or with a given flag)"""
+        flags = self.rows["flags"]
+        return np.flatnonzero(flags if flag is None else flags & flag)
+
+    def to_records(self) -> List[Dict]:
+        return [self[i] for i in range(len(self))]
+
+    def summary(self) -> Dict:
+        """Counts per issue and length percentiles"""
+        flags = self.rows["flags"]
+        lengths = self.rows["length"]
+        return {
+            "posts": len(self),
+            "ok": int(np.count_nonzero(flags == 0)),
+            "issues": {name: int(np.count_nonzero(flags & flag)) for flag, name in ISSUES.items()},
+            "length": {
+                "mean": round(float(lengths.mean()), 1) if len(self) else 0.0,
+                "p50": int(np.percentile(lengths, 50)) if len(self) else 0,
+                "p95": int(np.percentile(lengths, 95)) if len(self) else 0,
+                "max": int(lengths.max()) if len(self) else 0
+            }
+        }
+
+
+def issue_names(flags: int) -> List[str]:
+    return [name for flag, name in ISSUES.items() if flags & flag]
+
+
+def _hook_end(post: str) -> int:
+    match = HOOK_END_PATTERN.search(post)
+    return -1 if match is None else match.start()
+
+
+def _post_of(starts: np.ndarray, positions: List[int]) -> np.ndarray:
+    return np.searchsorted(starts, np.asarray(positions, dtype=np.int64), side="right") - 1
+
+
+def analyze_chunk(posts: List[str], max_length: int = MAX_POST_LENGTH, fold: int = SEE_MORE_FOLD,
+                  max_hashtags: int = MAX_HASHTAGS) -> np.ndarray:
+    """Quality rows for a list of posts"""
+    count = len(posts)
+    rows = np.zeros(count, dtype=QUALITY_DTYPE)
+    if not count:
+        return rows
+
+    lengths = np.fromiter(map(len, posts), dtype=np.int64, count=count)
+    starts = np.zeros(count, dtype=np.int64)
+    np.cumsum(lengths[:-1] + 1, out=starts[1:])
+    joined = _SEPARATOR.join(posts)
+
+    rows["length"] = lengths
+    hooks = np.fromiter((_hook_end(post) for post in posts), dtype=np.int64, count=count)
+    rows["hook_length"] = np.where(hooks < 0, lengths, hooks)
+    rows["leftover"] = np.fromiter((post.count(LEFTOVER_MARKER) for post in posts), dtype=np.int64, count=count)
+
+    tag_at, tag_ids, vocabulary = [], [], {}
+    for match in HASHTAG_PATTERN.finditer(joined):
+        tag_at.append(match.start())
+        tag_ids.append(vocabulary.setdefault(match.group(1).lower(), len(vocabulary)))
+    if tag_at:
+        owners = _post_of(starts, tag_at)
+        totals = np.bincount(owners, minlength=count)
+        # Distinct (post, tag) pairs give each post's number of unique hashtags
+        pairs = np.unique(owners * len(vocabulary) + np.asarray(tag_ids, dtype=np.int64))
+        distinct = np.bincount(pairs // len(vocabulary), minlength=count)
+        rows["hashtags"] = totals
+        rows["duplicate_hashtags"] = totals - distinct
+
+    flags = np.zeros(count, dtype=np.uint8)
+    flags[rows["leftover"] > 0] |= LEFTOVER_PLACEHOLDER
+    flags[rows["length"] > max_length] |= TOO_LONG
+    flags[rows["hook_length"] > fold] |= HOOK_PAST_FOLD
+    flags[rows["hashtags"] > max_hashtags] |= TOO_MANY_HASHTAGS
+    flags[rows["duplicate_hashtags"] > 0] |= DUPLICATE_HASHTAGS
+    rows["flags"] = flags
+    return rows
+
+
+def analyze_posts(posts: Iterable[str], chunk_size: int = 4096, **limits) -> QualityTable:
+    """Analyze a list or stream of filled posts; only one chunk of text is held at a time"""
+    chunks = []
+    for chunk in _chunks(posts, chunk_size):
+        chunks.append(analyze_chunk(chunk, **limits))
+    rows = np.concatenate(chunks) if chunks else np.zeros(0, dtype=QUALITY_DTYPE)
+    return QualityTable(rows, **limits)
+
+
+def iter_checked(items: Iterable[T], chunk_size: int = 256, text=lambda item: item,
+                 **limits) -> Iterator[Tuple[T, Dict]]:
+    """Stream (item, quality record) pairs, analyzing items chunk by chunk
+
+    text extracts the post from an item (e.g. a ScheduledDraft), so checks can run inline
+    in bulk-fill pipelines without collecting their output first.
+    """
+    for chunk in _chunks(items, chunk_size):
+        table = QualityTable(analyze_chunk([text(item) for item in chunk], **limits), **limits)
+        for i, item in enumerate(chunk):
+            yield item, table[i]
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    if size <= 0:
+        raise ValueError("chunk_size must be positive")
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
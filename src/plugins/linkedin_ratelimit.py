@@ -0,0 +1,235 @@
+"""
+LinkedIn AI Rate Limiting
+Shared per-provider token buckets (requests per second and tokens per minute) that
+AI callers wait on, with queue-depth backpressure, Retry-After handling and metrics.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, Optional
+
+# Conservative defaults for the providers in ai_integration.supported_models
+DEFAULT_LIMITS = {
+    "Ollama": {"requests_per_second": 2.0, "tokens_per_minute": None, "max_concurrent": 2},
+    "OpenAI GPT": {"requests_per_second": 5.0, "tokens_per_minute": 90000},
+    "Claude": {"requests_per_second": 5.0, "tokens_per_minute": 80000},
+    "Local LLMs": {"requests_per_second": 1.0, "tokens_per_minute": None, "max_concurrent": 1}
+}
+
+
+class RateLimitError(Exception):
+    """Raised by an ai_function when the provider rejects a call (HTTP 429/503)"""
+
+    def __init__(self, message: str = "Rate limited by provider", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BackpressureError(Exception):
+    """Raised when too many callers are already waiting on a limiter"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)"""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations; callers sleep off any deficit outside the lock"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` tokens (possibly going into debt); returns seconds until they are covered"""
+        self._refill(now)
+        self.tokens -= amount
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self, amount: float, now: float):
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def available(self, now: float) -> float:
+        self._refill(now)
+        return self.tokens
+
+
+class ProviderRateLimiter:
+    """Requests-per-second and tokens-per-minute budgets for one provider"""
+
+    def __init__(self, provider: str, requests_per_second: float = 5.0, tokens_per_minute: Optional[float] = None,
+                 burst: Optional[float] = None, max_queue_depth: int = 256, max_concurrent: Optional[int] = None,
+                 max_output_tokens: int = 64):
+        self.provider = provider
+        self.max_queue_depth = max_queue_depth
+        self.max_output_tokens = max_output_tokens
+        self._requests = TokenBucket(requests_per_second, burst or max(1.0, requests_per_second))
+        self._tokens = TokenBucket(tokens_per_minute / 60.0, tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrent = max_concurrent
+        self._concurrency = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        # asyncio semaphores belong to one event loop, so async callers get one per loop
+        self._async_concurrency: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+        self.waiting = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            if self.waiting >= self.max_queue_depth:
+                self.rejected += 1
+                raise BackpressureError(
+                    f"{self.provider}: {self.waiting} callers already waiting (max {self.max_queue_depth})"
+                )
+            now = time.monotonic()
+            wait = self._requests.reserve(1, now)
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+            wait = max(wait, self._paused_until - now)
+            self.waiting += 1
+            self.acquired += 1
+            self.wait_seconds += wait
+            return wait
+
+    def _done_waiting(self):
+        with self._lock:
+            self.waiting -= 1
+
+    def _paused_for(self) -> float:
+        with self._lock:
+            return self._paused_until - time.monotonic()
+
+    def acquire(self, tokens: int = 1):
+        """Block until a request costing `tokens` fits in the budgets"""
+        wait = self._reserve(tokens)
+        try:
+            # A 429 while this caller slept pauses it too
+            while wait > 0:
+                time.sleep(wait)
+                wait = self._paused_for()
+        finally:
+            self._done_waiting()
+
+    async def acquire_async(self, tokens: int = 1):
+        """Await until a request costing `tokens` fits in the budgets"""
+        wait = self._reserve(tokens)
+        try:
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._paused_for()
+        finally:
+            self._done_waiting()
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token budget once the provider reports real usage"""
+        if self._tokens is None or actual_tokens == estimated_tokens:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if actual_tokens < estimated_tokens:
+                self._tokens.refund(estimated_tokens - actual_tokens, now)
+            else:
+                self._tokens.reserve(actual_tokens - estimated_tokens, now)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Pause all callers after a 429, for Retry-After seconds (or one request interval)"""
+        delay = retry_after if retry_after is not None else 1.0 / self._requests.rate
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    @contextmanager
+    def slot(self, tokens: int = 1):
+        """Acquire budget and, if configured, a concurrency slot for the duration of a call"""
+        self.acquire(tokens)
+        if self._concurrency is None:
+            yield
+            return
+        with self._concurrency:
+            yield
+
+    @asynccontextmanager
+    async def async_slot(self, tokens: int = 1):
+        """Async slot(): budget plus, if configured, one of max_concurrent slots on the running loop
+
+        Async and sync callers hold separate slots, so keep each provider to one kind of caller.
+        """
+        await self.acquire_async(tokens)
+        if self.max_concurrent is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._async_concurrency.get(loop)
+            if semaphore is None:
+                semaphore = self._async_concurrency[loop] = asyncio.Semaphore(self.max_concurrent)
+        async with semaphore:
+            yield
+
+    def wrap(self, ai_function: Callable[[str], str], max_retries: int = 3) -> Callable[[str], str]:
+        """Rate-limited ai_function that retries RateLimitError after the provider's Retry-After"""
+        def limited(prompt: str) -> str:
+            tokens = estimate_tokens(prompt) + self.max_output_tokens
+            for attempt in range(max_retries + 1):
+                try:
+                    with self.slot(tokens):
+                        return ai_function(prompt)
+                except RateLimitError as e:
+                    self.penalize(e.retry_after)
+                    if attempt == max_retries:
+                        raise
+        limited.provider = self.provider
+        return limited
+
+    def snapshot(self) -> Dict:
+        """Current limiter state for metrics"""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "provider": self.provider,
+                "requests_available": round(self._requests.available(now), 3),
+                "tokens_available": round(self._tokens.available(now), 1) if self._tokens else None,
+                "queue_depth": self.waiting,
+                "paused_for": round(max(0.0, self._paused_until - now), 3),
+                "acquired": self.acquired,
+                "rejected": self.rejected,
+                "throttled": self.throttled,
+                "avg_wait_seconds": round(self.wait_seconds / self.acquired, 4) if self.acquired else 0.0
+            }
+
+
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, **limits) -> ProviderRateLimiter:
+    """Get the process-wide limiter for a provider, creating it from DEFAULT_LIMITS (or `limits`) once"""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _limiters[provider] = ProviderRateLimiter(provider, **{**DEFAULT_LIMITS.get(provider, {}), **limits})
+        return limiter
+
+
+def rate_limiter_metrics() -> Dict[str, Dict]:
+    """Snapshot of every shared limiter"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.provider: limiter.snapshot() for limiter in limiters}
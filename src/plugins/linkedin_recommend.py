@@ -0,0 +1,233 @@
+"""
+LinkedIn Template Recommendations
+Personalized top-k templates from each user's past selections. Templates get TF-IDF +
+category vectors once; their cosine similarities are precomputed as an n x n float32
+matrix. A user's profile is a short, recency-decayed list of selected templates, so a
+recommendation is one weighted row-sum over the matrix plus a popularity prior, and
+top-k comes from argpartition. Recording a selection touches only that user's history
+and one popularity counter, so memory and update cost stay small per user.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from linkedin_search import ENGAGEMENT_RANK
+
+WORD_PATTERN = re.compile(r'[a-z][a-z0-9]+')
+STOP_WORDS = frozenset(
+    "the and for that this with you your are was were but not have has had from they their them what when "
+    "into about our out its it's can all one more most how who why will just than then there here "
+    "insert".split()
+)
+
+
+class TemplateRecommender:
+    """Item-similarity recommender over a fixed template corpus with incremental user histories"""
+
+    def __init__(self, keys: Sequence[Hashable], texts: Sequence[str], groups: Sequence[str],
+                 priors: Optional[Sequence[float]] = None, history_size: int = 50, decay: float = 0.9,
+                 category_weight: float = 0.5, popularity_weight: float = 0.1):
+        if not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        self.history_size = history_size
+        self.decay = decay
+        self.category_weight = category_weight
+        self.popularity_weight = popularity_weight
+        self._histories: Dict[Hashable, Dict[Hashable, float]] = {}
+        self._selections: Counter = Counter()
+        self._lock = threading.Lock()
+        self.set_items(keys, texts, groups, priors)
+
+    @classmethod
+    def from_plugin(cls, plugin, **options) -> "TemplateRecommender":
+        """Recommender over LinkedInTemplatePlugin templates, keyed by (category, index)"""
+        return cls(*plugin_items(plugin), **options)
+
+    @classmethod
+    def from_template_store(cls, store, **options) -> "TemplateRecommender":
+        """Recommender over TemplateStore structures, keyed by template id"""
+        return cls(*template_store_items(store), **options)
+
+    def set_items(self, keys: Sequence[Hashable], texts: Sequence[str], groups: Sequence[str],
+                  priors: Optional[Sequence[float]] = None):
+        """(Re)build item vectors and similarities; user histories are kept (they are keyed by item key)"""
+        if not (len(keys) == len(texts) == len(groups)):
+            raise ValueError("keys, texts and groups must have the same length")
+        self.keys = list(keys)
+        self._groups = np.asarray(groups, dtype=object)
+        self._index = {key: i for i, key in enumerate(self.keys)}
+
+        features = _item_features(texts, groups, self.category_weight)
+        self._similarity = (features @ features.T).astype(np.float32)
+
+        prior = np.asarray(priors if priors is not None else np.ones(len(self.keys)), dtype=np.float32)
+        self._prior = prior / prior.max() if len(prior) and prior.max() > 0 else prior
+        self._popularity = np.zeros(len(self.keys), dtype=np.float32)
+        for key, count in self._selections.items():
+            if key in self._index:
+                self._popularity[self._index[key]] = count
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def users(self) -> int:
+        return len(self._histories)
+
+    # Incremental updates
+
+    def record_selection(self, user_id: Hashable, key: Hashable, weight: float = 1.0):
+        """Add a selection to the user's history (older selections decay) and to global popularity"""
+        if key not in self._index:
+            raise ValueError(f"Unknown template {key!r}")
+        with self._lock:
+            history = self._histories.setdefault(user_id, {})
+            if self.decay < 1:
+                for item in history:
+                    history[item] *= self.decay
+            history[key] = history.get(key, 0.0) + weight
+            if len(history) > self.history_size:
+                del history[min(history, key=history.get)]
+            self._selections[key] += 1
+            self._popularity[self._index[key]] += 1
+
+    def history(self, user_id: Hashable) -> List[Tuple[Hashable, float]]:
+        """The user's selections with their decayed weights, strongest first"""
+        return sorted(self._histories.get(user_id, {}).items(), key=lambda item: -item[1])
+
+    def forget_user(self, user_id: Hashable):
+        self._histories.pop(user_id, None)
+
+    # Scoring
+
+    def _profile(self, user_id: Hashable) -> Tuple[np.ndarray, np.ndarray]:
+        history = self._histories.get(user_id, {})
+        items = [(self._index[key], weight) for key, weight in history.items() if key in self._index]
+        ids = np.fromiter((i for i, _ in items), dtype=np.intp, count=len(items))
+        weights = np.fromiter((w for _, w in items), dtype=np.float32, count=len(items))
+        return ids, weights
+
+    def _popularity_scores(self) -> np.ndarray:
+        popularity = np.log1p(self._popularity)
+        if popularity.max() > 0:
+            popularity /= popularity.max()
+        return 0.5 * popularity + 0.5 * self._prior
+
+    def scores(self, user_id: Hashable) -> np.ndarray:
+        """Score of every template for a user (similarity to history plus popularity)"""
+        ids, weights = self._profile(user_id)
+        scores = self.popularity_weight * self._popularity_scores()
+        if len(ids):
+            scores = scores + (weights @ self._similarity[ids]) / weights.sum()
+        return scores
+
+    def recommend(self, user_id: Hashable, k: int = 10, exclude_seen: bool = True,
+                  groups: Optional[Iterable[str]] = None) -> List[Tuple[Hashable, float]]:
+        """Top-k (key, score) for a user; cold-start users get popular, high-engagement templates"""
+        scores = self.scores(user_id)
+        if exclude_seen:
+            ids, _ = self._profile(user_id)
+            scores[ids] = -np.inf
+        if groups is not None:
+            scores[~np.isin(self._groups, list(groups))] = -np.inf
+        return self._top_k(scores, k)
+
+    def recommend_many(self, user_ids: Sequence[Hashable], k: int = 10,
+                       exclude_seen: bool = True) -> Dict[Hashable, List[Tuple[Hashable, float]]]:
+        """Batch recommendations: profiles become a (users x items) weight matrix, scored in one product"""
+        profiles = np.zeros((len(user_ids), len(self.keys)), dtype=np.float32)
+        for row, user_id in enumerate(user_ids):
+            ids, weights = self._profile(user_id)
+            if len(ids):
+                profiles[row, ids] = weights / weights.sum()
+        scores = profiles @ self._similarity + self.popularity_weight * self._popularity_scores()
+        if exclude_seen:
+            scores[profiles > 0] = -np.inf
+        return {user_id: self._top_k(scores[row], k) for row, user_id in enumerate(user_ids)}
+
+    def _top_k(self, scores: np.ndarray, k: int) -> List[Tuple[Hashable, float]]:
+        finite = np.isfinite(scores)
+        k = min(k, int(finite.sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.keys[i], float(scores[i])) for i in top]
+
+    # Persistence
+
+    def export_state(self) -> Dict:
+        """User histories and selection counts (item vectors are rebuilt from the corpus)"""
+        return {
+            "histories": {user_id: dict(history) for user_id, history in self._histories.items()},
+            "selections": dict(self._selections)
+        }
+
+    def load_state(self, state: Dict):
+        with self._lock:
+            self._histories = {user_id: dict(history) for user_id, history in state.get("histories", {}).items()}
+            self._selections = Counter(state.get("selections", {}))
+            self._popularity[:] = 0
+            for key, count in self._selections.items():
+                if key in self._index:
+                    self._popularity[self._index[key]] = count
+
+
+def plugin_items(plugin) -> Tuple[List, List[str], List[str], List[float]]:
+    """(keys, texts, groups, priors) of LinkedInTemplatePlugin templates"""
+    keys, texts, groups, priors = [], [], [], []
+    for category, templates in plugin.templates.items():
+        for i, template in enumerate(templates):
+            meta = plugin.metadata[category][i]
+            keys.append((category, i))
+            texts.append(f"{meta.title} {template}")
+            groups.append(category)
+            priors.append(ENGAGEMENT_RANK.get(meta.engagement_level, 1))
+    return keys, texts, groups, priors
+
+
+def template_store_items(store) -> Tuple[List, List[str], List[str], List[float]]:
+    """(keys, texts, groups, priors) of TemplateStore structures"""
+    keys, texts, groups, priors = [], [], [], []
+    for category_id, templates in store.TEMPLATE_STRUCTURES.items():
+        for template in templates:
+            keys.append(template["id"])
+            texts.append(f"{template['title']} {template['preview']} {template['structure']} "
+                         f"{template.get('hashtags', '')}")
+            groups.append(category_id)
+            priors.append(ENGAGEMENT_RANK.get(template.get("engagement", "Medium"), 1))
+    return keys, texts, groups, priors
+
+
+def _item_features(texts: Sequence[str], groups: Sequence[str], category_weight: float) -> np.ndarray:
+    """L2-normalized TF-IDF word vectors with a weighted category one-hot appended"""
+    documents = [
+        Counter(word for word in WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS)
+        for text in texts
+    ]
+    vocabulary: Dict[str, int] = {}
+    for document in documents:
+        for word in document:
+            vocabulary.setdefault(word, len(vocabulary))
+    group_ids = {group: i for i, group in enumerate(dict.fromkeys(groups))}
+
+    count = len(texts)
+    tf = np.zeros((count, len(vocabulary)), dtype=np.float32)
+    for row, document in enumerate(documents):
+        for word, occurrences in document.items():
+            tf[row, vocabulary[word]] = 1 + math.log(occurrences)
+    document_frequency = np.count_nonzero(tf, axis=0)
+    tf *= np.log((1 + count) / (1 + document_frequency)) + 1
+    norms = np.linalg.norm(tf, axis=1, keepdims=True)
+    tf /= np.where(norms > 0, norms, 1)
+
+    categories = np.zeros((count, len(group_ids)), dtype=np.float32)
+    categories[np.arange(count), [group_ids[group] for group in groups]] = 1
+
+    features = np.hstack([tf * math.sqrt(1 - category_weight), categories * math.sqrt(category_weight)])
+    return features
@@ -0,0 +1,287 @@
+"""
+LinkedIn AI Record and Replay
+AIRecorder wraps a real ai_function and appends each call's prompt key, response (or
+streamed chunks with their arrival offsets), latency and error to a gzipped JSON-lines
+file. ReplayProvider serves a recording back offline as an ai_function (with acall for
+AsyncLinkedInTemplatePlugin). It replays the recorded latency, scaled, or latencies
+drawn from the recorded distribution with a seeded RNG. Throughput, concurrency,
+caching and batching changes can then be measured reproducibly without network access:
+
+    recorder = AIRecorder(ollama_fill, "fills.jsonl.gz")
+    plugin.auto_fill_with_ai(category, index, context, recorder)
+    recorder.close()
+
+    replay = ReplayProvider("fills.jsonl.gz", latency_scale=0.1)
+    plugin.auto_fill_with_ai(category, index, context, replay)
+
+Prompts are keyed by a 64-bit BLAKE2 digest; the prompt text itself is only stored
+with store_prompts=True.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+FORMAT = "linkedin-ai-recording"
+VERSION = 1
+LATENCY_MODES = ("original", "sampled")
+MISS_POLICIES = ("error", "any")
+
+
+class ReplayMissError(KeyError):
+    """The prompt is not in the recording (and on_miss is "error")"""
+
+
+class ReplayedError(RuntimeError):
+    """An error the recorded provider raised, raised again on replay"""
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _provider_name(ai_function: Callable) -> str:
+    return getattr(ai_function, "provider", None) or getattr(ai_function, "__name__", repr(ai_function))
+
+
+class AIRecorder:
+    """ai_function wrapper that records every call to a compact recording file"""
+
+    def __init__(self, ai_function: Callable, path: str, store_prompts: bool = False):
+        self.ai_function = ai_function
+        self.provider = _provider_name(ai_function)
+        self.path = path
+        self.store_prompts = store_prompts
+        self.calls = 0
+        self._lock = threading.Lock()
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        # Appending adds a gzip member; readers see one continuous stream
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        if is_new:
+            self._write({"format": FORMAT, "version": VERSION, "provider": self.provider})
+
+    def _write(self, record: Dict):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            # A sync flush per record: a killed benchmark keeps everything recorded so far
+            self._file.flush()
+
+    def _record(self, prompt: str, latency: float, response: Optional[str] = None,
+                chunks: Optional[List[Tuple[float, str]]] = None, error: Optional[BaseException] = None):
+        record = {"k": prompt_key(prompt), "t": round(latency, 6)}
+        if self.store_prompts:
+            record["p"] = prompt
+        if chunks is not None:
+            record["c"] = [[round(offset, 6), chunk] for offset, chunk in chunks]
+        elif error is None:
+            record["r"] = response
+        if error is not None:
+            record["e"] = f"{type(error).__name__}: {error}"
+        self.calls += 1
+        self._write(record)
+
+    def __call__(self, prompt: str):
+        started = time.perf_counter()
+        try:
+            result = self.ai_function(prompt)
+        except Exception as e:
+            self._record(prompt, time.perf_counter() - started, error=e)
+            raise
+        if isinstance(result, str):
+            self._record(prompt, time.perf_counter() - started, result)
+            return result
+        return self._stream(prompt, result, started)
+
+    def _stream(self, prompt: str, chunks, started: float) -> Iterator[str]:
+        # Only time spent waiting on the provider counts; the consumer's time between chunks does not
+        waited = time.perf_counter() - started
+        received = []
+        chunks = iter(chunks)
+        while True:
+            resumed = time.perf_counter()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                waited += time.perf_counter() - resumed
+                break
+            except Exception as e:
+                self._record(prompt, waited + time.perf_counter() - resumed, chunks=received, error=e)
+                raise
+            waited += time.perf_counter() - resumed
+            received.append((waited, chunk))
+            yield chunk
+        self._record(prompt, waited, chunks=received)
+
+    async def acall(self, prompt: str) -> str:
+        started = time.perf_counter()
+        try:
+            if hasattr(self.ai_function, "acall"):
+                value = await self.ai_function.acall(prompt)
+            elif asyncio.iscoroutinefunction(self.ai_function):
+                value = await self.ai_function(prompt)
+            else:
+                value = await asyncio.to_thread(self.ai_function, prompt)
+            if not isinstance(value, str):
+                value = "".join(value).strip()
+        except Exception as e:
+            self._record(prompt, time.perf_counter() - started, error=e)
+            raise
+        self._record(prompt, time.perf_counter() - started, value)
+        return value
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "AIRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_recording(path: str) -> Tuple[Dict, List[Dict]]:
+    """(header, call records) of a recording file"""
+    lines = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if line.strip():
+                    lines.append(json.loads(line))
+        except (EOFError, ValueError):
+            pass  # recording cut short by a crash: keep the calls flushed before it
+    if not lines or lines[0].get("format") != FORMAT:
+        raise ValueError(f"{path} is not an AI recording")
+    if lines[0]["version"] > VERSION:
+        raise ValueError(f"Unsupported recording version {lines[0]['version']}")
+    # Appended sessions repeat the header; keep only call records
+    return lines[0], [record for record in lines[1:] if "k" in record]
+
+
+class ReplayProvider:
+    """Offline ai_function that serves recorded responses with recorded (or sampled) latency"""
+
+    def __init__(self, recording: Union[str, List[Dict]], latency_scale: float = 1.0, latency: str = "original",
+                 on_miss: str = "error", seed: Optional[int] = 0, sleep: Callable[[float], None] = time.sleep):
+        if latency not in LATENCY_MODES:
+            raise ValueError(f"Unknown latency mode '{latency}'. Available modes: {list(LATENCY_MODES)}")
+        if on_miss not in MISS_POLICIES:
+            raise ValueError(f"Unknown miss policy '{on_miss}'. Available policies: {list(MISS_POLICIES)}")
+        if latency_scale < 0:
+            raise ValueError("latency_scale must be non-negative")
+        if isinstance(recording, str):
+            header, records = load_recording(recording)
+            self.provider = f"replay:{header.get('provider', 'unknown')}"
+        else:
+            records = list(recording)
+            self.provider = "replay"
+        if not records:
+            raise ValueError("Recording has no calls to replay")
+
+        self.latency_scale = latency_scale
+        self.latency = latency
+        self.on_miss = on_miss
+        self._sleep = sleep
+        self._records = records
+        self._by_key: Dict[str, List[Dict]] = {}
+        for record in records:
+            self._by_key.setdefault(record["k"], []).append(record)
+        self._latencies = [record["t"] for record in records]
+        self._served: Dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.misses = 0
+        self.slept_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _next(self, prompt: str) -> Tuple[Dict, float]:
+        """The record to serve and its delay; repeated prompts cycle through their recordings"""
+        key = prompt_key(prompt)
+        with self._lock:
+            self.calls += 1
+            candidates = self._by_key.get(key)
+            if candidates:
+                served = self._served.get(key, 0)
+                self._served[key] = served + 1
+                record = candidates[served % len(candidates)]
+            elif self.on_miss == "any":
+                self.misses += 1
+                record = self._rng.choice(self._records)
+            else:
+                self.misses += 1
+                raise ReplayMissError(f"Prompt {key} is not in the recording")
+            latency = record["t"] if self.latency == "original" else self._rng.choice(self._latencies)
+            delay = latency * self.latency_scale
+            self.slept_seconds += delay
+        return record, delay
+
+    def __call__(self, prompt: str):
+        record, delay = self._next(prompt)
+        if "c" in record:
+            return self._stream(record, delay)
+        self._sleep(delay)
+        return _result(record)
+
+    def _stream(self, record: Dict, delay: float) -> Iterator[str]:
+        # Chunk arrival offsets are stretched to the chosen total latency
+        stretch = delay / record["t"] if record["t"] else 0.0
+        elapsed = 0.0
+        for offset, chunk in record["c"]:
+            self._sleep(max(0.0, offset * stretch - elapsed))
+            elapsed = offset * stretch
+            yield chunk
+        self._sleep(max(0.0, delay - elapsed))
+        if "e" in record:
+            raise ReplayedError(record["e"])
+
+    async def acall(self, prompt: str) -> str:
+        record, delay = self._next(prompt)
+        await asyncio.sleep(delay)
+        if "c" in record and "e" not in record:
+            return "".join(chunk for _, chunk in record["c"]).strip()
+        return _result(record)
+
+    def stats(self) -> Dict:
+        return {
+            "provider": self.provider,
+            "recorded_calls": len(self._records),
+            "calls": self.calls,
+            "misses": self.misses,
+            "slept_seconds": round(self.slept_seconds, 4)
+        }
+
+
+def _result(record: Dict) -> str:
+    if "e" in record:
+        raise ReplayedError(record["e"])
+    return record["r"]
+
+
+def summarize_recording(path: str) -> Dict:
+    """Calls, distinct prompts, errors, latency percentiles and file size of a recording"""
+    header, records = load_recording(path)
+    latencies = sorted(record["t"] for record in records)
+
+    def at(q: float) -> Optional[float]:
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 4) if latencies else None
+
+    return {
+        "provider": header.get("provider"),
+        "calls": len(records),
+        "prompts": len({record["k"] for record in records}),
+        "errors": sum(1 for record in records if "e" in record),
+        "latency_p50": at(0.50),
+        "latency_p95": at(0.95),
+        "latency_max": latencies[-1] if latencies else None,
+        "bytes": os.path.getsize(path)
+    }
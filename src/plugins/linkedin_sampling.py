@@ -0,0 +1,227 @@
+"""
+LinkedIn Template Sampling
+Precomputed alias tables for O(1) weighted template draws, seeded reproducible streams,
+and per-user non-repeating rotations held in compact (counter, bitset) state.
+"""
+
+import hashlib
+import random
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Default weights derived from TemplateMetadata.engagement_level
+ENGAGEMENT_WEIGHTS = {
+    "High": 3.0,
+    "Medium-High": 2.0,
+    "Medium": 1.0,
+    "Low": 0.5
+}
+
+_MASK64 = (1 << 64) - 1
+_TO_UNIT = 1.0 / (1 << 53)
+
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer, used to derive draws from (user seed, counter) without storing RNG state"""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _stable_seed(*parts) -> int:
+    """64-bit seed that is stable across processes (unlike hash())"""
+    digest = hashlib.blake2b(":".join(str(part) for part in parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class AliasTable:
+    """Vose's alias method: O(n) construction, O(1) weighted draws"""
+
+    def __init__(self, weights: Sequence[float]):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("Alias table needs a non-empty list of weights")
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("Weights must be non-negative with a positive total")
+
+        n = len(weights)
+        scaled = weights * (n / weights.sum())
+        prob = np.ones(n, dtype=np.float64)
+        alias = np.arange(n, dtype=np.int64)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        self.size = n
+        self.prob = prob
+        self.alias = alias
+        # Plain lists are much faster than NumPy scalars for single draws
+        self._prob = prob.tolist()
+        self._alias = alias.tolist()
+
+    def draw(self, u1: float, u2: float) -> int:
+        """Draw one index from two uniforms in [0, 1)"""
+        i = int(u1 * self.size)
+        return i if u2 < self._prob[i] else self._alias[i]
+
+    def draw_many(self, count: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw `count` indices in one vectorized pass"""
+        columns = rng.integers(0, self.size, size=count)
+        accept = rng.random(count) < self.prob[columns]
+        return np.where(accept, columns, self.alias[columns])
+
+
+class TemplateSampler:
+    """Weighted template sampling over a LinkedInTemplatePlugin corpus snapshot"""
+
+    def __init__(self, plugin, weights: Union[None, Dict, Callable] = None,
+                 categories: Optional[List[str]] = None, seed: Optional[int] = None):
+        """
+        weights may be None (engagement level weights), a dict keyed by (category, index)
+        or by engagement level, or a callable taking TemplateMetadata and returning a weight.
+        """
+        self.plugin = plugin
+        self.seed = seed
+        self._categories = categories
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
+        self._rotations: Dict[Hashable, Tuple[int, int]] = {}
+        self._build_refs()
+        self.set_weights(weights)
+
+    def _build_refs(self):
+        self._refs: List[Tuple[str, int]] = []
+        self._category_ranges: Dict[str, Tuple[int, int]] = {}
+        for category in self._categories if self._categories else self.plugin.get_categories():
+            start = len(self._refs)
+            self._refs.extend((category, i) for i in range(len(self.plugin.get_templates(category))))
+            self._category_ranges[category] = (start, len(self._refs))
+        self._full_mask = (1 << len(self._refs)) - 1
+
+    def refresh(self, weights: Union[None, Dict, Callable] = None):
+        """Pick up templates added to the plugin; per-user rotations are kept (remapped to the new layout)"""
+        old_ranges = self._category_ranges
+        self._build_refs()
+        for user_id, (counter, seen) in self._rotations.items():
+            remapped = 0
+            for category, (start, end) in old_ranges.items():
+                if category in self._category_ranges:
+                    category_seen = (seen >> start) & ((1 << (end - start)) - 1)
+                    remapped |= category_seen << self._category_ranges[category][0]
+            self._rotations[user_id] = (counter, remapped)
+        self.set_weights(weights)
+
+    def set_weights(self, weights: Union[None, Dict, Callable] = None):
+        """Rebuild the alias tables for new weights; per-user rotations are kept"""
+        self._weights = np.array([self._weight(weights, ref) for ref in self._refs], dtype=np.float64)
+        self._table = AliasTable(self._weights)
+        self._category_tables: Dict[str, AliasTable] = {}
+
+    def _weight(self, weights, ref: Tuple[str, int]) -> float:
+        meta = self.plugin.get_template_metadata(*ref)
+        # Live level from recorded feedback when there is enough of it (see linkedin_feedback)
+        level = self.plugin.get_engagement_level(*ref)
+        if weights is None:
+            return ENGAGEMENT_WEIGHTS.get(level, 1.0)
+        if callable(weights):
+            return float(weights(meta))
+        if ref in weights:
+            return float(weights[ref])
+        return float(weights.get(level, ENGAGEMENT_WEIGHTS.get(level, 1.0)))
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def _result(self, position: int) -> Dict:
+        category, index = self._refs[position]
+        return {
+            'category': category,
+            'index': index,
+            'template': self.plugin.templates[category][index],
+            'metadata': self.plugin.metadata[category][index]
+        }
+
+    def _table_for(self, category: Optional[str]) -> Tuple[AliasTable, int]:
+        if category is None:
+            return self._table, 0
+        if category not in self._category_ranges:
+            raise ValueError(f"Category '{category}' not found")
+        start, end = self._category_ranges[category]
+        if category not in self._category_tables:
+            self._category_tables[category] = AliasTable(self._weights[start:end])
+        return self._category_tables[category], start
+
+    def draw(self, category: Optional[str] = None) -> Dict:
+        """Draw one template (same shape as get_random_template)"""
+        table, offset = self._table_for(category)
+        return self._result(offset + table.draw(self._rng.random(), self._rng.random()))
+
+    def draw_refs(self, count: int, category: Optional[str] = None) -> List[Tuple[str, int]]:
+        """Draw `count` (category, index) refs in one vectorized pass"""
+        table, offset = self._table_for(category)
+        return [self._refs[offset + i] for i in table.draw_many(count, self._np_rng).tolist()]
+
+    def stream(self, seed: int, category: Optional[str] = None) -> Iterator[Dict]:
+        """Infinite reproducible stream of draws, independent of the sampler's own RNG"""
+        table, offset = self._table_for(category)
+        rng = random.Random(seed)
+        while True:
+            yield self._result(offset + table.draw(rng.random(), rng.random()))
+
+    def next_for_user(self, user_id: Hashable, category: Optional[str] = None) -> Dict:
+        """
+        Weighted draw that never repeats a template for a user until the pool
+        (the whole corpus or the category) is exhausted, then starts a new rotation.
+        Deterministic for a given sampler seed, user and draw count.
+        """
+        table, offset = self._table_for(category)
+        pool_mask = ((1 << table.size) - 1) << offset if category else self._full_mask
+
+        counter, seen = self._rotations.get(user_id, (0, 0))
+        if seen & pool_mask == pool_mask:
+            seen &= ~pool_mask
+
+        # Derived per draw (a short hash) rather than kept per user, so memory stays bounded by rotations
+        state = _mix64(_stable_seed(self.seed, user_id) ^ counter)
+        position = -1
+        # Rejection sampling is O(1) expected until the pool is mostly used up
+        for _ in range(32):
+            state = _mix64(state)
+            u1 = (state >> 11) * _TO_UNIT
+            state = _mix64(state)
+            u2 = (state >> 11) * _TO_UNIT
+            candidate = offset + table.draw(u1, u2)
+            if not (seen >> candidate) & 1:
+                position = candidate
+                break
+
+        if position < 0:
+            unseen = [i for i in range(offset, offset + table.size) if not (seen >> i) & 1]
+            cumulative = np.cumsum(self._weights[unseen])
+            state = _mix64(state)
+            target = (state >> 11) * _TO_UNIT * cumulative[-1]
+            position = unseen[min(int(np.searchsorted(cumulative, target, side="right")), len(unseen) - 1)]
+
+        self._rotations[user_id] = (counter + 1, seen | (1 << position))
+        return self._result(position)
+
+    def rotation_state(self, user_id: Hashable) -> Tuple[int, int]:
+        """Compact (draw counter, seen bitset) state for persisting a user's rotation"""
+        return self._rotations.get(user_id, (0, 0))
+
+    def load_rotation_state(self, user_id: Hashable, state: Tuple[int, int]):
+        """Restore a user's rotation saved with rotation_state()"""
+        counter, seen = state
+        self._rotations[user_id] = (int(counter), int(seen) & self._full_mask)
+
+    def reset_rotation(self, user_id: Hashable):
+        """Forget a user's rotation"""
+        self._rotations.pop(user_id, None)
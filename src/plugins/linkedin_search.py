@@ -0,0 +1,171 @@
+"""
+LinkedIn Template Search Paging
+Heap-based top-k selection with opaque cursors, shared by LinkedInTemplatePlugin and
+TemplateStore. Hits are streamed through a bounded heap, so a page costs O(n log k)
+time and O(k) memory however many templates match; the cursor is the sort key of the
+last hit, and the next page resumes strictly after it.
+
+SearchCache memoizes results of popular queries until the corpus version changes.
+Callers get their own copy of the result lists and dicts, so mutating them leaves the
+cache intact.
+"""
+
+import base64
+import heapq
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from operator import itemgetter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Ranking used for the "engagement" sort
+ENGAGEMENT_RANK = {"High": 3, "Medium-High": 2, "Medium": 1, "Low": 0}
+
+SORT_KEYS = ("relevance", "engagement", "length")
+
+
+@dataclass
+class SearchPage:
+    """One page of ranked search results"""
+    results: List[Dict] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    sort: str = "relevance"
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(key: Tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key), separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple:
+    try:
+        return tuple(json.loads(base64.urlsafe_b64decode(cursor.encode("ascii"))))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+
+
+def relevance(search_term: str, text: str, title: str = "") -> int:
+    """Occurrences of the (lowercased) term, with title hits weighted 3x"""
+    return text.lower().count(search_term) + 3 * title.lower().count(search_term)
+
+
+def sort_key(sort: str, score: int, engagement: str, length: int, position: Tuple) -> Tuple:
+    """Ascending sort key; position (corpus order) breaks ties and keeps keys unique"""
+    if sort == "relevance":
+        return (-score, *position)
+    if sort == "engagement":
+        return (-ENGAGEMENT_RANK.get(engagement, 1), -score, *position)
+    if sort == "length":
+        return (length, *position)
+    raise ValueError(f"Unknown sort '{sort}'. Available sorts: {list(SORT_KEYS)}")
+
+
+def top_k_page(hits: Iterable[Tuple[Tuple, Any]], limit: int, cursor: Optional[str] = None,
+               sort: str = "relevance") -> SearchPage:
+    """Select the `limit` smallest-keyed (key, result) hits after the cursor"""
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort '{sort}'. Available sorts: {list(SORT_KEYS)}")
+    after = decode_cursor(cursor) if cursor else None
+    if after is not None:
+        hits = (hit for hit in hits if hit[0] > after)
+
+    best = heapq.nsmallest(limit + 1, hits, key=itemgetter(0))
+    page = best[:limit]
+    next_cursor = encode_cursor(page[-1][0]) if len(best) > limit else None
+    return SearchPage([result for _, result in page], next_cursor, sort)
+
+
+def normalize_query(keyword: str, categories: Optional[Iterable[str]] = None, tags: Optional[Iterable[str]] = None,
+                    sort: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple:
+    """Cache key for a query; case-insensitive like the search itself
+
+    categories keep their order, as it sets the order of unranked results.
+    """
+    return (
+        keyword.lower(),
+        tuple(categories) if categories else None,
+        tuple(sorted({tag.lower() for tag in tags})) if tags else None,
+        sort,
+        limit,
+        cursor
+    )
+
+
+def copy_results(result):
+    """Copy of a cached result (a list of result dicts or a SearchPage) that callers may mutate"""
+    if isinstance(result, SearchPage):
+        return replace(result, results=[dict(item) for item in result.results])
+    if isinstance(result, (list, tuple)):
+        return [dict(item) if isinstance(item, dict) else item for item in result]
+    return result
+
+
+class SearchCache:
+    """Thread-safe LRU of search results, tagged with the corpus version they were computed on
+
+    Every lookup returns a fresh copy (see copy_results), never the cached entry itself.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, version: Hashable, compute):
+        """Return the cached result for key, or compute and cache it; stale versions count as misses"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                    self.invalidations += 1
+                entry = None
+                self.misses += 1
+        if entry is not None:
+            # Cached entries are never mutated, so they can be copied outside the lock
+            return copy_results(entry[1])
+
+        # Computed outside the lock: concurrent misses on one key may both compute, which is harmless
+        result = compute()
+        with self._lock:
+            self._entries[key] = (version, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return copy_results(result)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "maxsize": self.maxsize
+        }
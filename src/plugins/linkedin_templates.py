@@ -5,10 +5,77 @@ Each category contains 10 structured templates with placeholders for easy custom
 """
 
 import json
+import os
+import random
 import re
-from typing import Dict, List, Optional, Union
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass
 
+# Hashtags are the trailing "#Word" tokens in each template string. The pattern starts with
+# the literal '#' so the regex engine can skip ahead; the lookbehind rejects "a#b" and "##b"
+HASHTAG_PATTERN = re.compile(r'#(?<![\w#]#)(\w+)')
+
+def extract_hashtags(text: str) -> List[str]:
+    """Extract hashtags (with the leading '#') in order of appearance, without duplicates"""
+    seen = set()
+    hashtags = []
+    for tag in HASHTAG_PATTERN.findall(text):
+        key = tag.lower()
+        if key not in seen:
+            seen.add(key)
+            hashtags.append(f"#{tag}")
+    return hashtags
+
+def build_fill_prompt(placeholder: str, context: Dict[str, str], template: Optional[str] = None,
+                      provider: Optional[str] = None) -> str:
+    """Build the AI prompt used to generate a value for one placeholder
+    
+    The shared part (instructions, template, topic, context) comes first and the placeholder
+    last, so provider prefix caches are reused across placeholders (see linkedin_prompts).
+    """
+    from linkedin_prompts import DEFAULT_PROFILE, get_prompt_builder
+    return get_prompt_builder(provider or DEFAULT_PROFILE).build(placeholder, context, template)
+
+def render_partial_fill(template: str, values: Dict[str, str], current: Optional[str] = None,
+                        partial: str = "") -> str:
+    """Template with resolved values filled in and, if given, the partial value of the current placeholder"""
+    text = template
+    for name, value in values.items():
+        text = text.replace(f"[insert {name}]", value)
+    if current is not None:
+        text = text.replace(f"[insert {current}]", partial)
+    return text
+
+def iter_fill_template(template: str, placeholders: List[str], ai_function: Callable,
+                       build_prompt: Callable[[str], str]) -> Iterator[Dict]:
+    """Fill a template with AI, yielding the partially filled text as values resolve
+    
+    ai_function may return a string or an iterable of text chunks (streaming providers);
+    chunks are yielded as they arrive. Each event is a dict with 'placeholder', 'chunk',
+    'values' (resolved so far), 'text' (current state) and 'done'.
+    """
+    values: Dict[str, str] = {}
+    
+    for placeholder in dict.fromkeys(placeholders):
+        result = ai_function(build_prompt(placeholder))
+        if isinstance(result, str):
+            values[placeholder] = result
+            yield {"placeholder": placeholder, "chunk": result, "values": dict(values),
+                   "text": render_partial_fill(template, values), "done": False}
+            continue
+        
+        partial = ""
+        for chunk in result:
+            partial += chunk
+            yield {"placeholder": placeholder, "chunk": chunk, "values": dict(values),
+                   "text": render_partial_fill(template, values, placeholder, partial), "done": False}
+        values[placeholder] = partial.strip()
+    
+    yield {"placeholder": None, "chunk": None, "values": dict(values),
+           "text": render_partial_fill(template, values), "done": True}
+
 @dataclass
 class TemplateMetadata:
     """Metadata for each template"""
@@ -20,12 +87,76 @@ class TemplateMetadata:
     estimated_length: str
     engagement_level: str
 
+@dataclass
+class CompactTemplateMetadata:
+    """Slotted TemplateMetadata used in compact mode
+    
+    Strings are interned (so categories, placeholder names and engagement levels are shared
+    across templates), placeholders are a tuple, and description reuses the title object
+    when they are equal.
+    """
+    __slots__ = ("category", "index", "title", "description", "placeholders", "estimated_length", "engagement_level")
+    category: str
+    index: int
+    title: str
+    description: str
+    placeholders: tuple
+    estimated_length: str
+    engagement_level: str
+    
+    @classmethod
+    def from_metadata(cls, meta) -> "CompactTemplateMetadata":
+        intern = sys.intern
+        title = intern(meta.title)
+        return cls(
+            category=intern(meta.category),
+            index=meta.index,
+            title=title,
+            description=title if meta.description == meta.title else intern(meta.description),
+            placeholders=tuple(intern(placeholder) for placeholder in meta.placeholders),
+            estimated_length=intern(meta.estimated_length),
+            engagement_level=intern(meta.engagement_level)
+        )
+
 class LinkedInTemplatePlugin:
     """Main plugin class for LinkedIn templates management"""
     
-    def __init__(self):
-        self.templates = self._initialize_templates()
-        self.metadata = self._initialize_metadata()
+    # Provider lists whose HedgedAIFunction (and its threads) stays cached
+    MAX_HEDGED = 8
+    
+    def __init__(self, templates: Optional[Dict[str, List[str]]] = None,
+                 metadata: Optional[Dict[str, List[TemplateMetadata]]] = None, compact: bool = False):
+        """compact=True interns strings and uses slotted metadata (see linkedin_memory for measurements)"""
+        self.compact = compact
+        self.templates = templates if templates is not None else self._initialize_templates()
+        self.metadata = metadata if metadata is not None else self._initialize_metadata()
+        self._hashtag_index = None
+        self._sampler = None
+        self._search_cache = None
+        self._autocomplete_index = None
+        self._recommender = None
+        self._feedback = None
+        self._sampler_feedback_version = None
+        self._fill_history = None
+        self._hedged = OrderedDict()
+        self.prompt_provider = None  # linkedin_prompts profile used by build_fill_prompt (None: the default)
+        # Bumped whenever templates change; cached search results from older versions are discarded
+        self.corpus_version = 0
+        
+        if compact:
+            self._compact_storage()
+    
+    def _compact_storage(self):
+        """Intern template strings and switch metadata to CompactTemplateMetadata"""
+        intern = sys.intern
+        self.templates = {
+            intern(category): [intern(template) for template in templates]
+            for category, templates in self.templates.items()
+        }
+        self.metadata = {
+            intern(category): [CompactTemplateMetadata.from_metadata(meta) for meta in metas]
+            for category, metas in self.metadata.items()
+        }
     
     def _initialize_templates(self) -> Dict[str, List[str]]:
         """Initialize all 25 categories with 10 templates each"""
@@ -562,21 +693,32 @@ class LinkedInTemplatePlugin:
             })
             
             for i, template in enumerate(templates):
-                # Extract placeholders from template
-                placeholders = re.findall(r'\[insert ([^\]]+)\]', template)
-                
-                metadata[category].append(TemplateMetadata(
-                    category=category,
-                    index=i,
-                    title=info["descriptions"][i] if i < len(info["descriptions"]) else f"Template {i+1}",
-                    description=info["descriptions"][i] if i < len(info["descriptions"]) else f"Template {i+1} for {category}",
-                    placeholders=placeholders,
-                    estimated_length="150-300 chars" if len(template) < 200 else "300-500 chars",
+                metadata[category].append(self._build_metadata(
+                    category,
+                    i,
+                    template,
+                    title=info["descriptions"][i] if i < len(info["descriptions"]) else None,
                     engagement_level=info["engagement_levels"][i] if i < len(info["engagement_levels"]) else "Medium"
                 ))
         
         return metadata
     
+    def _build_metadata(self, category: str, index: int, template: str, title: Optional[str] = None,
+                        engagement_level: str = "Medium") -> TemplateMetadata:
+        """Build metadata for a single template"""
+        # Extract placeholders from template
+        placeholders = re.findall(r'\[insert ([^\]]+)\]', template)
+        
+        return TemplateMetadata(
+            category=category,
+            index=index,
+            title=title if title else f"Template {index+1}",
+            description=title if title else f"Template {index+1} for {category}",
+            placeholders=placeholders,
+            estimated_length="150-300 chars" if len(template) < 200 else "300-500 chars",
+            engagement_level=engagement_level
+        )
+    
     def get_categories(self) -> List[str]:
         """Get all available template categories"""
         return list(self.templates.keys())
@@ -599,8 +741,27 @@ class LinkedInTemplatePlugin:
         
         return self.metadata[category]
     
+    def get_search_cache(self):
+        """Get the (lazily created) LRU cache of search results (see linkedin_search.SearchCache)"""
+        if self._search_cache is None:
+            from linkedin_search import SearchCache
+            self._search_cache = SearchCache()
+        return self._search_cache
+    
+    def search_cache_stats(self) -> Dict:
+        """Hit-rate metrics of the search result cache"""
+        return self.get_search_cache().stats()
+    
     def search_templates(self, keyword: str, categories: Optional[List[str]] = None) -> List[Dict]:
-        """Search templates by keyword across categories"""
+        """Search templates by keyword across categories (results are cached per corpus version)"""
+        from linkedin_search import normalize_query
+        
+        key = ("all", *normalize_query(keyword, categories))
+        return self.get_search_cache().get_or_compute(
+            key, self.corpus_version, lambda: self._scan_templates(keyword, categories)
+        )
+    
+    def _scan_templates(self, keyword: str, categories: Optional[List[str]] = None) -> List[Dict]:
         results = []
         search_categories = categories if categories else self.get_categories()
         
@@ -619,8 +780,44 @@ class LinkedInTemplatePlugin:
         
         return results
     
-    def fill_template(self, category: str, index: int, values_dict: Dict[str, str]) -> str:
-        """Fill a template with provided values"""
+    def search_templates_page(self, keyword: str, categories: Optional[List[str]] = None, limit: int = 20,
+                              cursor: Optional[str] = None, sort: str = "relevance"):
+        """
+        Ranked page of search results (a linkedin_search.SearchPage).
+        
+        sort is "relevance", "engagement" or "length"; pass page.next_cursor to get the next page.
+        Matches are streamed through a heap of size limit + 1, so the full hit list is never built.
+        """
+        from linkedin_search import normalize_query, relevance, sort_key, top_k_page
+        
+        keyword_lower = keyword.lower()
+        search_categories = categories if categories else self.get_categories()
+        order = {category: position for position, category in enumerate(self.get_categories())}
+        
+        def hits():
+            for category in search_categories:
+                if category not in self.templates:
+                    continue
+                for i, template in enumerate(self.templates[category]):
+                    if keyword_lower not in template.lower():
+                        continue
+                    meta = self.metadata[category][i]
+                    score = relevance(keyword_lower, template, meta.title)
+                    engagement = self.get_engagement_level(category, i) if sort == "engagement" else None
+                    key = sort_key(sort, score, engagement, len(template), (order[category], i))
+                    yield key, {'category': category, 'index': i, 'template': template, 'metadata': meta}
+        
+        key = ("page", *normalize_query(keyword, categories, None, sort, limit, cursor))
+        version = self.corpus_version
+        if sort == "engagement" and self._feedback is not None:
+            version = (version, self._feedback.version)
+        return self.get_search_cache().get_or_compute(
+            key, version, lambda: top_k_page(hits(), limit, cursor, sort)
+        )
+    
+    def fill_template(self, category: str, index: int, values_dict: Dict[str, str],
+                      user_id: Optional[str] = None) -> str:
+        """Fill a template with provided values (remembered as suggestions for user_id when given)"""
         if category not in self.templates:
             raise ValueError(f"Category '{category}' not found")
         
@@ -635,6 +832,8 @@ class LinkedInTemplatePlugin:
             placeholder_pattern = f"[insert {placeholder}]"
             filled_template = filled_template.replace(placeholder_pattern, value)
         
+        if user_id is not None:
+            self.get_fill_history().record(user_id, values_dict)
         return filled_template
     
     def get_template_placeholders(self, category: str, index: int) -> List[str]:
@@ -648,22 +847,231 @@ class LinkedInTemplatePlugin:
         template = self.templates[category][index]
         return re.findall(r'\[insert ([^\]]+)\]', template)
     
-    def auto_fill_with_ai(self, category: str, index: int, context: Dict[str, str], ai_function=None) -> str:
-        """Auto-fill template using AI (requires AI function to be provided)"""
+    def get_fill_history(self):
+        """Get the per-user placeholder value history (see linkedin_fill_history)"""
+        if self._fill_history is None:
+            from linkedin_fill_history import FillHistory
+            self._fill_history = FillHistory()
+        return self._fill_history
+    
+    def suggest_placeholder_values(self, user_id: str, placeholder: str, prefix: str = "", k: int = 5) -> List[str]:
+        """Values the user filled into this placeholder before, best first, optionally by typed prefix"""
+        return self.get_fill_history().suggest(user_id, placeholder, prefix, k)
+    
+    def prefill_values(self, user_id: str, category: str, index: int) -> Dict[str, str]:
+        """Best remembered value for each placeholder of a template (for one-click prefill)"""
+        return self.get_fill_history().prefill(user_id, self.get_template_placeholders(category, index))
+    
+    def get_template_hashtags(self, category: str, index: int) -> List[str]:
+        """Get all hashtags for a specific template"""
+        if category not in self.templates:
+            raise ValueError(f"Category '{category}' not found")
+        
+        if index < 0 or index >= len(self.templates[category]):
+            raise ValueError(f"Index {index} out of range for category '{category}'")
+        
+        return extract_hashtags(self.templates[category][index])
+    
+    def get_hashtag_index(self):
+        """Get the hashtag -> templates index (built on first use, requires NumPy)"""
+        if self._hashtag_index is None:
+            from linkedin_hashtags import HashtagIndex
+            self._hashtag_index = HashtagIndex.from_plugin(self)
+        return self._hashtag_index
+    
+    def suggest_hashtags(self, text: str, k: int = 5) -> List[str]:
+        """Suggest hashtags for a (filled) post based on hashtag co-occurrence across templates"""
+        return [tag for tag, _ in self.get_hashtag_index().suggest_for_text(text, k)]
+    
+    def get_autocomplete_index(self):
+        """Get the title/category/hashtag prefix index (built on first use)"""
+        if self._autocomplete_index is None:
+            from linkedin_autocomplete import AutocompleteIndex
+            self._autocomplete_index = AutocompleteIndex.from_plugin(self)
+        return self._autocomplete_index
+    
+    def autocomplete(self, prefix: str, k: int = 8) -> List[str]:
+        """Top-k search completions for a partially typed term"""
+        return [completion.text for completion in self.get_autocomplete_index().complete(prefix, k)]
+    
+    def get_recommender(self):
+        """Get the per-user template recommender (built on first use, requires NumPy)"""
+        if self._recommender is None:
+            from linkedin_recommend import TemplateRecommender
+            self._recommender = TemplateRecommender.from_plugin(self)
+        return self._recommender
+    
+    def record_template_selection(self, user_id: str, category: str, index: int, weight: float = 1.0):
+        """Record that a user picked a template (feeds recommend_templates)"""
+        self.get_recommender().record_selection(user_id, (category, index), weight)
+    
+    def recommend_templates(self, user_id: str, k: int = 10, categories: Optional[List[str]] = None) -> List[Dict]:
+        """Personalized top-k templates for a user, best first"""
+        recommendations = self.get_recommender().recommend(user_id, k, groups=categories)
+        return [
+            {
+                'category': category,
+                'index': index,
+                'template': self.templates[category][index],
+                'metadata': self.metadata[category][index],
+                'score': score
+            }
+            for (category, index), score in recommendations
+        ]
+    
+    def attach_feedback(self, feedback):
+        """Drive engagement levels from recorded outcomes (a linkedin_feedback.FeedbackStore keyed by (category, index))"""
+        self._feedback = feedback
+        self._sampler_feedback_version = None
+    
+    def get_feedback(self):
+        """Get the engagement feedback store (in-memory unless one was attached)"""
+        if self._feedback is None:
+            from linkedin_feedback import FeedbackStore
+            self._feedback = FeedbackStore()
+        return self._feedback
+    
+    def record_engagement(self, category: str, index: int, impressions: int = 0, reactions: int = 0,
+                          comments: int = 0):
+        """Record the outcome of a published post made from a template"""
+        self.get_template_metadata(category, index)
+        self.get_feedback().record_post((category, index), impressions, reactions, comments)
+    
+    def get_engagement_level(self, category: str, index: int) -> str:
+        """Live engagement level from feedback, or the static metadata level until enough impressions exist"""
+        static = self.metadata[category][index].engagement_level
+        if self._feedback is None:
+            return static
+        return self._feedback.engagement_level((category, index), default=static)
+    
+    def filter_by_engagement(self, min_level: str = "High", categories: Optional[List[str]] = None) -> List[Dict]:
+        """Templates whose live engagement level is at least min_level"""
+        from linkedin_search import ENGAGEMENT_RANK
+        
+        if min_level not in ENGAGEMENT_RANK:
+            raise ValueError(f"Unknown engagement level '{min_level}'. Available levels: {list(ENGAGEMENT_RANK)}")
+        threshold = ENGAGEMENT_RANK[min_level]
+        results = []
+        for category in categories if categories else self.get_categories():
+            if category not in self.templates:
+                continue
+            for i, template in enumerate(self.templates[category]):
+                if ENGAGEMENT_RANK.get(self.get_engagement_level(category, i), 1) >= threshold:
+                    results.append({
+                        'category': category,
+                        'index': i,
+                        'template': template,
+                        'metadata': self.metadata[category][i]
+                    })
+        return results
+    
+    def add_template(self, category: str, template: str, title: Optional[str] = None,
+                     engagement_level: str = "Medium") -> TemplateMetadata:
+        """Add a template to a (new or existing) category and update the indexes"""
+        templates = self.templates.setdefault(category, [])
+        category_metadata = self.metadata.setdefault(category, [])
+        
+        meta = self._build_metadata(category, len(templates), template, title, engagement_level)
+        if self.compact:
+            meta = CompactTemplateMetadata.from_metadata(meta)
+            template = sys.intern(template)
+        templates.append(template)
+        category_metadata.append(meta)
+        
+        if self._hashtag_index is not None:
+            self._hashtag_index.add_template((category, meta.index), extract_hashtags(template))
+        if self._autocomplete_index is not None:
+            self._autocomplete_index.add(category, "category", len(templates))
+            self._autocomplete_index.add_template(meta.title, meta.engagement_level, extract_hashtags(template))
+        if self._recommender is not None:
+            from linkedin_recommend import plugin_items
+            self._recommender.set_items(*plugin_items(self))
+        # Sampling tables are a snapshot of the corpus; rebuilt in place so user rotations survive
+        if self._sampler is not None:
+            self._sampler.refresh()
+            self._sampler_feedback_version = self._feedback.version if self._feedback is not None else None
+        self.corpus_version += 1
+        
+        return meta
+    
+    def build_fill_prompt(self, placeholder: str, context: Dict[str, str], template: Optional[str] = None) -> str:
+        """Build the AI prompt used to generate a value for one placeholder (shared prefix first)"""
+        return build_fill_prompt(placeholder, context, template, self.prompt_provider)
+    
+    def prompt_cache_stats(self) -> Dict:
+        """Estimated (or provider-reported) share of prompt tokens served from prefix caches"""
+        from linkedin_prompts import DEFAULT_PROFILE, get_prompt_builder
+        return get_prompt_builder(self.prompt_provider or DEFAULT_PROFILE).stats()
+    
+    def get_hedged_ai_function(self, providers):
+        """Get the HedgedAIFunction for a ranked provider list (or name -> function dict)
+        
+        Cached on the plugin per provider list, so its hedging threads are reused across fills;
+        the least recently used ones are closed once more than MAX_HEDGED provider lists are in use.
+        """
+        from linkedin_hedging import HedgedAIFunction, rank_providers
+        
+        ranked = rank_providers(providers)
+        # The cached wrapper references the functions, so their ids stay valid while it is cached
+        key = tuple((name, id(ai_function)) for name, ai_function in ranked)
+        hedged = self._hedged.get(key)
+        if hedged is None:
+            hedged = self._hedged[key] = HedgedAIFunction(ranked)
+            if len(self._hedged) > self.MAX_HEDGED:
+                self._hedged.popitem(last=False)[1].close()
+        else:
+            self._hedged.move_to_end(key)
+        return hedged
+    
+    def auto_fill_with_ai(self, category: str, index: int, context: Dict[str, str], ai_function=None,
+                          rate_limiter=None) -> str:
+        """Auto-fill template using AI (requires AI function to be provided)
+        
+        ai_function may also be a ranked list (or name -> function dict) of providers; calls are then
+        hedged across them (see linkedin_hedging). Pass a ProviderRateLimiter (see linkedin_ratelimit)
+        to wait on the provider's shared budgets.
+        """
         if ai_function is None:
             raise ValueError("AI function must be provided for auto-fill functionality")
         
+        if isinstance(ai_function, (list, tuple, dict)):
+            ai_function = self.get_hedged_ai_function(ai_function)
+        
+        if rate_limiter is not None:
+            ai_function = rate_limiter.wrap(ai_function)
+        
         template = self.templates[category][index]
         placeholders = self.get_template_placeholders(category, index)
         
         # Use AI to generate values for placeholders
         ai_values = {}
         for placeholder in placeholders:
-            prompt = f"Generate a {placeholder} for a LinkedIn post about {context.get('topic', 'professional development')}. Context: {context.get('context', 'business professional sharing insights')}. Keep it concise and engaging."
-            ai_values[placeholder] = ai_function(prompt)
+            value = ai_function(self.build_fill_prompt(placeholder, context, template))
+            # Streaming providers return an iterable of chunks
+            ai_values[placeholder] = value if isinstance(value, str) else "".join(value).strip()
         
         return self.fill_template(category, index, ai_values)
     
+    def iter_auto_fill_with_ai(self, category: str, index: int, context: Dict[str, str], ai_function=None,
+                               rate_limiter=None) -> Iterator[Dict]:
+        """Streaming variant of auto_fill_with_ai: yields partially filled states (see iter_fill_template)"""
+        if ai_function is None:
+            raise ValueError("AI function must be provided for auto-fill functionality")
+        
+        if isinstance(ai_function, (list, tuple, dict)):
+            ai_function = self.get_hedged_ai_function(ai_function)
+        
+        if rate_limiter is not None:
+            ai_function = rate_limiter.wrap(ai_function)
+        
+        template = self.templates[category][index]
+        return iter_fill_template(
+            template,
+            self.get_template_placeholders(category, index),
+            ai_function,
+            lambda placeholder: self.build_fill_prompt(placeholder, context, template)
+        )
+    
     def export_to_json(self, filename: str = None) -> str:
         """Export templates to JSON format"""
         export_data = {
@@ -696,10 +1104,19 @@ class LinkedInTemplatePlugin:
         
         return json_str
     
-    def get_random_template(self, category: str = None) -> Dict:
-        """Get a random template from specified category or all categories"""
-        import random
+    def export_shards(self, directory: str, prune: bool = True) -> Dict:
+        """Export one content-hashed JSON file per category plus a manifest (see linkedin_export)
         
+        Clients compare manifest hashes and fetch only the categories that changed.
+        """
+        from linkedin_export import export_shards
+        return export_shards(self, directory, prune)
+    
+    def get_random_template(self, category: str = None, weighted: bool = False) -> Dict:
+        """Get a random template from specified category or all categories
+        
+        With weighted=True the draw uses the precomputed engagement-weighted alias table.
+        """
         if category:
             if category not in self.templates:
                 raise ValueError(f"Category '{category}' not found")
@@ -707,6 +1124,9 @@ class LinkedInTemplatePlugin:
         else:
             categories = list(self.templates.keys())
         
+        if weighted:
+            return self.get_sampler().draw(category)
+        
         selected_category = random.choice(categories)
         index = random.randint(0, len(self.templates[selected_category]) - 1)
         
@@ -716,6 +1136,24 @@ class LinkedInTemplatePlugin:
             'template': self.templates[selected_category][index],
             'metadata': self.metadata[selected_category][index]
         }
+    
+    def get_sampler(self, weights=None, seed: Optional[int] = None):
+        """Get a TemplateSampler (alias tables, seeded streams, per-user rotations)
+        
+        The default engagement-weighted, unseeded sampler is cached on the plugin; with
+        feedback attached its weights follow live engagement levels.
+        """
+        from linkedin_sampling import TemplateSampler
+        
+        if weights is not None or seed is not None:
+            return TemplateSampler(self, weights=weights, seed=seed)
+        feedback_version = self._feedback.version if self._feedback is not None else None
+        if self._sampler is None:
+            self._sampler = TemplateSampler(self)
+        elif feedback_version != self._sampler_feedback_version:
+            self._sampler.set_weights()
+        self._sampler_feedback_version = feedback_version
+        return self._sampler
 
 # Convenience function for quick access
 def create_linkedin_plugin():
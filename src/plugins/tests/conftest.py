@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Plugin modules import each other flat, as when run from src/plugins
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from linkedin_cli import main
+from linkedin_templates import LinkedInTemplatePlugin
+
+
+@pytest.fixture(scope="module")
+def template():
+    plugin = LinkedInTemplatePlugin()
+    category = plugin.get_categories()[0]
+    placeholders = plugin.get_template_placeholders(category, 0)
+    return category, {placeholder: "filled" for placeholder in placeholders}
+
+
+def batch_fill(tmp_path, lines, *options):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    output = tmp_path / "filled.jsonl"
+    status = main(["-o", str(output), "batch-fill", str(jobs), *options])
+    return status, [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("options", [(), ("--check",)])
+def test_batch_fill_passes_extra_keys_through(tmp_path, template, options):
+    category, values = template
+    job = {"category": category, "index": 0, "values": values, "post_id": "p1"}
+    status, records = batch_fill(tmp_path, [json.dumps(job), ""], *options)
+    assert status == 0
+    (record,) = records
+    assert record["post_id"] == "p1"
+    assert "[insert " not in record["text"]
+    assert ("quality" in record) == bool(options)
+    if options:
+        assert record["quality"]["leftover"] == 0
+
+
+@pytest.mark.parametrize("options", [(), ("--check",)])
+def test_bad_lines_are_reported_and_the_rest_still_filled(tmp_path, template, options, capsys):
+    category, values = template
+    good = json.dumps({"category": category, "index": 0, "values": values})
+    lines = [
+        "not json",
+        json.dumps({"category": category, "index": 0, "values": None}),
+        json.dumps({"category": category, "index": 0, "values": ["a"]}),
+        json.dumps([category, 0]),
+        json.dumps({"category": "No such category", "index": 0}),
+        json.dumps({"index": 0}),
+        good
+    ]
+    status, records = batch_fill(tmp_path, lines, *options)
+    assert status == 1
+    assert [record.get("line") for record in records] == [1, 2, 3, 4, 5, 6, None]
+    assert all("error" in record for record in records[:-1])
+    assert "[insert " not in records[-1]["text"]
+    assert "6 line(s) failed" in capsys.readouterr().err
+
+
+def test_unfilled_placeholders_are_flagged_by_check(tmp_path, template):
+    category, _ = template
+    status, (record,) = batch_fill(tmp_path, [json.dumps({"category": category, "index": 0})], "--check")
+    assert status == 0
+    assert record["quality"]["leftover"] > 0
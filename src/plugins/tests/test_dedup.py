@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from linkedin_dedup import NearDuplicateIndex
+
+DAY = 86400.0
+POST = "Three lessons I learned leading a remote team through our biggest product launch this year"
+OTHER = "Why every junior developer should write a weekly summary of what they shipped and learned"
+
+
+@pytest.fixture
+def index():
+    index = NearDuplicateIndex(num_perm=64, bands=16, seed=7)
+    index.add("launch", POST, timestamp=10 * DAY)
+    index.add(42, OTHER, timestamp=12 * DAY)
+    return index
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    path = str(tmp_path / "index.npz")
+    index.save(path)
+    loaded = NearDuplicateIndex.load(path)
+
+    assert len(loaded) == len(index)
+    assert (loaded.num_perm, loaded.bands, loaded.threshold, loaded.seed) == (64, 16, index.threshold, 7)
+    assert np.array_equal(loaded.signature(POST), index.signature(POST))
+    now = 13 * DAY
+    assert loaded.find_similar(POST, now=now) == index.find_similar(POST, now=now) == [("launch", 1.0)]
+    assert loaded.find_similar(OTHER, now=now) == [(42, 1.0)]
+
+
+def test_loaded_index_keeps_daily_segments(index, tmp_path):
+    path = str(tmp_path / "index.npz")
+    index.save(path)
+    loaded = NearDuplicateIndex.load(path)
+    assert loaded.expire(older_than_days=2, now=13 * DAY) == 1
+    assert loaded.find_similar(POST, now=13 * DAY) == []
+
+
+def test_rejects_ids_that_do_not_round_trip(index):
+    for post_id in (("Leadership", 0), 1.5, True, None):
+        with pytest.raises(ValueError):
+            index.add(post_id, POST, timestamp=10 * DAY)
+    assert len(index) == 2
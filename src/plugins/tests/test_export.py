@@ -0,0 +1,27 @@
+import os
+
+from linkedin_export import export_shards
+from linkedin_templates import LinkedInTemplatePlugin
+
+
+def test_replaced_shards_survive_one_export(tmp_path):
+    directory = str(tmp_path)
+    plugin = LinkedInTemplatePlugin()
+    category = plugin.get_categories()[0]
+
+    first = export_shards(plugin, directory)
+    old_file = first["shards"][category]["file"]
+
+    plugin.add_template(category, "A first new [TOPIC] post")
+    second = export_shards(plugin, directory)
+    assert second["retained"] == [old_file]
+    assert os.path.exists(os.path.join(directory, old_file))
+
+    # Re-exporting unchanged content keeps the grace period going
+    assert export_shards(plugin, directory)["retained"] == [old_file]
+    assert os.path.exists(os.path.join(directory, old_file))
+
+    plugin.add_template(category, "A second new [TOPIC] post")
+    third = export_shards(plugin, directory)
+    assert third["retained"] == [second["shards"][category]["file"]]
+    assert not os.path.exists(os.path.join(directory, old_file))
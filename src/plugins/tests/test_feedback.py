@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from linkedin_feedback import LOG_NAME, SNAPSHOT_NAME, FeedbackStore
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / "feedback")
+
+
+def impressions(directory, key=("Leadership", 0)):
+    store = FeedbackStore(directory)
+    try:
+        return store.stats(key).impressions
+    finally:
+        store.close()
+
+
+def test_events_survive_reopen(directory):
+    store = FeedbackStore(directory)
+    store.record_post(("Leadership", 0), impressions=100, reactions=4, comments=1, timestamp=1.0)
+    store.close()
+    reopened = FeedbackStore(directory)
+    stats = reopened.stats(("Leadership", 0))
+    assert (stats.impressions, stats.reactions, stats.comments) == (100, 4, 1)
+    reopened.close()
+
+
+@pytest.mark.parametrize("torn", ['[2, ["Leadership", 0], "impr', '[2, ["Leadership", 0], "impression", 3, 2.0]'])
+def test_torn_last_line_is_dropped_and_later_events_kept(directory, torn):
+    store = FeedbackStore(directory)
+    store.record(("Leadership", 0), "impression", 5, timestamp=1.0)
+    store.close()
+    # A crash mid-write leaves a partial (or unterminated) last line
+    with open(os.path.join(directory, LOG_NAME), "a", encoding="utf-8") as f:
+        f.write(torn)
+
+    store = FeedbackStore(directory)
+    assert store.stats(("Leadership", 0)).impressions == 5
+    store.record(("Leadership", 0), "impression", 7, timestamp=2.0)
+    store.record(("Leadership", 0), "impression", 11, timestamp=3.0)
+    store.close()
+
+    assert impressions(directory) == 23
+    with open(os.path.join(directory, LOG_NAME), encoding="utf-8") as f:
+        assert all(line.endswith("\n") for line in f)
+
+
+def test_compact_folds_log_into_snapshot(directory):
+    store = FeedbackStore(directory)
+    store.record(("Leadership", 0), "impression", 5, timestamp=1.0)
+    store.compact()
+    store.record(("Leadership", 0), "impression", 7, timestamp=2.0)
+    store.close()
+    assert os.path.exists(os.path.join(directory, SNAPSHOT_NAME))
+    with open(os.path.join(directory, LOG_NAME), encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+    assert impressions(directory) == 12
+
+
+def test_log_events_already_in_snapshot_are_not_counted_twice(directory):
+    store = FeedbackStore(directory)
+    store.record(("Leadership", 0), "impression", 5, timestamp=1.0)
+    log_path = os.path.join(directory, LOG_NAME)
+    with open(log_path, encoding="utf-8") as f:
+        log = f.read()
+    store.compact()
+    store.close()
+    # Crash between writing the snapshot and truncating the log
+    with open(log_path, "w", encoding="utf-8") as f:
+        f.write(log)
+    assert impressions(directory) == 5
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from linkedin_hedging import HedgedAIFunction, LatencyTracker, lognormal_latency, stub_provider
+
+
+def fixed(seconds):
+    return lognormal_latency(seconds, sigma=0.0)
+
+
+@pytest.fixture
+def tracker():
+    return LatencyTracker()
+
+
+def test_hedge_wins_against_a_slow_primary(tracker):
+    slow = stub_provider("slow", fixed(1.0), seed=1)
+    fast = stub_provider("fast", fixed(0.01), seed=2)
+    with HedgedAIFunction([slow, fast], hedge_delay=0.05, tracker=tracker) as hedged:
+        assert hedged("prompt") == "stub value (fast)"
+        stats = hedged.stats()
+    assert stats["fast"]["wins"] == 1 and stats["fast"]["hedges"] == 1
+    assert stats.get("slow", {}).get("wins", 0) == 0
+
+
+def test_fast_primary_is_not_hedged(tracker):
+    primary = stub_provider("primary", fixed(0.01), seed=1)
+    backup = stub_provider("backup", fixed(0.01), seed=2)
+    with HedgedAIFunction([primary, backup], hedge_delay=0.5, tracker=tracker) as hedged:
+        assert hedged("prompt") == "stub value (primary)"
+    assert "backup" not in tracker.stats()
+
+
+def test_failed_provider_falls_back_immediately(tracker):
+    broken = stub_provider("broken", fixed(0.01), failure_rate=1.0, seed=1)
+    backup = stub_provider("backup", fixed(0.01), seed=2)
+    with HedgedAIFunction({"broken": broken, "backup": backup}, hedge_delay=5.0, tracker=tracker) as hedged:
+        assert hedged("prompt") == "stub value (backup)"
+    assert tracker.stats()["broken"]["errors"] == 1
+
+
+def test_all_providers_failing_raises(tracker):
+    providers = [stub_provider(name, fixed(0.0), failure_rate=1.0, seed=n) for n, name in enumerate("ab")]
+    with HedgedAIFunction(providers, tracker=tracker) as hedged:
+        with pytest.raises(RuntimeError, match="All providers failed"):
+            hedged("prompt")
+
+
+def test_streamed_answers_are_joined(tracker):
+    def streaming(prompt):
+        return iter(["streamed ", "answer"])
+
+    with HedgedAIFunction([streaming], tracker=tracker) as hedged:
+        assert hedged("prompt") == "streamed answer"
+
+
+def test_acall_hedges_and_cancels_the_loser(tracker):
+    cancelled = []
+
+    async def slow(prompt):
+        try:
+            await asyncio.sleep(1.0)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "slow"
+
+    async def fast(prompt):
+        await asyncio.sleep(0.01)
+        return "fast"
+
+    async def run():
+        value = await HedgedAIFunction([slow, fast], hedge_delay=0.05, tracker=tracker).acall("prompt")
+        await asyncio.sleep(0)
+        return value
+
+    assert asyncio.run(run()) == "fast"
+    assert cancelled == [True]
+
+
+def test_acall_falls_back_from_a_sync_failure(tracker):
+    broken = stub_provider("broken", fixed(0.0), failure_rate=1.0, seed=1)
+    backup = stub_provider("backup", fixed(0.0), seed=2)
+    hedged = HedgedAIFunction([broken, backup], hedge_delay=5.0, tracker=tracker)
+    assert asyncio.run(hedged.acall("prompt")) == "stub value (backup)"
@@ -0,0 +1,110 @@
+import time
+
+import pytest
+
+from linkedin_jobs import FillJobQueue, process_job
+from linkedin_templates import LinkedInTemplatePlugin
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = FillJobQueue(str(tmp_path / "jobs.db"), base_backoff=0.0, max_backoff=0.0)
+    yield queue
+    queue.close()
+
+
+def test_enqueue_is_idempotent(queue):
+    assert queue.enqueue("a", "Leadership", 0, {"topic": "hiring"}, batch="b1")
+    assert not queue.enqueue("a", "Leadership", 1, {}, batch="b1")
+    assert queue.enqueue_many([("a", "Leadership", 0, {}), ("b", "Leadership", 1, {})], batch="b1") == 1
+    assert queue.stats("b1")["pending"] == 2
+
+
+def test_uses_wal_journal(queue):
+    assert queue._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_claim_leases_a_job_once(queue):
+    queue.enqueue("a", "Leadership", 0, {"topic": "hiring"})
+    job = queue.claim("w1")
+    assert (job.job_key, job.attempts, job.context) == ("a", 1, {"topic": "hiring"})
+    assert queue.claim("w2") is None
+    assert queue.stats()["running"] == 1
+
+
+def test_lost_lease_rejects_checkpoint_and_complete(tmp_path):
+    queue = FillJobQueue(str(tmp_path / "jobs.db"), lease_seconds=0.0)
+    queue.enqueue("a", "Leadership", 0, {})
+    first = queue.claim("w1")
+    time.sleep(0.01)
+    second = queue.claim("w2")
+    assert second.job_key == "a" and second.attempts == 2
+    assert not queue.checkpoint(first)
+    assert not queue.complete(first, "stale")
+    assert queue.complete(second, "filled")
+    assert list(queue.results()) == [("a", "filled")]
+    queue.close()
+
+
+def test_fail_retries_then_gives_up(queue):
+    queue.max_attempts = 2
+    queue.enqueue("a", "Leadership", 0, {})
+    assert queue.fail(queue.claim("w"), "boom")
+    assert queue.stats()["pending"] == 1
+    assert queue.fail(queue.claim("w"), "boom")
+    assert queue.stats()["failed"] == 1
+    assert queue.claim("w") is None
+    assert queue.retry_failed() == 1
+    assert queue.claim("w").attempts == 1
+
+
+def test_expired_lease_on_last_attempt_fails_the_job(tmp_path):
+    queue = FillJobQueue(str(tmp_path / "jobs.db"), lease_seconds=0.0, max_attempts=2)
+    queue.enqueue("a", "Leadership", 0, {})
+    queue.enqueue("b", "Leadership", 1, {})
+    claimed = []
+    for _ in range(6):
+        time.sleep(0.01)
+        job = queue.claim("w")
+        claimed.append(job and (job.job_key, job.attempts))
+    assert claimed == [("a", 1), ("a", 2), ("b", 1), ("b", 2), None, None]
+    assert queue.stats()["failed"] == 2
+    queue.close()
+
+
+def test_transaction_rolls_back_on_error(queue):
+    queue.enqueue("a", "Leadership", 0, {})
+    with pytest.raises(KeyError):
+        with queue._transaction():
+            queue._conn.execute("UPDATE fill_jobs SET status = 'done'")
+            raise KeyError("a")
+    assert queue.stats()["pending"] == 1
+
+
+def test_process_job_resumes_from_checkpoint(queue):
+    plugin = LinkedInTemplatePlugin()
+    placeholders = list(dict.fromkeys(plugin.get_template_placeholders("Leadership", 0)))
+    queue.enqueue("a", "Leadership", 0, {})
+    job = queue.claim("w")
+    job.progress[placeholders[0]] = "from checkpoint"
+    assert queue.checkpoint(job)
+    queue.fail(job, "worker crashed")
+
+    prompts = []
+
+    def ai_function(prompt):
+        prompts.append(prompt)
+        return "generated"
+
+    assert process_job(queue, plugin, queue.claim("w"), ai_function)
+    assert len(prompts) == len(placeholders) - 1
+    (_, result), = queue.results()
+    assert "from checkpoint" in result and "[insert " not in result
+
+
+def test_process_job_joins_streamed_values(queue):
+    plugin = LinkedInTemplatePlugin()
+    queue.enqueue("a", "Leadership", 0, {})
+    assert process_job(queue, plugin, queue.claim("w"), lambda prompt: iter(["streamed ", "value"]))
+    (_, result), = queue.results()
+    assert "streamed value" in result and "[insert " not in result
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from linkedin_cli import main
+from linkedin_replay import (AIRecorder, ReplayedError, ReplayMissError, ReplayProvider, load_recording,
+                             prompt_key, summarize_recording)
+from linkedin_templates import LinkedInTemplatePlugin
+
+
+def provider(prompt):
+    if "fail" in prompt:
+        raise TimeoutError("provider timed out")
+    return f"value for {prompt[-12:]}"
+
+
+def streaming(prompt):
+    return iter(["first ", "second"])
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = str(tmp_path / "calls.jsonl.gz")
+    with AIRecorder(provider, path) as recorder:
+        recorder("alpha")
+        recorder("beta")
+        with pytest.raises(TimeoutError):
+            recorder("please fail")
+    return path
+
+
+def test_recording_keys_prompts_without_storing_them(recording):
+    header, records = load_recording(recording)
+    assert header["provider"] == "provider"
+    assert [record["k"] for record in records] == [prompt_key(p) for p in ("alpha", "beta", "please fail")]
+    assert all("p" not in record for record in records)
+    assert summarize_recording(recording)["errors"] == 1
+
+
+def test_replay_serves_responses_and_errors(recording):
+    slept = []
+    replay = ReplayProvider(recording, latency_scale=0.5, sleep=slept.append)
+    assert replay("alpha") == provider("alpha")
+    assert replay("beta") == provider("beta")
+    with pytest.raises(ReplayedError, match="TimeoutError"):
+        replay("please fail")
+    with pytest.raises(ReplayMissError):
+        replay("gamma")
+    _, records = load_recording(recording)
+    assert slept == [record["t"] * 0.5 for record in records]
+    assert replay.stats()["misses"] == 1
+
+
+def test_replay_on_miss_any_is_seeded(recording):
+    def served(seed):
+        replay = ReplayProvider(recording, on_miss="any", seed=seed, latency_scale=0.0)
+        answers = []
+        for _ in range(5):
+            try:
+                answers.append(replay("gamma"))
+            except ReplayedError as e:
+                answers.append(str(e))
+        return answers
+
+    assert served(3) == served(3)
+
+
+def test_streamed_calls_replay_chunk_by_chunk(tmp_path):
+    path = str(tmp_path / "stream.jsonl.gz")
+    with AIRecorder(streaming, path) as recorder:
+        assert list(recorder("alpha")) == ["first ", "second"]
+    replay = ReplayProvider(path, latency_scale=0.0)
+    assert list(replay("alpha")) == ["first ", "second"]
+    assert asyncio.run(replay.acall("alpha")) == "first second"
+
+
+def test_appended_sessions_keep_one_stream(recording):
+    with AIRecorder(provider, recording) as recorder:
+        recorder("gamma")
+    _, records = load_recording(recording)
+    assert len(records) == 4
+
+
+def test_replayed_fill_matches_recorded_fill(tmp_path):
+    plugin = LinkedInTemplatePlugin()
+    path = str(tmp_path / "fills.jsonl.gz")
+    context = {"topic": "hiring"}
+    with AIRecorder(provider, path) as recorder:
+        recorded = plugin.auto_fill_with_ai("Leadership", 0, context, recorder)
+    replayed = plugin.auto_fill_with_ai("Leadership", 0, context, ReplayProvider(path, latency_scale=0.0))
+    assert replayed == recorded
+
+
+def test_replay_bench_command(tmp_path):
+    plugin = LinkedInTemplatePlugin()
+    path = str(tmp_path / "fills.jsonl.gz")
+    category = plugin.get_categories()[0]
+    with AIRecorder(provider, path) as recorder:
+        plugin.auto_fill_with_ai(category, 0, {}, recorder)
+    output = tmp_path / "bench.json"
+
+    status = main(["-o", str(output), "replay-bench", path, "--fills", "1", "--latency-scale", "0"])
+    report = json.loads(output.read_text())
+    assert status == 0
+    assert (report["fills"], report["failed"], report["replay"]["misses"]) == (1, 0, 0)
+
+
+def test_records_survive_a_recorder_that_is_never_closed(tmp_path):
+    path = str(tmp_path / "killed.jsonl.gz")
+    recorder = AIRecorder(provider, path)
+    recorder("alpha")
+    recorder("beta")
+    # No close(): as if the benchmark process was killed
+    _, records = load_recording(path)
+    assert [record["r"] for record in records] == [provider("alpha"), provider("beta")]
+    recorder.close()
+
+
+def test_stream_latency_excludes_consumer_time(tmp_path):
+    path = str(tmp_path / "stream.jsonl.gz")
+    with AIRecorder(streaming, path) as recorder:
+        for _ in recorder("alpha"):
+            time.sleep(0.05)
+    (record,) = load_recording(path)[1]
+    assert record["t"] < 0.05